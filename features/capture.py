@@ -67,13 +67,21 @@ class ScreenCapture:
             logger.error(f"mss 인스턴스 생성 실패: {e}", exc_info=True)
             raise ScreenCaptureError(f"mss 인스턴스 생성 실패: {e}")
 
-    def capture(self) -> np.ndarray:
+    def capture(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         선택된 모니터의 화면을 캡처합니다.
 
         mss 라이브러리를 사용하여 전체 화면(작업표시줄 포함)을 캡처하고,
         BGR 형식을 RGB 형식으로 변환하여 반환합니다.
 
+        반환값은 항상 mss 버퍼와 분리된 연속(C-contiguous) RGB 배열이므로,
+        호출자는 반환값을 다음 캡처의 out 버퍼로 사용할 수 있습니다.
+        out 버퍼를 넘기면 새 배열을 만들지 않고 RGB 결과를 버퍼에 바로 기록하며,
+        버퍼 크기가 캡처 크기와 다르면(모니터 변경 등) 새 연속 배열을 만들어 반환합니다.
+
+        Args:
+            out: 결과를 기록할 (height, width, 3) uint8 버퍼 (선택사항)
+
         Returns:
             np.ndarray: RGB 형식의 캡처 이미지 (height, width, 3)
 
@@ -88,6 +96,7 @@ class ScreenCapture:
             (1080, 1920, 3)
             >>> print(image.dtype)
             uint8
+            >>> image = capturer.capture(out=image)  # 같은 버퍼 재사용
         """
         try:
             # 모니터 정보 조회 (중복 코드 제거)
@@ -96,14 +105,19 @@ class ScreenCapture:
             # 화면 캡처
             screenshot = self._sct.grab(monitor)
 
-            # numpy array로 변환 (BGRA 형식)
-            image = np.array(screenshot)
+            # numpy array로 변환 (BGRA 형식, mss 버퍼를 복사 없이 참조)
+            image = np.frombuffer(screenshot.raw, dtype=np.uint8)
+            image = image.reshape(screenshot.height, screenshot.width, 4)
+
+            # BGRA -> RGB 변환 (Alpha 채널 제거 + 채널 순서 반전, 복사 없는 view)
+            image_rgb = image[:, :, 2::-1]
 
-            # BGRA -> RGB 변환 (Alpha 채널 제거)
-            image_rgb = image[:, :, :3]  # BGR 채널만 추출
-            image_rgb = image_rgb[:, :, ::-1]  # BGR -> RGB 변환
+            if out is None or out.shape != image_rgb.shape or out.dtype != np.uint8:
+                # 버퍼가 없거나 크기가 다르면 새 연속 배열 생성 (다음 캡처부터 재사용)
+                return np.ascontiguousarray(image_rgb)
 
-            return image_rgb
+            np.copyto(out, image_rgb)
+            return out
 
         except InvalidMonitorError:
             # _get_monitor()에서 이미 로깅 및 예외 발생
@@ -155,6 +169,27 @@ class ScreenCapture:
             logger.error(f"모니터 정보 조회 실패: {e}", exc_info=True)
             raise ScreenCaptureError(f"모니터 정보 조회 실패: {e}")
 
+    def close(self) -> None:
+        """
+        mss 인스턴스를 해제합니다.
+
+        mss는 Windows 장치 컨텍스트를 스레드별로 보관하므로,
+        인스턴스를 생성하고 사용한 스레드에서 호출해야 합니다.
+        여러 번 호출해도 안전합니다.
+
+        Example:
+            >>> capturer = ScreenCapture(monitor_id=1)
+            >>> capturer.close()
+        """
+        if self._sct is None:
+            return
+        try:
+            self._sct.close()
+        except Exception as e:
+            logger.warning(f"mss 인스턴스 해제 실패: {e}")
+        finally:
+            self._sct = None
+
     def _get_monitor(self) -> dict:
         """
         현재 모니터 정보를 반환합니다 (Private).
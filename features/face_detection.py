@@ -178,7 +178,7 @@ class FaceDetector:
             )
 
         try:
-            logger.info(f"얼굴 감지 시작: 이미지 크기 {image.shape}")
+            logger.info("얼굴 감지 시작: 이미지 크기 %s", image.shape)
 
             # 얼굴 감지 수행
             faces = self.model.get(image)
@@ -186,11 +186,12 @@ class FaceDetector:
             # 필터링된 유효 얼굴 리스트
             valid_faces = []
 
+            # 얼굴마다 실행되는 로그는 %-포맷으로 넘겨 해당 레벨이 꺼져 있으면 문자열을 만들지 않음
             for face in faces:
                 try:
                     # Filter 1: Detection score (가림 감지)
                     if face.det_score < min_det_score:
-                        logger.debug(f"얼굴 제외: 낮은 신뢰도 {face.det_score:.2f}")
+                        logger.debug("얼굴 제외: 낮은 신뢰도 %.2f", face.det_score)
                         continue
 
                     # 특징점 존재 여부 검증
@@ -199,7 +200,7 @@ class FaceDetector:
                         continue
 
                     if len(face.kps) < 5:
-                        logger.warning(f"얼굴 특징점 불완전 ({len(face.kps)}/5), 건너뜀")
+                        logger.warning("얼굴 특징점 불완전 (%d/5), 건너뜀", len(face.kps))
                         continue
 
                     # bbox 추출
@@ -235,16 +236,16 @@ class FaceDetector:
 
                     # 모든 필터 통과
                     valid_faces.append(face)
-                    logger.debug(f"유효 얼굴: score={face.det_score:.2f}, 모든 특징점 확인")
+                    logger.debug("유효 얼굴: score=%.2f, 모든 특징점 확인", face.det_score)
 
                 except Exception as e:
-                    logger.warning(f"얼굴 처리 오류: {e}, 건너뜀")
+                    logger.warning("얼굴 처리 오류: %s, 건너뜀", e)
                     continue
 
             face_count = len(valid_faces)
             logger.info(
-                f"얼굴 감지 완료: {face_count}명 유효 "
-                f"(필터링 {len(faces) - face_count}명)"
+                "얼굴 감지 완료: %d명 유효 (필터링 %d명)",
+                face_count, len(faces) - face_count
             )
             return face_count
 
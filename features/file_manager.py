@@ -75,26 +75,34 @@ class FileManager:
             >>> fm.ensure_folder_exists()
             # C:/IBM 비대면/251104/ 폴더 생성
         """
-        try:
-            folder_path = self.base_path / self.current_date
-            folder_path.mkdir(parents=True, exist_ok=True)
-            logger.info(f"폴더 확인/생성 완료: {folder_path}")
+        self._create_date_folder(self.base_path)
 
-        except PermissionError as e:
-            logger.error(f"폴더 생성 권한 없음: {folder_path}", exc_info=True)
-            raise FilePermissionError(f"폴더를 생성할 권한이 없습니다: {folder_path}")
+    def reconfigure(self, base_path: str) -> None:
+        """
+        기본 저장 경로를 변경합니다.
 
-        except OSError as e:
-            # 디스크 공간 부족 확인 (errno 28 = ENOSPC)
-            if e.errno == 28 or "No space left" in str(e):
-                logger.error(f"디스크 공간 부족: {folder_path}", exc_info=True)
-                raise InsufficientStorageError(f"디스크 공간이 부족합니다: {folder_path}")
-            logger.error(f"폴더 생성 실패: {e}", exc_info=True)
-            raise FileSaveError(f"폴더 생성 중 오류 발생: {e}")
+        새 경로에 날짜별 폴더를 먼저 생성해 보고, 성공한 경우에만 base_path를 바꿉니다.
+        실패하면 기존 경로가 그대로 유지됩니다.
 
-        except Exception as e:
-            logger.error(f"폴더 생성 실패: {e}", exc_info=True)
-            raise FileSaveError(f"폴더 생성 중 오류 발생: {e}")
+        Args:
+            base_path: 새 기본 저장 경로
+
+        Raises:
+            FilePermissionError: 폴더 생성 권한이 없을 때
+            InsufficientStorageError: 디스크 공간이 부족할 때
+            FileSaveError: 기타 폴더 생성 오류 시
+
+        Example:
+            >>> fm = FileManager("C:/IBM 비대면")
+            >>> fm.reconfigure("D:/출결관리")
+            >>> fm.base_path
+            Path("D:/출결관리")
+        """
+        new_path = Path(base_path)
+        self._create_date_folder(new_path)
+        self.base_path = new_path
+
+        logger.info(f"FileManager 저장 경로 변경: base_path={self.base_path}")
 
     def get_file_path(self, period: int, is_within_window: bool) -> Path:
         """
@@ -223,6 +231,39 @@ class FileManager:
             logger.error(f"예상치 못한 오류 발생: {e}", exc_info=True)
             raise FileSaveError(f"이미지 저장 중 예상치 못한 오류: {e}")
 
+    def _create_date_folder(self, base_path: Path) -> None:
+        """
+        base_path 아래에 날짜별 폴더를 생성합니다 (Private).
+
+        Args:
+            base_path: 기본 저장 경로
+
+        Raises:
+            FilePermissionError: 폴더 생성 권한이 없을 때
+            InsufficientStorageError: 디스크 공간이 부족할 때
+            FileSaveError: 기타 폴더 생성 오류 시
+        """
+        folder_path = base_path / self.current_date
+        try:
+            folder_path.mkdir(parents=True, exist_ok=True)
+            logger.info(f"폴더 확인/생성 완료: {folder_path}")
+
+        except PermissionError as e:
+            logger.error(f"폴더 생성 권한 없음: {folder_path}", exc_info=True)
+            raise FilePermissionError(f"폴더를 생성할 권한이 없습니다: {folder_path}")
+
+        except OSError as e:
+            # 디스크 공간 부족 확인 (errno 28 = ENOSPC)
+            if e.errno == 28 or "No space left" in str(e):
+                logger.error(f"디스크 공간 부족: {folder_path}", exc_info=True)
+                raise InsufficientStorageError(f"디스크 공간이 부족합니다: {folder_path}")
+            logger.error(f"폴더 생성 실패: {e}", exc_info=True)
+            raise FileSaveError(f"폴더 생성 중 오류 발생: {e}")
+
+        except Exception as e:
+            logger.error(f"폴더 생성 실패: {e}", exc_info=True)
+            raise FileSaveError(f"폴더 생성 중 오류 발생: {e}")
+
     def _validate_image(self, image: np.ndarray) -> None:
         """
         이미지 유효성을 검사합니다.
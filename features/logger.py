@@ -9,7 +9,7 @@ import csv
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional, Sequence
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -52,6 +52,24 @@ class CSVLogger:
 
         logger.info(f"CSVLogger 초기화: base_path={self.base_path}")
 
+    def reconfigure(self, base_path: str) -> None:
+        """
+        기본 저장 경로를 변경합니다.
+
+        새 인스턴스를 만들지 않고 경로만 바꾸며,
+        다음 기록 시 새 경로의 날짜별 폴더에 로그 파일을 생성합니다.
+
+        Args:
+            base_path: 새 기본 저장 경로
+
+        Example:
+            >>> logger.reconfigure("D:/출결관리")
+        """
+        self.base_path = Path(base_path)
+        self.log_path = None
+
+        logger.info(f"CSVLogger 저장 경로 변경: base_path={self.base_path}")
+
     def _ensure_log_file(self) -> None:
         """
         로그 파일이 없으면 헤더와 함께 생성합니다.
@@ -96,7 +114,8 @@ class CSVLogger:
         detected_count: int,
         threshold_count: int,
         filename: str = "",
-        note: str = ""
+        note: str = "",
+        timestamp: Optional[datetime] = None
     ) -> None:
         """
         이벤트를 로그에 기록합니다.
@@ -108,6 +127,7 @@ class CSVLogger:
             threshold_count: 기준 인원
             filename: 저장된 파일명 (선택사항)
             note: 비고 (선택사항)
+            timestamp: 이벤트 발생 시각 (기본값: 현재 시각)
 
         Example:
             >>> logger.log_event("1교시", "캡처 성공", 20, 22, "251020_1교시.png", "유연 모드")
@@ -116,32 +136,84 @@ class CSVLogger:
         Raises:
             OSError: 로그 기록 실패 시
         """
-        # 로그 파일이 없으면 생성
-        self._ensure_log_file()
+        row = self._build_row(
+            period, status, detected_count, threshold_count, filename, note, timestamp
+        )
+        self._write_rows([row], f"{period} - {status}")
 
-        # 현재 날짜 및 시간
-        now = datetime.now()
-        date_str = now.strftime("%Y-%m-%d")
-        time_str = now.strftime("%H:%M:%S")
-
-        # CSV 행 데이터
-        row = [
-            date_str,           # 날짜
-            time_str,           # 시간
-            period,             # 항목
-            status,             # 상태
-            detected_count,     # 감지인원
-            threshold_count,    # 기준인원
-            filename,           # 파일명
-            note                # 비고
+    def log_events(self, events: Iterable[Sequence]) -> None:
+        """
+        여러 이벤트를 한 번의 파일 열기로 기록합니다.
+
+        각 이벤트는 log_event()의 인자 순서를 따르는 튜플입니다.
+        (period, status, detected_count, threshold_count[, filename[, note[, timestamp]]])
+
+        Args:
+            events: 기록할 이벤트 목록
+
+        Example:
+            >>> logger.log_events([
+            ...     ("1교시", "캡처 시작", 0, 22),
+            ...     ("1교시", "캡처 성공", 20, 22, "251020_1교시.png"),
+            ... ])
+
+        Raises:
+            OSError: 로그 기록 실패 시
+        """
+        rows = [self._build_row(*event) for event in events]
+        if not rows:
+            return
+
+        self._write_rows(rows, f"{len(rows)}건")
+
+    @staticmethod
+    def _build_row(
+        period: str,
+        status: str,
+        detected_count: int,
+        threshold_count: int,
+        filename: str = "",
+        note: str = "",
+        timestamp: Optional[datetime] = None
+    ) -> List:
+        """
+        이벤트 하나를 CSV 행 데이터로 변환합니다.
+
+        Returns:
+            List: [날짜, 시간, 항목, 상태, 감지인원, 기준인원, 파일명, 비고]
+        """
+        now = timestamp or datetime.now()
+
+        return [
+            now.strftime("%Y-%m-%d"),   # 날짜
+            now.strftime("%H:%M:%S"),   # 시간
+            period,                     # 항목
+            status,                     # 상태
+            detected_count,             # 감지인원
+            threshold_count,            # 기준인원
+            filename,                   # 파일명
+            note                        # 비고
         ]
 
-        # CSV 파일에 기록
+    def _write_rows(self, rows: List[List], description: str) -> None:
+        """
+        CSV 행들을 로그 파일에 추가합니다.
+
+        Args:
+            rows: 기록할 CSV 행 목록
+            description: 디버그 로그용 설명
+
+        Raises:
+            OSError: 로그 기록 실패 시 (PermissionError 제외)
+        """
+        # 로그 파일이 없으면 생성
+        self._ensure_log_file()
+
         try:
             with open(self.log_path, 'a', encoding='utf-8-sig', newline='') as f:
                 writer = csv.writer(f)
-                writer.writerow(row)
-            logger.debug(f"로그 기록 완료: {period} - {status}")
+                writer.writerows(rows)
+            logger.debug(f"로그 기록 완료: {description}")
         except PermissionError as e:
             logger.warning(f"CSV 파일이 다른 프로그램에서 사용 중입니다: {self.log_path}")
             logger.warning("Excel 등으로 CSV 파일을 열어둔 경우 로그 기록이 실패할 수 있습니다.")
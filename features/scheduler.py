@@ -6,7 +6,7 @@
 
 import logging
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 # 내부 모듈
 from features.exceptions import SchedulerError, InvalidScheduleError
@@ -73,38 +73,7 @@ class CaptureScheduler:
             >>> scheduler.add_schedule(1, "09:30", "09:45", capture_func)
         """
         try:
-            # 시간 형식 검증
-            start_hour, start_min = map(int, start_time.split(":"))
-            end_hour, end_min = map(int, end_time.split(":"))
-
-            # 시간 범위 검증
-            if not (0 <= start_hour < 24 and 0 <= start_min < 60):
-                raise InvalidScheduleError(
-                    f"잘못된 시작 시간: {start_time}"
-                )
-            if not (0 <= end_hour < 24 and 0 <= end_min < 60):
-                raise InvalidScheduleError(
-                    f"잘못된 종료 시간: {end_time}"
-                )
-
-            # 시작 시간 < 종료 시간 검증
-            start_minutes = start_hour * 60 + start_min
-            end_minutes = end_hour * 60 + end_min
-            if start_minutes >= end_minutes:
-                raise InvalidScheduleError(
-                    f"시작 시간이 종료 시간보다 늦습니다: "
-                    f"{start_time} >= {end_time}"
-                )
-
-            # 스케줄 추가
-            schedule = {
-                "period": period,
-                "start_time": start_time,
-                "end_time": end_time,
-                "callback": callback,
-                "is_skipped": False,
-                "is_completed": False,
-            }
+            schedule = self._build_schedule(period, start_time, end_time, callback)
             self.schedules.append(schedule)
 
             logger.info(
@@ -116,6 +85,88 @@ class CaptureScheduler:
             logger.error(f"스케줄 추가 실패: {e}")
             raise
 
+    def add_schedules(
+        self,
+        specs: Iterable[Tuple[int, str, str, Callable]]
+    ) -> None:
+        """
+        여러 스케줄을 한 번에 추가합니다.
+
+        모든 스케줄을 먼저 검증한 뒤 한꺼번에 등록하므로,
+        하나라도 잘못되면 아무 스케줄도 추가되지 않습니다.
+
+        Args:
+            specs: (period, start_time, end_time, callback) 튜플 목록
+
+        Raises:
+            InvalidScheduleError: 시간 범위를 벗어나거나 start_time >= end_time인 경우
+            ValueError: 시간 형식을 해석할 수 없는 경우
+
+        Example:
+            >>> scheduler.add_schedules([
+            ...     (1, "09:30", "09:45", capture_func),
+            ...     (2, "10:30", "10:45", capture_func),
+            ... ])
+        """
+        try:
+            new_schedules = [self._build_schedule(*spec) for spec in specs]
+        except (ValueError, InvalidScheduleError) as e:
+            logger.error(f"스케줄 일괄 추가 실패: {e}")
+            raise
+
+        self.schedules.extend(new_schedules)
+
+        logger.info(f"스케줄 일괄 추가 완료: {len(new_schedules)}개")
+
+    @staticmethod
+    def _build_schedule(
+        period: int,
+        start_time: str,
+        end_time: str,
+        callback: Callable
+    ) -> Dict[str, Any]:
+        """
+        시간 형식을 검증하고 스케줄 딕셔너리를 생성합니다.
+
+        Returns:
+            Dict[str, Any]: 스케줄 정보
+
+        Raises:
+            InvalidScheduleError: 시간 범위를 벗어나거나 start_time >= end_time인 경우
+            ValueError: 시간 형식을 해석할 수 없는 경우
+        """
+        # 시간 형식 검증
+        start_hour, start_min = map(int, start_time.split(":"))
+        end_hour, end_min = map(int, end_time.split(":"))
+
+        # 시간 범위 검증
+        if not (0 <= start_hour < 24 and 0 <= start_min < 60):
+            raise InvalidScheduleError(
+                f"잘못된 시작 시간: {start_time}"
+            )
+        if not (0 <= end_hour < 24 and 0 <= end_min < 60):
+            raise InvalidScheduleError(
+                f"잘못된 종료 시간: {end_time}"
+            )
+
+        # 시작 시간 < 종료 시간 검증
+        start_minutes = start_hour * 60 + start_min
+        end_minutes = end_hour * 60 + end_min
+        if start_minutes >= end_minutes:
+            raise InvalidScheduleError(
+                f"시작 시간이 종료 시간보다 늦습니다: "
+                f"{start_time} >= {end_time}"
+            )
+
+        return {
+            "period": period,
+            "start_time": start_time,
+            "end_time": end_time,
+            "callback": callback,
+            "is_skipped": False,
+            "is_completed": False,
+        }
+
     def is_in_capture_window(self, period: int) -> bool:
         """
         현재 시간이 캡처 시간대인지 확인합니다.
@@ -6,15 +6,18 @@
 
 # 표준 라이브러리
 import logging
-import platform
+import queue
+import threading
+import time
 import tkinter as tk
+import tkinter.font as tkfont
 from pathlib import Path
-from tkinter import ttk, filedialog, messagebox
-from typing import Optional, Dict, List
+from tkinter import ttk
+from typing import Callable, Optional, Dict, List
 
 # 내부 모듈
-from utils.monitor import get_monitor_names, get_monitor_count
-from utils.config import Config
+from utils.monitor import get_monitor_names, get_monitor_count, get_screen_size
+from utils.config import Config, DEFAULT_CONFIG
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -35,13 +38,62 @@ class InitDialog:
         config (Config): 설정 관리 인스턴스
         result (Optional[Config]): 사용자 입력 결과 (Config 인스턴스)
 
+    다이얼로그 윈도우와 위젯은 생성 시 한 번만 만들고, 닫을 때는 숨기기만 하여
+    show()를 다시 호출하면 그대로 재사용합니다. 더 이상 사용하지 않을 때는
+    close()로 윈도우를 파괴해야 합니다.
+
     Example:
         >>> dialog = InitDialog()
         >>> config_manager = dialog.show()
         >>> if config_manager:
         ...     print(config_manager.get('monitor_id'))
+        >>> dialog.close()
     """
 
+    # 인스턴스 속성 고정 (__dict__ 생성 생략, 속성 접근 비용 절감)
+    __slots__ = (
+        "dialog",
+        "result",
+        "_closed",
+        "_on_done",
+        "config",
+        "saved_config",
+        "monitor_var",
+        "monitor_names",
+        "_monitor_id_map",
+        "monitor_info_label",
+        "monitor_combo",
+        "_monitor_queue",
+        "save_path_var",
+        "mode_var",
+        "student_count_var",
+        "threshold_label",
+        "_fonts",
+    )
+
+    # 윈도우 크기 (1920x1080 해상도 대응, 고정 크기)
+    WINDOW_W = 600
+    WINDOW_H = 800
+
+    # 입력 기본값 (저장된 설정이 없을 때 사용, Config 기본값과 동일)
+    _DEFAULT_MONITOR_ID = DEFAULT_CONFIG["monitor_id"]
+    _DEFAULT_SAVE_PATH = DEFAULT_CONFIG["save_path"]
+    _DEFAULT_MODE = DEFAULT_CONFIG["mode"]
+    _DEFAULT_STUDENT_COUNT = DEFAULT_CONFIG["student_count"]
+
+    # 학생 수 입력 범위
+    _MIN_COUNT = 1
+    _MAX_COUNT = 100
+
+    # on_ok()에서 저장하는 설정 키 (순서 고정)
+    _RESULT_KEYS = ("monitor_id", "save_path", "mode", "student_count")
+
+    # 기준 인원 레이블 문구 (학생 수 1~100명 → 인덱스 0~99)
+    _THRESHOLD_TEXTS = tuple(
+        f"기준 인원: {count + 1}명 (학생 수 + 교사 1명)"
+        for count in range(_MIN_COUNT, _MAX_COUNT + 1)
+    )
+
     # ==================== Public Methods ====================
 
     def __init__(self) -> None:
@@ -50,25 +102,41 @@ class InitDialog:
         """
         self.dialog: Optional[tk.Tk] = None
         self.result: Optional[Dict] = None
+        self._closed: bool = False
+        self._on_done: Optional[Callable[[Optional[Config]], None]] = None
 
         # Config 인스턴스 생성 및 설정 로드
         self.config = Config()
         self.saved_config = self.config.load()
-        logger.info(f"저장된 설정 로드: {self.saved_config}")
+        logger.info("저장된 설정 로드: %s", self.saved_config)
 
         # UI 변수
         self.monitor_var: Optional[tk.StringVar] = None
         self.monitor_names: List[str] = []
+        self._monitor_id_map: Dict[str, int] = {}
+        self.monitor_info_label: Optional[ttk.Label] = None
+        self.monitor_combo: Optional[ttk.Combobox] = None
         self.save_path_var: Optional[tk.StringVar] = None
         self.mode_var: Optional[tk.StringVar] = None
         self.student_count_var: Optional[tk.IntVar] = None
+        self.threshold_label: Optional[ttk.Label] = None
+
+        # 명명된 폰트 (Font 객체가 GC되면 Tcl 폰트도 삭제되므로 참조 유지)
+        self._fonts: Dict[str, tkfont.Font] = {}
+
+        # 모니터 조회 결과 전달용 큐 (작업 스레드 → UI 스레드)
+        self._monitor_queue: "queue.Queue[tuple]" = queue.Queue()
+
+        # 다이얼로그 생성 (숨긴 상태, show() 호출 시 표시)
+        self._build_dialog()
 
     def show(self) -> Optional[Config]:
         """
         다이얼로그를 표시하고 사용자 입력을 받습니다.
 
         독립 윈도우로 표시되며, 사용자가 확인 또는 취소를
-        선택할 때까지 대기합니다.
+        선택할 때까지 대기합니다. 다시 호출하면 이미 만들어 둔 윈도우를
+        저장된 설정값으로 채워 재사용합니다.
 
         Returns:
             Optional[Config]: Config 인스턴스.
@@ -80,21 +148,101 @@ class InitDialog:
             >>> if config_manager:
             ...     print(f"선택된 모니터: {config_manager.get('monitor_id')}")
         """
-        # 독립 윈도우 생성
+        # 입력값 초기화 후 다이얼로그 표시
+        self._open_dialog()
+
+        # 이벤트 처리 루프 (윈도우가 닫힐 때까지 대기)
+        # mainloop() 대신 update()를 직접 돌려 반복 사이에 Python 시그널(Ctrl+C)이 처리되도록 함
+        while not self._closed:
+            try:
+                self.dialog.update()
+            except tk.TclError:
+                # 윈도우가 이미 파괴됨 (close() 등)
+                break
+            time.sleep(0.01)  # busy-wait 방지 (10ms)
+
+        return self.result
+
+    def show_async(self, on_done: Callable[[Optional[Config]], None]) -> None:
+        """
+        다이얼로그를 표시하고 즉시 반환합니다 (비차단).
+
+        확인 또는 취소로 다이얼로그가 닫히면 on_done(result)가 호출됩니다.
+        show()와 달리 이벤트 루프를 직접 돌리지 않으므로,
+        호출자가 이미 실행 중인 Tk 이벤트 루프에서 사용합니다.
+
+        Args:
+            on_done: 다이얼로그 종료 시 호출할 콜백.
+                     Config 인스턴스(취소 시 None)를 인자로 받습니다.
+
+        Example:
+            >>> dialog = InitDialog()
+            >>> def on_done(config_manager):
+            ...     print(config_manager)
+            ...     dialog.dialog.quit()  # 확인/취소는 창을 숨기기만 하므로 직접 루프 종료
+            >>> dialog.show_async(on_done)
+            >>> dialog.dialog.mainloop()
+            >>> dialog.close()
+        """
+        self._on_done = on_done
+        self._open_dialog()
+
+    def close(self) -> None:
+        """
+        다이얼로그 윈도우를 파괴합니다.
+
+        on_ok()/on_cancel()은 윈도우를 숨기기만 하므로,
+        다이얼로그를 더 이상 사용하지 않을 때 호출합니다.
+        """
+        if self.dialog is not None:
+            self.dialog.destroy()
+            self.dialog = None
+
+    def _build_dialog(self) -> None:
+        """
+        다이얼로그 윈도우를 생성하고 UI를 구성합니다 (Private).
+
+        __init__()에서 한 번만 호출되며, 윈도우는 숨긴 상태로 남습니다.
+        """
+        # 독립 윈도우 생성 (show() 호출 전까지 숨김 → 레이아웃/그리기 1회)
         self.dialog = tk.Tk()
+        self.dialog.withdraw()
         self.dialog.title("초기 설정")
         self.dialog.resizable(True, True)  # 창 이동 및 크기 조절 가능
 
+        # X 버튼은 취소와 동일하게 처리 (윈도우를 파괴하지 않고 숨김)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.on_cancel)
+
         # UI 구성
         self._setup_ui()
 
         # 윈도우 크기와 중앙 위치 설정
         self._center_window()
 
-        # 메인 루프 시작 (윈도우가 닫힐 때까지 대기)
-        self.dialog.mainloop()
+    def _open_dialog(self) -> None:
+        """
+        결과와 입력값을 초기화하고 숨겨 둔 다이얼로그를 표시합니다 (Private).
 
-        return self.result
+        show()와 show_async()에서 공통으로 사용합니다.
+        """
+        self.result = None
+        self._closed = False
+        self._reset_variables()
+        self.dialog.deiconify()
+
+    def _close_dialog(self) -> None:
+        """
+        다이얼로그를 숨기고 대기 중인 호출자에게 결과를 알립니다 (Private).
+
+        on_ok()와 on_cancel()에서 공통으로 사용합니다.
+        """
+        self._closed = True
+        self.dialog.withdraw()
+
+        # show_async()로 표시한 경우 완료 콜백 호출 (1회만)
+        if self._on_done is not None:
+            on_done, self._on_done = self._on_done, None
+            on_done(self.result)
 
     # ==================== UI Setup ====================
 
@@ -109,10 +257,16 @@ class InitDialog:
         4. 출석 학생 수 입력
         5. 확인/취소 버튼
         """
+        # ttk 스타일 등록
+        self._ensure_styles()
+
         # 메인 프레임 (패딩 추가)
         main_frame = ttk.Frame(self.dialog, padding="20 20 20 20")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
+        # 섹션은 grid로 한 열에 쌓음 (섹션 내부 위젯은 pack 유지)
+        main_frame.columnconfigure(0, weight=1)
+
         # 1. 모니터 선택 영역
         self._create_monitor_section(main_frame)
 
@@ -129,39 +283,57 @@ class InitDialog:
         self._create_button_section(main_frame)
 
     def _center_window(self) -> None:
-        """다이얼로그를 화면 중앙에 배치합니다."""
-        # 윈도우 크기 (1920x1080 해상도 대응)
-        window_width = 600
-        window_height = 800
+        """
+        다이얼로그를 화면 중앙에 배치합니다.
 
-        # HiDPI/Retina 디스플레이 처리
-        if platform.system() == "Windows":
-            try:
-                import ctypes
-                # 실제 물리적 화면 크기 가져오기
-                user32 = ctypes.windll.user32
-                screen_width = user32.GetSystemMetrics(0)
-                screen_height = user32.GetSystemMetrics(1)
-            except Exception as e:
-                logger.warning(f"실제 화면 크기 가져오기 실패, 기본값 사용: {e}")
-                self.dialog.update_idletasks()
-                screen_width = self.dialog.winfo_screenwidth()
-                screen_height = self.dialog.winfo_screenheight()
-        else:
-            # macOS, Linux는 winfo 사용
-            self.dialog.update_idletasks()
-            screen_width = self.dialog.winfo_screenwidth()
-            screen_height = self.dialog.winfo_screenheight()
+        윈도우 크기는 고정값(WINDOW_W x WINDOW_H)을 사용하므로
+        update_idletasks()로 레이아웃을 계산할 필요가 없습니다.
+        """
+        # 최초 조회 후 캐시 (MainWindow와 같은 기준)
+        screen_width, screen_height = get_screen_size(self.dialog)
 
         # 중앙 좌표 계산
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
+        x = (screen_width - self.WINDOW_W) // 2
+        y = (screen_height - self.WINDOW_H) // 2
 
         # 크기와 위치를 함께 설정
-        self.dialog.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        self.dialog.geometry(f"{self.WINDOW_W}x{self.WINDOW_H}+{x}+{y}")
 
     # ==================== Helper Methods ====================
 
+    def _ensure_styles(self) -> None:
+        """
+        다이얼로그에서 사용하는 폰트와 ttk 스타일을 한 번에 등록합니다 (Private).
+
+        위젯마다 font 튜플을 넘기는 대신 명명된 폰트를 한 번만 생성하고
+        이름으로 참조합니다.
+
+        - SectionTitleFont: 섹션 제목 (12pt, bold)
+        - BodyFont: 일반 입력/레이블 (11pt)
+        - HelpFont: 안내 텍스트 (10pt)
+        - ButtonFont: 시작/취소 버튼 (11pt, bold)
+        - ThresholdFont: 기준 인원 표시 (11pt)
+        """
+        font_specs = {
+            "SectionTitleFont": {"size": 12, "weight": "bold"},
+            "BodyFont": {"size": 11},
+            "HelpFont": {"size": 10},
+            "ButtonFont": {"size": 11, "weight": "bold"},
+            "ThresholdFont": {"size": 11},
+        }
+        existing_fonts = tkfont.names(self.dialog)
+        for name, options in font_specs.items():
+            if name not in existing_fonts:
+                self._fonts[name] = tkfont.Font(root=self.dialog, name=name, **options)
+
+        style = ttk.Style(self.dialog)
+        # padding: (left, top, right, bottom) - 위 패딩을 줄여서 텍스트를 중앙으로
+        style.configure("Large.TButton", font="ButtonFont", padding=(10, 6, 10, 6))
+        style.configure("Large.TRadiobutton", font="BodyFont")
+        # 레이블 공통 스타일 (위젯마다 font/foreground를 따로 지정하지 않음)
+        style.configure("Help.TLabel", font="HelpFont", foreground="gray")
+        style.configure("Threshold.TLabel", font="ThresholdFont", foreground="blue")
+
     def _create_section_frame(
         self,
         parent: ttk.Frame,
@@ -176,7 +348,7 @@ class InitDialog:
         모든 섹션에서 일관된 LabelFrame 스타일을 적용합니다.
 
         Args:
-            parent: 부모 프레임
+            parent: 부모 프레임 (섹션을 grid의 다음 행에 배치)
             title: 섹션 제목
             padding: 프레임 패딩 (기본값: "30 30 30 30")
             pady: 프레임 세로 여백 (기본값: (0, 50))
@@ -195,14 +367,43 @@ class InitDialog:
         )
 
         # LabelFrame 제목 폰트 설정 (12pt, bold)
-        label_widget = ttk.Label(parent, text=title, font=("", 12, "bold"))
+        label_widget = ttk.Label(parent, text=title, font="SectionTitleFont")
         section_frame.configure(labelwidget=label_widget)
 
-        # 프레임 배치
-        section_frame.pack(fill=tk.X, pady=pady)
+        # 프레임 배치 (부모 grid의 다음 행)
+        section_frame.grid(row=parent.grid_size()[1], column=0, sticky="ew", pady=pady)
 
         return section_frame
 
+    def _reset_variables(self) -> None:
+        """
+        입력 변수를 저장된 설정값(또는 기본값)으로 다시 채웁니다 (Private).
+
+        다이얼로그를 재사용할 때 이전 표시에서 수정하다 만 값을 지웁니다.
+        """
+        if self.monitor_var is not None and self.monitor_names:
+            self.monitor_var.set(self._get_default_monitor_name())
+        self.save_path_var.set(self.saved_config.get('save_path', self._DEFAULT_SAVE_PATH))
+        self.mode_var.set(self.saved_config.get('mode', self._DEFAULT_MODE))
+        self.student_count_var.set(
+            self.saved_config.get('student_count', self._DEFAULT_STUDENT_COUNT)
+        )
+        self._update_threshold_label()
+
+    def _show_error(self, title: str, message: str) -> None:
+        """
+        오류 메시지 박스를 표시합니다 (Private).
+
+        messagebox 모듈은 오류를 표시할 때 처음 로드하여
+        다이얼로그 모듈의 import 시간을 줄입니다.
+
+        Args:
+            title: 메시지 박스 제목
+            message: 오류 메시지
+        """
+        from tkinter import messagebox
+        messagebox.showerror(title, message)
+
     # ==================== Monitor Section ====================
 
     def _create_monitor_section(self, parent: ttk.Frame) -> None:
@@ -215,78 +416,134 @@ class InitDialog:
         # 섹션 프레임
         section_frame = self._create_section_frame(parent, "캡처 모니터 선택")
 
-        # 모니터 목록 조회
-        try:
-            self.monitor_names = get_monitor_names()
-            monitor_count = get_monitor_count()
-
-            if monitor_count == 0:
-                # 모니터 감지 실패
-                error_label = ttk.Label(
-                    section_frame,
-                    text="⚠️ 모니터를 감지할 수 없습니다.",
-                    foreground="red"
-                )
-                error_label.pack()
-                return
-
-        except Exception as e:
-            # 예외 발생 시 에러 메시지
-            logger.error(f"모니터 조회 실패: {e}")
-            error_label = ttk.Label(
-                section_frame,
-                text=f"⚠️ 모니터 조회 실패: {e}",
-                foreground="red"
-            )
-            error_label.pack()
-            return
-
-        # 모니터 선택 레이블
-        info_label = ttk.Label(
+        # 모니터 정보 레이블 (조회가 끝나면 감지 결과로 갱신)
+        self.monitor_info_label = ttk.Label(
             section_frame,
-            text=f"감지된 모니터: {monitor_count}개",
-            font=("", 11)
+            text="모니터 감지 중...",
+            font="BodyFont"
         )
-        info_label.pack(anchor=tk.W, pady=(0, 10))
+        self.monitor_info_label.pack(anchor=tk.W, pady=(0, 10))
 
-        # 모니터 선택 콤보박스
+        # 모니터 선택 콤보박스 (조회가 끝날 때까지 비활성화)
         self.monitor_var = tk.StringVar()
-
-        # 기본값: 저장된 설정 또는 첫 번째 모니터
-        if self.monitor_names:
-            saved_monitor_id = self.saved_config.get('monitor_id', 1)
-            # monitor_id를 "모니터 N" 형식으로 변환
-            default_monitor = f"모니터 {saved_monitor_id}"
-            # 해당 모니터가 목록에 있으면 설정, 없으면 첫 번째 모니터
-            if default_monitor in self.monitor_names:
-                self.monitor_var.set(default_monitor)
-            else:
-                self.monitor_var.set(self.monitor_names[0])
-
-        monitor_combo = ttk.Combobox(
+        self.monitor_combo = ttk.Combobox(
             section_frame,
             textvariable=self.monitor_var,
-            values=self.monitor_names,
-            state="readonly",
+            values=["감지 중..."],
+            state="disabled",
             width=30,
-            font=("", 11)
+            font="BodyFont"
         )
-        monitor_combo.pack(anchor=tk.W, pady=(0, 10))
+        self.monitor_combo.pack(anchor=tk.W, pady=(0, 10))
 
         # 안내 텍스트
         help_label = ttk.Label(
             section_frame,
             text="Zoom 화면이 표시되는 모니터를 선택하세요.",
-            font=("", 10),
-            foreground="gray"
+            style="Help.TLabel"
         )
         help_label.pack(anchor=tk.W)
 
+        # 모니터 목록은 작업 스레드에서 조회 (다이얼로그를 먼저 표시)
+        threading.Thread(target=self._load_monitors, daemon=True).start()
+        self.dialog.after(50, self._poll_monitor_result)
+
+    def _load_monitors(self) -> None:
+        """
+        모니터 목록을 조회하여 결과 큐에 넣습니다 (작업 스레드, Private).
+
+        Tk 위젯은 UI 스레드에서만 다룰 수 있으므로 여기서는 조회만 하고,
+        화면 반영은 _poll_monitor_result()가 UI 스레드에서 수행합니다.
+        """
+        try:
+            names = get_monitor_names()
+            count = get_monitor_count()
+            self._monitor_queue.put((names, count, None))
+        except Exception as e:
+            self._monitor_queue.put(([], 0, e))
+
+    def _poll_monitor_result(self) -> None:
+        """
+        모니터 조회 결과가 도착했는지 확인합니다 (UI 스레드, Private).
+
+        show()는 mainloop() 대신 update() 루프를 사용하므로 작업 스레드에서
+        after()를 직접 호출할 수 없어, UI 스레드에서 50ms 간격으로 큐를 확인합니다.
+        """
+        try:
+            names, count, error = self._monitor_queue.get_nowait()
+        except queue.Empty:
+            self.dialog.after(50, self._poll_monitor_result)
+            return
+
+        self._apply_monitor_list(names, count, error)
+
+    def _apply_monitor_list(
+        self,
+        names: List[str],
+        count: int,
+        error: Optional[Exception]
+    ) -> None:
+        """
+        조회한 모니터 목록을 콤보박스에 반영합니다 (Private).
+
+        Args:
+            names: 모니터 이름 목록
+            count: 감지된 모니터 개수
+            error: 조회 중 발생한 예외 (성공 시 None)
+        """
+        if error is not None:
+            # 예외 발생 시 에러 메시지
+            logger.error("모니터 조회 실패: %s", error)
+            self.monitor_info_label.configure(
+                text=f"⚠️ 모니터 조회 실패: {error}",
+                foreground="red"
+            )
+            return
+
+        if count == 0:
+            # 모니터 감지 실패
+            self.monitor_info_label.configure(
+                text="⚠️ 모니터를 감지할 수 없습니다.",
+                foreground="red"
+            )
+            return
+
+        self.monitor_names = names
+
+        # 콤보박스 항목 → 모니터 ID 매핑 (목록 순서 = 모니터 ID 1부터)
+        self._monitor_id_map = {
+            name: monitor_id
+            for monitor_id, name in enumerate(self.monitor_names, start=1)
+        }
+
+        self.monitor_info_label.configure(text=f"감지된 모니터: {count}개")
+        self.monitor_combo.configure(values=self.monitor_names, state="readonly")
+
+        # 기본값: 저장된 설정 또는 첫 번째 모니터
+        self.monitor_var.set(self._get_default_monitor_name())
+
+    def _get_default_monitor_name(self) -> str:
+        """
+        저장된 설정의 모니터 이름을 반환합니다 (Private).
+
+        저장된 monitor_id에 해당하는 모니터가 목록에 없으면
+        첫 번째 모니터를 반환합니다.
+
+        Returns:
+            str: 콤보박스에 선택할 모니터 이름
+        """
+        saved_monitor_id = self.saved_config.get('monitor_id', self._DEFAULT_MONITOR_ID)
+        # monitor_id를 "모니터 N" 형식으로 변환
+        default_monitor = f"모니터 {saved_monitor_id}"
+        if default_monitor in self._monitor_id_map:
+            return default_monitor
+        return self.monitor_names[0]
+
     def _get_selected_monitor_id(self) -> int:
         """
         선택된 모니터의 ID를 반환합니다.
 
-        "모니터 1", "모니터 2" 형식에서 숫자를 추출합니다.
+        모니터 목록을 조회할 때 만든 이름 → ID 매핑에서 찾습니다.
 
         Returns:
             int: 모니터 ID (기본값: 1)
@@ -298,16 +555,9 @@ class InitDialog:
             2
         """
         if not self.monitor_var:
-            return 1
+            return self._DEFAULT_MONITOR_ID
 
-        try:
-            # "모니터 1" -> 1 추출
-            monitor_name = self.monitor_var.get()
-            monitor_id = int(monitor_name.split()[-1])
-            return monitor_id
-        except (ValueError, IndexError):
-            # 파싱 실패 시 기본값 1 반환
-            return 1
+        return self._monitor_id_map.get(self.monitor_var.get(), self._DEFAULT_MONITOR_ID)
 
     # ==================== Save Path Section ====================
 
@@ -326,7 +576,7 @@ class InitDialog:
         path_frame.pack(fill=tk.X, pady=(0, 10))
 
         # 저장 경로 변수 초기화 (저장된 설정 또는 기본값)
-        default_save_path = self.saved_config.get('save_path', str(Path.home() / "Desktop"))
+        default_save_path = self.saved_config.get('save_path', self._DEFAULT_SAVE_PATH)
         self.save_path_var = tk.StringVar(value=default_save_path)
 
         # 경로 입력 필드
@@ -334,7 +584,7 @@ class InitDialog:
             path_frame,
             textvariable=self.save_path_var,
             width=30,
-            font=("", 11)
+            font="BodyFont"
         )
         path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
 
@@ -350,8 +600,7 @@ class InitDialog:
         help_label = ttk.Label(
             section_frame,
             text="캡처한 이미지를 저장할 폴더를 선택하세요.",
-            font=("", 10),
-            foreground="gray"
+            style="Help.TLabel"
         )
         help_label.pack(anchor=tk.W)
 
@@ -364,10 +613,15 @@ class InitDialog:
             current_path = self.save_path_var.get() if self.save_path_var else "C:/"
             initial_dir = str(Path(current_path))
 
-            # 폴더 선택 다이얼로그 표시
+            # 폴더 선택 다이얼로그 표시 (filedialog는 처음 사용할 때 로드)
+            from tkinter import filedialog
+            # parent 지정: 숨겨진 임시 toplevel 생성 없이 현재 다이얼로그를 소유자로 사용
+            # mustexist=False: 새로 만들 폴더 경로도 허용 (FileManager가 생성)
             selected_path = filedialog.askdirectory(
+                parent=self.dialog,
                 title="저장 경로 선택",
-                initialdir=initial_dir
+                initialdir=initial_dir,
+                mustexist=False
             )
 
             # 경로가 선택되면 업데이트 (취소 시 빈 문자열 반환)
@@ -378,8 +632,8 @@ class InitDialog:
 
         except Exception as e:
             # 예외 발생 시 에러 로그 및 사용자 알림
-            logger.error(f"폴더 선택 다이얼로그 실패: {e}")
-            messagebox.showerror(
+            logger.error("폴더 선택 다이얼로그 실패: %s", e)
+            self._show_error(
                 "오류",
                 f"폴더 선택 중 오류가 발생했습니다.\n{e}"
             )
@@ -397,22 +651,16 @@ class InitDialog:
         section_frame = self._create_section_frame(parent, "캡처 모드 선택")
 
         # 모드 변수 초기화 (저장된 설정 또는 기본값: exact)
-        default_mode = self.saved_config.get('mode', 'exact')
+        default_mode = self.saved_config.get('mode', self._DEFAULT_MODE)
         self.mode_var = tk.StringVar(value=default_mode)
 
-        # 정확 모드 라디오 버튼
-        # ttk.Radiobutton은 font를 직접 지원하지 않으므로 tk.Radiobutton 사용
-        # 배경색을 시스템 기본 버튼 배경색으로 설정
-        exact_radio = tk.Radiobutton(
+        # 정확 모드 라디오 버튼 (폰트는 Large.TRadiobutton 스타일로 지정)
+        exact_radio = ttk.Radiobutton(
             section_frame,
             text="정확 모드",
             variable=self.mode_var,
             value="exact",
-            font=("", 11),
-            bg="#f0f0f0",
-            activebackground="#f0f0f0",
-            highlightthickness=0,
-            borderwidth=0
+            style="Large.TRadiobutton"
         )
         exact_radio.pack(anchor=tk.W, pady=(0, 8))
 
@@ -420,22 +668,17 @@ class InitDialog:
         exact_desc = ttk.Label(
             section_frame,
             text="  → 기준 인원과 정확히 일치해야 캡처",
-            font=("", 10),
-            foreground="gray"
+            style="Help.TLabel"
         )
         exact_desc.pack(anchor=tk.W, pady=(0, 12))
 
         # 유연 모드 라디오 버튼
-        flexible_radio = tk.Radiobutton(
+        flexible_radio = ttk.Radiobutton(
             section_frame,
             text="유연 모드",
             variable=self.mode_var,
             value="flexible",
-            font=("", 11),
-            bg="#f0f0f0",
-            activebackground="#f0f0f0",
-            highlightthickness=0,
-            borderwidth=0
+            style="Large.TRadiobutton"
         )
         flexible_radio.pack(anchor=tk.W, pady=(0, 8))
 
@@ -443,8 +686,7 @@ class InitDialog:
         flexible_desc = ttk.Label(
             section_frame,
             text="  → 기준 인원의 90% 이상이면 캡처 (캠 환경 문제 고려)",
-            font=("", 10),
-            foreground="gray"
+            style="Help.TLabel"
         )
         flexible_desc.pack(anchor=tk.W)
 
@@ -461,7 +703,9 @@ class InitDialog:
         section_frame = self._create_section_frame(parent, "출석 학생 수")
 
         # 학생 수 변수 초기화 (저장된 설정 또는 기본값: 1명)
-        default_student_count = self.saved_config.get('student_count', 1)
+        default_student_count = self.saved_config.get(
+            'student_count', self._DEFAULT_STUDENT_COUNT
+        )
         self.student_count_var = tk.IntVar(value=default_student_count)
 
         # 입력 영역 생성
@@ -473,54 +717,66 @@ class InitDialog:
         # 안내 텍스트
         help_label = ttk.Label(
             section_frame,
-            text="출석한 학생 수를 입력하세요. (1~100명)",
-            font=("", 10),
-            foreground="gray"
+            text=f"출석한 학생 수를 입력하세요. ({self._MIN_COUNT}~{self._MAX_COUNT}명)",
+            style="Help.TLabel"
         )
         help_label.pack(anchor=tk.W)
 
     def _create_count_input_area(self, parent: ttk.LabelFrame) -> None:
         """
-        학생 수 입력 영역을 생성합니다 (Entry + ▲▼ 버튼).
+        학생 수 입력 영역을 생성합니다 (Spinbox).
+
+        ▲▼ 증감은 Spinbox가 Tcl 내부에서 처리하며(범위 1~100),
+        기준 인원 레이블은 값이 확정될 때(▲▼ 클릭, Enter, 포커스 아웃)만 갱신합니다.
+        키 입력은 validatecommand로 검사하여 숫자가 아닌 문자는 입력되지 않습니다.
 
         Args:
             parent: 부모 프레임
         """
-        # 입력 영역 (Entry + 버튼)
+        # 입력 영역
         input_frame = ttk.Frame(parent)
         input_frame.pack(fill=tk.X, pady=(0, 10))
 
         # 안내 레이블
-        label = ttk.Label(input_frame, text="학생 수:", font=("", 11))
+        label = ttk.Label(input_frame, text="학생 수:", font="BodyFont")
         label.pack(side=tk.LEFT, padx=(0, 10))
 
-        # 학생 수 입력 필드
-        count_entry = ttk.Entry(
+        # 키 입력 검증 함수 등록 (%P: 입력이 반영된 후의 값)
+        validate_command = (self.dialog.register(self._validate_count_text), "%P")
+
+        # 학생 수 입력 Spinbox
+        count_spinbox = ttk.Spinbox(
             input_frame,
+            from_=self._MIN_COUNT,
+            to=self._MAX_COUNT,
             textvariable=self.student_count_var,
             width=10,
             justify=tk.CENTER,
-            font=("", 11)
+            font="BodyFont",
+            validate="key",
+            validatecommand=validate_command,
+            command=self._update_threshold_label
         )
-        count_entry.pack(side=tk.LEFT, padx=(0, 10))
+        count_spinbox.pack(side=tk.LEFT)
 
-        # ▲ 버튼 (+1)
-        up_button = ttk.Button(
-            input_frame,
-            text="▲",
-            width=3,
-            command=self._increment_student_count
-        )
-        up_button.pack(side=tk.LEFT, padx=(0, 8))
+        # 직접 입력 값 확정 시 기준 인원 업데이트
+        count_spinbox.bind("<Return>", self._update_threshold_label)
+        count_spinbox.bind("<FocusOut>", self._update_threshold_label)
 
-        # ▼ 버튼 (-1)
-        down_button = ttk.Button(
-            input_frame,
-            text="▼",
-            width=3,
-            command=self._decrement_student_count
-        )
-        down_button.pack(side=tk.LEFT)
+    def _validate_count_text(self, proposed: str) -> bool:
+        """
+        학생 수 Spinbox의 키 입력을 검증합니다 (Private).
+
+        빈 문자열(입력 중)과 최대값 이하의 숫자만 허용합니다.
+        최소값 검사는 확인 버튼을 누를 때 validate_input()에서 수행합니다.
+
+        Args:
+            proposed: 키 입력이 반영된 후의 Spinbox 문자열
+
+        Returns:
+            bool: 입력을 허용하면 True
+        """
+        return proposed == "" or (proposed.isdigit() and int(proposed) <= self._MAX_COUNT)
 
     def _create_threshold_display(self, parent: ttk.LabelFrame) -> None:
         """
@@ -532,51 +788,45 @@ class InitDialog:
         # 기준 인원 표시 Label (학생 수 + 1)
         self.threshold_label = ttk.Label(
             parent,
-            text=f"기준 인원: {self.student_count_var.get() + 1}명 (학생 수 + 교사 1명)",
-            font=("", 11),
-            foreground="blue"
+            text=self._get_threshold_text(self.student_count_var.get()),
+            style="Threshold.TLabel"
         )
         self.threshold_label.pack(anchor=tk.W, pady=(0, 10))
 
-        # 학생 수 변경 시 기준 인원 자동 업데이트
-        self.student_count_var.trace_add("write", self._update_threshold_label)
-
-    def _increment_student_count(self) -> None:
+    def _update_threshold_label(self, *args) -> None:
         """
-        학생 수를 1 증가시킵니다.
+        학생 수가 확정될 때 기준 인원 레이블을 업데이트합니다.
 
-        최대값 100을 초과하지 않도록 제한합니다.
-        """
-        current_value = self.student_count_var.get()
-        if current_value < 100:
-            self.student_count_var.set(current_value + 1)
+        Spinbox command 및 <Return>/<FocusOut> 바인딩에서 호출됩니다.
 
-    def _decrement_student_count(self) -> None:
+        Args:
+            *args: 이벤트 바인딩에서 전달되는 인자 (사용하지 않음)
         """
-        학생 수를 1 감소시킵니다.
+        try:
+            current_count = self.student_count_var.get()
+            self.threshold_label.config(text=self._get_threshold_text(current_count))
+        except tk.TclError as e:
+            # 비어 있거나 정수가 아닌 입력: 레이블 유지 (확인 버튼에서 검증)
+            logger.debug("학생 수 입력값 미완성: %s", e)
+        except Exception as e:
+            logger.error("학생 수 입력값 오류: %s", e)
 
-        최소값 1 미만으로 내려가지 않도록 제한합니다.
+    def _get_threshold_text(self, student_count: int) -> str:
         """
-        current_value = self.student_count_var.get()
-        if current_value > 1:
-            self.student_count_var.set(current_value - 1)
+        학생 수에 해당하는 기준 인원 레이블 문구를 반환합니다 (Private).
 
-    def _update_threshold_label(self, *args) -> None:
-        """
-        학생 수가 변경될 때 기준 인원 레이블을 업데이트합니다.
+        1~100명은 미리 만들어 둔 문구를 사용하고,
+        범위를 벗어난 입력값만 즉석에서 생성합니다.
 
         Args:
-            *args: trace_add 콜백에서 전달되는 인자 (사용하지 않음)
+            student_count: 학생 수
+
+        Returns:
+            str: 기준 인원 레이블 문구
         """
-        try:
-            current_count = self.student_count_var.get()
-            threshold = current_count + 1
-            self.threshold_label.config(
-                text=f"기준 인원: {threshold}명 (학생 수 + 교사 1명)"
-            )
-        except Exception as e:
-            # 입력값이 정수가 아닌 경우 에러 로그
-            logger.error(f"학생 수 입력값 오류: {e}")
+        if self._MIN_COUNT <= student_count <= self._MAX_COUNT:
+            return self._THRESHOLD_TEXTS[student_count - self._MIN_COUNT]
+        return f"기준 인원: {student_count + 1}명 (학생 수 + 교사 1명)"
 
     # ==================== Button Section ====================
 
@@ -589,12 +839,7 @@ class InitDialog:
         """
         # 버튼 영역 프레임
         button_frame = ttk.Frame(parent)
-        button_frame.pack(fill=tk.X, pady=(30, 0))
-
-        # 버튼 스타일 설정
-        style = ttk.Style()
-        # padding: (left, top, right, bottom) - 위 패딩을 줄여서 텍스트를 중앙으로
-        style.configure("Large.TButton", font=("", 11, "bold"), padding=(10, 6, 10, 6))
+        button_frame.grid(row=parent.grid_size()[1], column=0, sticky="ew", pady=(30, 0))
 
         # 취소 버튼
         cancel_button = ttk.Button(
@@ -625,42 +870,39 @@ class InitDialog:
         Returns:
             bool: 모든 입력이 유효하면 True, 그렇지 않으면 False
 
-        Validation Rules:
-            - 학생 수: 1~100 범위
-            - 저장 경로: 비어있지 않음
+        Validation Rules (비용이 낮은 검사부터 수행):
             - 모니터: 선택됨
+            - 저장 경로: 비어있지 않음
+            - 학생 수: 1~100 범위
         """
-        # 1. 학생 수 검증 (1~100)
-        try:
-            student_count = self.student_count_var.get()
-            if student_count < 1 or student_count > 100:
-                messagebox.showerror(
-                    "입력 오류",
-                    "학생 수는 1~100명 사이여야 합니다."
-                )
-                return False
-        except Exception as e:
-            logger.error(f"학생 수 검증 실패: {e}")
-            messagebox.showerror(
+        # 1. 모니터 선택 검증
+        if not self.monitor_var or not self.monitor_var.get():
+            self._show_error(
                 "입력 오류",
-                "학생 수가 올바르지 않습니다."
+                "캡처 모니터를 선택해주세요."
             )
             return False
 
         # 2. 저장 경로 검증 (비어있지 않음)
         save_path = self.save_path_var.get() if self.save_path_var else ""
-        if not save_path or save_path.strip() == "":
-            messagebox.showerror(
+        if not save_path.strip():
+            self._show_error(
                 "입력 오류",
                 "저장 경로를 선택해주세요."
             )
             return False
 
-        # 3. 모니터 선택 검증
-        if not self.monitor_var or not self.monitor_var.get():
-            messagebox.showerror(
+        # 3. 학생 수 검증 (1~100, 숫자 외 입력은 validatecommand에서 이미 차단됨)
+        try:
+            student_count = self.student_count_var.get()
+        except tk.TclError:
+            # 빈 입력란: 범위 밖 값과 동일하게 처리
+            student_count = 0
+
+        if not self._MIN_COUNT <= student_count <= self._MAX_COUNT:
+            self._show_error(
                 "입력 오류",
-                "캡처 모니터를 선택해주세요."
+                f"학생 수는 {self._MIN_COUNT}~{self._MAX_COUNT}명 사이여야 합니다."
             )
             return False
 
@@ -685,30 +927,33 @@ class InitDialog:
         monitor_id = self._get_selected_monitor_id()
 
         # 저장 경로 가져오기 (Path 객체로 정규화)
-        save_path_str = self.save_path_var.get() if self.save_path_var else "C:/IBM 비대면"
+        save_path_str = self.save_path_var.get() if self.save_path_var else self._DEFAULT_SAVE_PATH
         save_path = str(Path(save_path_str))
 
         # 캡처 모드 가져오기
-        mode = self.mode_var.get() if self.mode_var else "exact"
+        mode = self.mode_var.get() if self.mode_var else self._DEFAULT_MODE
 
         # 학생 수 가져오기
-        student_count = self.student_count_var.get() if self.student_count_var else 1
+        student_count = (
+            self.student_count_var.get() if self.student_count_var
+            else self._DEFAULT_STUDENT_COUNT
+        )
 
-        # 설정을 config.json 파일에 저장
+        # 설정을 config.json 파일에 저장 (값을 모두 반영한 뒤 파일 쓰기 1회)
+        values = dict(zip(self._RESULT_KEYS, (monitor_id, save_path, mode, student_count)))
         try:
-            self.config.set('monitor_id', monitor_id)
-            self.config.set('save_path', save_path)
-            self.config.set('mode', mode)
-            self.config.set('student_count', student_count)
-            logger.info(f"설정 저장 완료: monitor_id={monitor_id}, save_path={save_path}, mode={mode}, student_count={student_count}")
+            self.config.data.update(values)
+            self.config.save(self.config.data)
+            logger.info("설정 저장 완료: %s", values)
         except Exception as e:
-            logger.error(f"설정 저장 실패: {e}", exc_info=True)
-            # 저장 실패해도 프로그램은 계속 진행
+            logger.error("설정 저장 실패: %s", e, exc_info=True)
+            # 저장 실패해도 프로그램은 계속 진행 (메모리에는 반영됨)
 
         # Config 인스턴스를 결과로 설정
         self.result = self.config
 
-        self.dialog.destroy()
+        # 다이얼로그 숨김 (재사용을 위해 파괴하지 않음)
+        self._close_dialog()
 
     def on_cancel(self) -> None:
         """
@@ -718,4 +963,4 @@ class InitDialog:
         결과는 None으로 설정됩니다.
         """
         self.result = None
-        self.dialog.destroy()
+        self._close_dialog()
@@ -7,16 +7,24 @@
 # 표준 라이브러리
 import logging
 import os
-import platform
+import queue
+import subprocess
+import sys
+import threading
+import time
 import tkinter as tk
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date, datetime, timedelta
+from functools import partial
 from pathlib import Path
 from tkinter import ttk, filedialog, messagebox
-from typing import Optional, Dict
+from typing import TYPE_CHECKING, Any, Callable, Optional, Dict, List, Set, Tuple
+
+# 외부 라이브러리
+import numpy as np
 
 # 내부 모듈
 from features.capture import ScreenCapture
-from features.face_detection import FaceDetector
 from features.file_manager import FileManager
 from features.logger import CSVLogger
 from features.scheduler import CaptureScheduler
@@ -27,11 +35,84 @@ from features.exceptions import (
     ModelLoadError
 )
 from utils.config import Config
-from utils.monitor import get_monitor_names
+from utils.monitor import get_monitor_names, get_screen_size, invalidate_monitor_cache
+
+if TYPE_CHECKING:
+    # 얼굴 감지 모듈은 _init_detector()에서 처음 필요할 때 import (시작 시간 단축)
+    from features.face_detection import FaceDetector
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 교시 상태 코드 (표시 문자열 대신 정수로 상태를 비교)
+STATUS_UNKNOWN = -1
+STATUS_WAITING = 0
+STATUS_DETECTING = 1
+STATUS_DONE = 2
+STATUS_FAILED = 3
+STATUS_SKIPPED = 4
+STATUS_TIMEOUT = 5
+
+# 교시별 캡처 시간대 (교시 번호, 캡처 시작, 캡처 종료) - 1~8교시 + 퇴실(0)
+PERIOD_SCHEDULE: Tuple[Tuple[int, str, str], ...] = (
+    (1, "09:30", "09:45"),
+    (2, "10:30", "10:45"),
+    (3, "11:30", "11:45"),
+    (4, "12:30", "12:45"),
+    (5, "14:30", "14:45"),
+    (6, "15:30", "15:45"),
+    (7, "16:30", "16:45"),
+    (8, "17:30", "17:45"),
+    (0, "18:30", "18:32"),  # 퇴실
+)
+
+# 수업 시간 (교시 시작 ~ 종료 표시용, 분)
+CLASS_DURATION_MINUTES = 50
+
+
+def _parse_hhmm(text: str) -> Tuple[int, int]:
+    """
+    "HH:MM" 문자열을 (시, 분) 튜플로 변환합니다.
+
+    Args:
+        text: "HH:MM" 형식 시간 문자열
+
+    Returns:
+        Tuple[int, int]: (시, 분)
+
+    Example:
+        >>> _parse_hhmm("09:45")
+        (9, 45)
+    """
+    hour, minute = text.split(":")
+    return int(hour), int(minute)
+
+
+# PERIOD_SCHEDULE을 미리 파싱한 값 (교시, 시작_시, 시작_분, 종료_시, 종료_분)
+_PARSED_SCHEDULE: Tuple[Tuple[int, int, int, int, int], ...] = tuple(
+    (period, *_parse_hhmm(start), *_parse_hhmm(end))
+    for period, start, end in PERIOD_SCHEDULE
+)
+
+# 폴더 열기 명령 (Windows 탐색기 / macOS Finder / Linux 기본 파일 관리자)
+_OPEN_FOLDER_COMMAND: str = {"win32": "explorer", "darwin": "open"}.get(sys.platform, "xdg-open")
+
+# 교시 번호 → 교시명 (예: 1 → "1교시", 0 → "퇴실")
+_PERIOD_NAMES: Dict[int, str] = {
+    period: "퇴실" if period == 0 else f"{period}교시"
+    for period, _start, _end in PERIOD_SCHEDULE
+}
+
+# 상태 문자열 키워드 → 상태 코드 (_format_status_with_emoji와 같은 우선순위)
+_STATUS_KEYWORDS: Tuple[Tuple[str, int], ...] = (
+    ("대기중", STATUS_WAITING),
+    ("감지중", STATUS_DETECTING),
+    ("완료", STATUS_DONE),
+    ("실패", STATUS_FAILED),
+    ("건너뛰기", STATUS_SKIPPED),
+    ("시간 초과", STATUS_TIMEOUT),
+)
+
 
 class MainWindow:
     """
@@ -67,6 +148,57 @@ class MainWindow:
         >>> window.run()
     """
 
+    # 윈도우 크기 (1920x1080 해상도 대응, 고정 크기)
+    WINDOW_W = 750
+    WINDOW_H = 800
+
+    # 날짜/시간 표시 접두어
+    _DATE_PREFIX = "📅 날짜: "
+    _TIME_PREFIX = "🕐 시간: "
+
+    # 고정 교시 상태 문자열 (이모지 포함)
+    _ST_WAITING = "🕒 대기중"
+    _ST_DETECTING = "🔍 감지중"
+    _ST_SKIPPED = "⏭️ 건너뛰기"
+    _ST_TIMEOUT = "⏰ 시간 초과"
+
+    # 고정 상태 문자열 → 상태 코드 (이모지/키워드 검사 생략)
+    _FIXED_STATUS_CODES = {
+        _ST_WAITING: STATUS_WAITING,
+        _ST_DETECTING: STATUS_DETECTING,
+        _ST_SKIPPED: STATUS_SKIPPED,
+        _ST_TIMEOUT: STATUS_TIMEOUT,
+    }
+
+    # CSV 로그 일괄 기록 (최대 이벤트 수, 첫 이벤트 후 최대 대기 시간(초))
+    _LOG_BATCH_SIZE = 16
+    _LOG_FLUSH_INTERVAL = 1.0
+
+    # 같은 알림 반복 표시 방지 시간 (초, 마지막 알림창이 닫힌 시점부터)
+    _ALERT_DEDUP_SECONDS = 2.0
+
+    # 상태 표시 문자열 캐시 최대 항목 수 (완료 시각/실패 인원 조합은 하루 수십 개 수준)
+    _STATUS_RENDER_CACHE_MAX = 256
+
+    # 저장 폴더 존재 확인 결과 유지 시간 (초)
+    _SAVE_PATH_CHECK_TTL = 2.0
+
+    # 캡처 이미지 버퍼 풀에 보관할 최대 버퍼 수 (캡처 1개 + 저장 대기 1개)
+    _IMAGE_POOL_MAX = 2
+
+    # 종료 시 진행 중인 캡처를 기다리는 최대 시간 (초, CPU 모드 얼굴 감지 2-3초)
+    _CAPTURE_SHUTDOWN_TIMEOUT = 10.0
+
+    # 정보/경고 알림창 자동 닫힘 시간 (밀리초, 에러 알림은 사용자가 닫을 때까지 유지)
+    _TOAST_DURATION_MS = 3000
+
+    # 알림 타입별 메시지 스타일
+    _TOAST_STYLES: Dict[str, str] = {
+        "info": "ToastInfo.TLabel",
+        "warning": "ToastWarning.TLabel",
+        "error": "ToastError.TLabel",
+    }
+
     # ==================== Initialization ====================
 
     def __init__(self, config_manager: Config) -> None:
@@ -84,106 +216,114 @@ class MainWindow:
         self.config_manager: Config = config_manager
         self.monitor_id: int = config_manager.get('monitor_id', 1)
         self.save_path: str = config_manager.get('save_path', 'C:/IBM 비대면')
+        self._save_path_obj: Path = Path(self.save_path)  # save_path와 함께 변경
         self.mode: str = config_manager.get('mode', 'flexible')
         self.student_count: int = config_manager.get('student_count', 1)
 
-        # Features 인스턴스 초기화
-        logger.info("Features 모듈 초기화 시작")
+        # 기준 인원 / 모드별 최소 감지 인원 (학생 수·모드 변경 시 _refresh_thresholds()로 갱신)
+        self._threshold: int = 0
+        self._min_required: int = 0
+        self._exact_match: bool = True  # 정확 모드 여부 (매 캡처마다 모드 문자열을 비교하지 않음)
+        self._mode_note: str = ""  # CSV 로그 비고용 모드 설명
+        self._refresh_thresholds()
 
-        # 1. ScreenCapture 인스턴스 생성
-        logger.info(f"ScreenCapture 초기화 (모니터 ID: {self.monitor_id})")
+        # Features 인스턴스 (작업 스레드에서 초기화 후 UI 스레드에서 연결)
         self.capture: Optional[ScreenCapture] = None
-        try:
-            self.capture = ScreenCapture(monitor_id=self.monitor_id)
-            logger.info("ScreenCapture 초기화 완료")
-        except Exception as e:
-            logger.error(f"ScreenCapture 초기화 실패: {e}", exc_info=True)
-            messagebox.showerror(
-                "초기화 오류",
-                f"화면 캡처 모듈 초기화에 실패했습니다.\n\n{e}"
-            )
-
-        # 2. FaceDetector 인스턴스 생성
-        logger.info("FaceDetector 초기화 (CPU 모드)")
-        self.detector: Optional[FaceDetector] = None
-        try:
-            self.detector = FaceDetector()
-            self.detector.initialize()
-            logger.info("FaceDetector 초기화 완료")
-        except ModelLoadError as e:
-            logger.error(f"InsightFace 모델 로드 실패: {e}", exc_info=True)
-            messagebox.showerror(
-                "모델 로드 실패",
-                f"InsightFace 모델을 로드할 수 없습니다.\n\n"
-                f"오류: {e}\n\n"
-                f"InsightFace가 설치되어 있는지 확인하세요.\n"
-                f"'pip install insightface' 명령으로 설치할 수 있습니다."
-            )
-        except Exception as e:
-            logger.error(f"FaceDetector 초기화 실패: {e}", exc_info=True)
-            messagebox.showerror(
-                "초기화 오류",
-                f"얼굴 감지 모듈 초기화에 실패했습니다.\n\n{e}\n\n"
-                f"InsightFace 모델 로드에 실패했습니다."
-            )
-
-        # 3. FileManager 인스턴스 생성
-        logger.info(f"FileManager 초기화 (저장 경로: {self.save_path})")
+        self.detector: Optional["FaceDetector"] = None
         self.file_manager: Optional[FileManager] = None
-        try:
-            self.file_manager = FileManager(base_path=self.save_path)
-            self.file_manager.ensure_folder_exists()
-            logger.info("FileManager 초기화 완료")
-        except Exception as e:
-            logger.error(f"FileManager 초기화 실패: {e}", exc_info=True)
-            messagebox.showerror(
-                "초기화 오류",
-                f"파일 관리 모듈 초기화에 실패했습니다.\n\n{e}\n\n"
-                f"저장 경로를 확인하거나 폴더 권한을 확인해주세요."
-            )
-
-        # 4. CaptureScheduler 인스턴스 생성
-        logger.info("CaptureScheduler 초기화")
         self.scheduler: Optional[CaptureScheduler] = None
-        try:
-            self.scheduler = CaptureScheduler()
-            self._setup_schedules()
-            logger.info("CaptureScheduler 초기화 완료")
-        except Exception as e:
-            logger.error(f"CaptureScheduler 초기화 실패: {e}", exc_info=True)
-            messagebox.showerror(
-                "초기화 오류",
-                f"스케줄러 초기화에 실패했습니다.\n\n{e}"
-            )
-
-        # 5. CSVLogger 인스턴스 생성
-        logger.info(f"CSVLogger 초기화 (저장 경로: {self.save_path})")
         self.csv_logger: Optional[CSVLogger] = None
-        try:
-            self.csv_logger = CSVLogger(base_path=self.save_path)
-            logger.info("CSVLogger 초기화 완료")
-        except Exception as e:
-            logger.error(f"CSVLogger 초기화 실패: {e}", exc_info=True)
-            messagebox.showerror(
-                "초기화 오류",
-                f"로그 모듈 초기화에 실패했습니다.\n\n{e}"
-            )
 
-        logger.info("Features 모듈 초기화 완료")
+        # Features 초기화 결과 전달용 큐 (작업 스레드 → UI 스레드)
+        self._feature_queue: "queue.Queue[Tuple[str, object]]" = queue.Queue()
+        # Features 초기화 오류 메시지 (초기화 완료 후 한 번에 표시)
+        self._init_errors: List[str] = []
+        # Features 초기화 완료 여부 (완료 전 교시 버튼 입력 무시)
+        self._features_ready: bool = False
+
+        # 캡처 작업 스레드 관리
+        self._shutting_down: bool = False  # 종료 중 (새 캡처/저장/로그 요청 무시)
+        self._captures_inflight: Set[int] = set()  # 캡처 진행 중인 교시 (UI 스레드에서만 변경)
+        # 교시별 세대 번호 (건너뛰기/재시도 시 증가, 제출 후 바뀌면 캡처 결과를 버림)
+        # UI 스레드에서만 변경하고, 작업 스레드는 _is_stale_capture()로 잠금 안에서 조회
+        self._period_generation: Dict[int, int] = {}
+        self._period_generation_lock = threading.Lock()
+        # 캡처 작업 스레드 (mss 핸들은 만든 스레드에서만 쓸 수 있으므로 단일 스레드가 소유)
+        self._capture_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture")
+        # 저장 작업 스레드 (캡처/감지와 파일 저장을 겹쳐 실행)
+        self._save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture-save")
+        # 캡처 이미지 버퍼 풀 (크기별로 재사용, 캡처 스레드와 저장 스레드가 반납)
+        # 버퍼는 꺼낸 쪽이 단독으로 사용하고, 처리가 끝나면 _release_buffer()로 반납
+        self._image_pool: Dict[Tuple[int, ...], List[np.ndarray]] = {}
+        self._image_pool_lock = threading.Lock()
+        self._frame_shape: Optional[Tuple[int, ...]] = None  # 마지막 캡처 크기 (캡처 작업 스레드에서만 변경)
+        self._ui_queue: "queue.Queue[Tuple[Callable, tuple]]" = queue.Queue()  # 작업 스레드 → UI 스레드
+        self._ui_poll_id: Optional[str] = None
+
+        # 알림창 중복/겹침 방지 (마지막 알림 (제목, 메시지, 시각), 표시 중 여부, 대기 알림)
+        self._last_alert: Optional[Tuple[str, str, float]] = None
+        self._alert_open: bool = False
+        self._pending_alerts: List[Tuple[str, str, str]] = []
+        self._toast: Optional[tk.Toplevel] = None  # 표시 중인 비모달 알림창
+
+        # CSV 로그 일괄 기록 (이벤트를 큐에 모아 작업 스레드에서 한 번에 기록)
+        self._log_queue: "queue.Queue[Optional[Tuple[CSVLogger, tuple]]]" = queue.Queue()
+        self._log_closed: bool = False  # 종료 신호(None)를 넣은 뒤에는 로그를 받지 않음
+        self._log_writer = threading.Thread(target=self._log_writer_loop, daemon=True)
+        self._log_writer.start()
 
         # UI 변수
         self.date_var: Optional[tk.StringVar] = None
         self.time_var: Optional[tk.StringVar] = None
+        # 매 초 갱신용 Tcl 변수 이름 (StringVar.set() 래퍼를 거치지 않고 직접 설정)
+        self._date_var_name: str = ""
+        self._time_var_name: str = ""
+        self._last_day: Optional[int] = None
+        self._last_second: Optional[int] = None  # 마지막으로 표시한 시각 (epoch 초)
+        self.init_status_var: Optional[tk.StringVar] = None
         self.monitor_var: Optional[tk.StringVar] = None
+        # 모니터 목록 (UI 구성 전에 한 번만 조회, utils.monitor에서 TTL 캐시)
+        # 콤보박스를 펼칠 때마다 캐시를 비우고 다시 조회 (모니터 연결/분리 반영)
+        self._monitor_names: List[str] = get_monitor_names()
+        self._monitor_combo: Optional[ttk.Combobox] = None
         self.mode_var: Optional[tk.StringVar] = None
         self.student_count_var: Optional[tk.IntVar] = None
         self.threshold_label: Optional[ttk.Label] = None
+        # 학생 수 변경 반영 예약 ID (연속 입력 시 마지막 값만 반영)
+        self._count_after_id: Optional[str] = None
+
+        # 저장 폴더 존재 확인 캐시 (확인 시각, 결과)
+        self._save_path_checked_at: float = 0.0
+        self._save_path_exists: bool = False
+        # 캡처 전 저장 가능 여부 확인 캐시 (확인 시각, 결과)
+        self._save_writable_checked_at: float = 0.0
+        self._save_writable: bool = True
+        # 저장 경로 오류를 이미 기록/알림한 교시 (경로 변경 또는 복구 시까지 반복하지 않음)
+        self._save_blocked_periods: Set[int] = set()
+
+        # 설정 지연 저장 (변경된 키, 저장 예약 ID)
+        self._config_dirty: Set[str] = set()
+        self._config_flush_id: Optional[str] = None
 
         # 교시별 상태 변수 (1~8교시 + 퇴실)
         self.period_status_vars: Dict[int, tk.StringVar] = {}
+        # 교시별 상태 코드 (StringVar 조회/문자열 검사 없이 상태 비교)
+        self._period_status_code: Dict[int, int] = {}
+        # 교시별 마지막 상태 문자열 (같은 상태 재설정 시 Tcl 호출/다시 그리기 생략)
+        self._period_status_cache: Dict[int, str] = {}
+        # 상태 문자열 → (표시 문자열, 상태 코드) (같은 상태는 같은 문자열 객체 재사용)
+        self._status_render_cache: Dict[str, Tuple[str, int]] = {
+            status: (status, code) for status, code in self._FIXED_STATUS_CODES.items()
+        }
+        # 교시별 (건너뛰기, 재시도) 버튼 (연속 클릭 방지용)
+        self._period_buttons: Dict[int, Tuple[ttk.Button, ttk.Button]] = {}
+
+        # 교시별 캡처 종료 시간 (교시 번호로 인덱싱, 0 = 퇴실)
+        self.period_end_times: List[Tuple[int, int]] = self._initialize_period_times()
 
-        # 교시별 캡처 시간대 정보 초기화
-        self.period_end_times: Dict[int, tuple] = self._initialize_period_times()
+        # 시간 초과 확인 대기열: 오늘 날짜 기준 (초과 시각 epoch, 교시), 시각 순 정렬
+        self._timeout_date: Optional[date] = None
+        self._timeout_queue: List[Tuple[float, int]] = []
 
         # UI 구성
         self.setup_ui()
@@ -194,103 +334,303 @@ class MainWindow:
         # 시간 업데이트 시작
         self.update_time()
 
-    def _initialize_period_times(self) -> Dict[int, tuple]:
+        # 시간 초과 확인 시작 (이후 다음 초과 시각에 맞춰 한 번씩만 실행)
+        self._on_timeout_due()
+
+        # Features 초기화 (모델 로드 등 무거운 작업은 윈도우 표시 후 작업 스레드에서 수행)
+        logger.info("Features 모듈 초기화 시작")
+        threading.Thread(target=self._async_init_features, daemon=True).start()
+        self.root.after(50, self._poll_feature_init)
+
+    # ==================== Features Initialization ====================
+
+    def _async_init_features(self) -> None:
         """
-        교시별 캡처 종료 시간 정보를 반환합니다.
+        Features 인스턴스를 생성하여 결과 큐에 넣습니다 (작업 스레드).
+
+        Tk 위젯과 messagebox는 UI 스레드에서만 다룰 수 있으므로
+        여기서는 인스턴스 생성만 하고, 연결과 오류 표시는
+        _poll_feature_init()이 UI 스레드에서 수행합니다.
+        """
+        initializers = (
+            ("capture", self._init_capture),
+            ("detector", self._init_detector),
+            ("file_manager", self._init_file_manager),
+            ("csv_logger", self._init_csv_logger),
+        )
+        for name, initializer in initializers:
+            try:
+                result = initializer()
+            except Exception as e:
+                result = e
+            self._feature_queue.put((name, result))
+
+        # 초기화 종료 표시
+        self._feature_queue.put(("done", None))
+
+    def _poll_feature_init(self) -> None:
+        """
+        Features 초기화 결과를 확인하여 적용합니다 (UI 스레드).
+
+        mainloop() 시작 전에는 작업 스레드에서 after()를 호출할 수 없으므로,
+        UI 스레드에서 50ms 간격으로 큐를 확인합니다.
+        """
+        while True:
+            try:
+                name, result = self._feature_queue.get_nowait()
+            except queue.Empty:
+                self.root.after(50, self._poll_feature_init)
+                return
+
+            if name == "done":
+                self._on_features_initialized()
+                return
+
+            self._on_feature_ready(name, result)
+
+    def _on_feature_ready(self, name: str, result: object) -> None:
+        """
+        초기화된 Features 인스턴스를 연결하거나 오류를 기록합니다.
+
+        초기화 중에 사용자가 모니터/저장 경로를 변경하여 이미 새 인스턴스가
+        연결된 경우에는 덮어쓰지 않습니다.
+
+        Args:
+            name: 인스턴스 속성 이름 ("capture", "detector", ...)
+            result: 생성된 인스턴스 또는 초기화 중 발생한 예외
+        """
+        if isinstance(result, Exception):
+            self._record_init_error(name, result)
+            return
+
+        if getattr(self, name) is None:
+            setattr(self, name, result)
+
+    def _on_features_initialized(self) -> None:
+        """
+        Features 초기화가 끝나면 스케줄러를 시작합니다 (UI 스레드).
+
+        스케줄러 콜백은 캡처/감지 인스턴스를 사용하므로 마지막에 시작합니다.
+        """
+        try:
+            self._init_scheduler()
+        except Exception as e:
+            self._record_init_error("scheduler", e)
+        self._features_ready = True
+
+        failed = [
+            name for name in ("capture", "detector", "file_manager", "scheduler", "csv_logger")
+            if getattr(self, name) is None
+        ]
+        self.init_status_var.set(
+            "⚙️ 상태: 준비 완료" if not failed else "⚠️ 상태: 일부 기능 초기화 실패"
+        )
+        logger.info("Features 모듈 초기화 완료")
+
+        # 초기화 오류는 모아서 한 번만 표시
+        self._show_init_errors()
+
+    def _init_capture(self) -> ScreenCapture:
+        """
+        ScreenCapture 인스턴스를 캡처 작업 스레드에서 생성합니다.
+
+        mss는 장치 컨텍스트를 스레드별로 보관하므로, 생성도 캡처를 실행할
+        작업 스레드(_get_capture)에 맡기고 결과만 기다립니다.
+
+        Returns:
+            ScreenCapture: 화면 캡처 인스턴스
+        """
+        logger.info("ScreenCapture 초기화 (모니터 ID: %s)", self.monitor_id)
+        capture = self._capture_pool.submit(self._get_capture).result()
+        logger.info("ScreenCapture 초기화 완료")
+        return capture
+
+    def _init_detector(self) -> "FaceDetector":
+        """
+        FaceDetector 인스턴스를 생성하고 모델을 로드합니다.
+
+        모듈 import도 이 시점(백그라운드 초기화 스레드)으로 미뤄
+        메인 윈도우 import 및 UI 표시가 얼굴 감지 모듈 로드를 기다리지 않도록 합니다.
+
+        Returns:
+            FaceDetector: 얼굴 감지 인스턴스
+        """
+        from features.face_detection import FaceDetector
+
+        logger.info("FaceDetector 초기화 (CPU 모드)")
+        detector = FaceDetector()
+        detector.initialize()
+        logger.info("FaceDetector 초기화 완료")
+        return detector
+
+    def _init_file_manager(self) -> FileManager:
+        """
+        FileManager 인스턴스를 생성하고 저장 폴더를 준비합니다.
+
+        Returns:
+            FileManager: 파일 관리 인스턴스
+        """
+        logger.info("FileManager 초기화 (저장 경로: %s)", self.save_path)
+        file_manager = FileManager(base_path=self.save_path)
+        file_manager.ensure_folder_exists()
+        logger.info("FileManager 초기화 완료")
+        return file_manager
+
+    def _init_scheduler(self) -> None:
+        """
+        CaptureScheduler 인스턴스를 생성하고 교시별 스케줄을 등록합니다.
+
+        root.after()를 사용하므로 UI 스레드에서 호출해야 합니다.
+        """
+        logger.info("CaptureScheduler 초기화")
+        self.scheduler = CaptureScheduler()
+        self._setup_schedules()
+        logger.info("CaptureScheduler 초기화 완료")
+
+    def _init_csv_logger(self) -> CSVLogger:
+        """
+        CSVLogger 인스턴스를 생성합니다.
 
         Returns:
-            Dict[int, tuple]: {교시번호: (종료_시, 종료_분)}
-        """
-        return {
-            1: (9, 45),   # 1교시: 09:30~09:45
-            2: (10, 45),  # 2교시: 10:30~10:45
-            3: (11, 45),  # 3교시: 11:30~11:45
-            4: (12, 45),  # 4교시: 12:30~12:45
-            5: (14, 45),  # 5교시: 14:30~14:45
-            6: (15, 45),  # 6교시: 15:30~15:45
-            7: (16, 45),  # 7교시: 16:30~16:45
-            8: (17, 45),  # 8교시: 17:30~17:45
-            0: (18, 32),  # 퇴실: 18:30~18:32
+            CSVLogger: CSV 로거 인스턴스
+        """
+        logger.info("CSVLogger 초기화 (저장 경로: %s)", self.save_path)
+        csv_logger = CSVLogger(base_path=self.save_path)
+        logger.info("CSVLogger 초기화 완료")
+        return csv_logger
+
+    def _record_init_error(self, name: str, error: Exception) -> None:
+        """
+        Features 초기화 실패를 기록하고 오류 목록에 추가합니다.
+
+        오류 메시지는 초기화가 모두 끝난 뒤 _show_init_errors()에서
+        한 번에 표시합니다 (모듈마다 모달 다이얼로그를 띄우지 않음).
+
+        Args:
+            name: 인스턴스 속성 이름
+            error: 초기화 중 발생한 예외
+        """
+        if name == "detector" and isinstance(error, ModelLoadError):
+            logger.error("InsightFace 모델 로드 실패: %s", error, exc_info=error)
+            self._init_errors.append(
+                f"InsightFace 모델을 로드할 수 없습니다.\n"
+                f"오류: {error}\n"
+                f"InsightFace가 설치되어 있는지 확인하세요.\n"
+                f"'pip install insightface' 명령으로 설치할 수 있습니다."
+            )
+            return
+
+        # (로그용 모듈 이름, 오류 메시지 본문, 추가 안내)
+        labels = {
+            "capture": ("ScreenCapture", "화면 캡처 모듈 초기화에 실패했습니다.", ""),
+            "detector": (
+                "FaceDetector",
+                "얼굴 감지 모듈 초기화에 실패했습니다.",
+                "\nInsightFace 모델 로드에 실패했습니다."
+            ),
+            "file_manager": (
+                "FileManager",
+                "파일 관리 모듈 초기화에 실패했습니다.",
+                "\n저장 경로를 확인하거나 폴더 권한을 확인해주세요."
+            ),
+            "scheduler": ("CaptureScheduler", "스케줄러 초기화에 실패했습니다.", ""),
+            "csv_logger": ("CSVLogger", "로그 모듈 초기화에 실패했습니다.", ""),
         }
+        module_name, message, hint = labels[name]
+        logger.error("%s 초기화 실패: %s", module_name, error, exc_info=error)
+        self._init_errors.append(f"{message}\n{error}{hint}")
+
+    def _show_init_errors(self) -> None:
+        """
+        기록된 Features 초기화 오류를 하나의 오류 메시지로 표시합니다.
+        """
+        if not self._init_errors:
+            return
+
+        messagebox.showerror("초기화 오류", "\n\n".join(self._init_errors))
+        self._init_errors.clear()
+
+    def _initialize_period_times(self) -> List[Tuple[int, int]]:
+        """
+        교시별 캡처 종료 시간 정보를 반환합니다.
+
+        교시 번호(0 = 퇴실, 1~8 = 교시)를 인덱스로 하는 고정 길이 리스트입니다.
+
+        Returns:
+            List[Tuple[int, int]]: [(종료_시, 종료_분), ...] (PERIOD_SCHEDULE 기준)
+        """
+        end_times: List[Tuple[int, int]] = [(0, 0)] * len(_PARSED_SCHEDULE)
+        for period, _, _, end_hour, end_minute in _PARSED_SCHEDULE:
+            end_times[period] = (end_hour, end_minute)
+        return end_times
+
+    def _build_timeout_queue(self, now: datetime) -> None:
+        """
+        오늘 날짜 기준 교시별 시간 초과 시각 대기열을 만듭니다.
+
+        캡처 종료 시각의 다음 분(예: 09:45 종료 → 09:46:00)부터 시간 초과로 봅니다.
+        날짜가 바뀌면 _check_timeout_periods()에서 다시 호출됩니다.
+
+        Args:
+            now: 현재 시간
+        """
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._timeout_date = now.date()
+        self._timeout_queue = sorted(
+            (
+                (today + timedelta(hours=end_hour, minutes=end_minute + 1)).timestamp(),
+                period
+            )
+            for period, (end_hour, end_minute) in enumerate(self.period_end_times)
+        )
 
     def _setup_schedules(self) -> None:
         """
         CaptureScheduler에 교시별 스케줄을 등록합니다.
 
-        1~8교시 + 퇴실(0) 총 9개 스케줄을 등록합니다.
+        1~8교시 + 퇴실(0) 총 9개 스케줄을 add_schedules()로 한 번에 등록합니다.
         각 교시는 캡처 콜백 함수를 통해 자동 캡처를 시도합니다.
         """
         if self.scheduler is None:
             logger.warning("Scheduler가 초기화되지 않아 스케줄 등록을 건너뜁니다.")
             return
 
-        # 1~8교시 스케줄 등록
-        schedule_times = {
-            1: ("09:30", "09:45"),
-            2: ("10:30", "10:45"),
-            3: ("11:30", "11:45"),
-            4: ("12:30", "12:45"),
-            5: ("14:30", "14:45"),
-            6: ("15:30", "15:45"),
-            7: ("16:30", "16:45"),
-            8: ("17:30", "17:45"),
-            0: ("18:30", "18:32"),  # 퇴실
-        }
-
-        for period, (start_time, end_time) in schedule_times.items():
-            try:
-                # 캡처 콜백 함수: _on_capture_trigger 메서드 호출
-                def capture_callback(p=period):
-                    self._on_capture_trigger(p)
-
-                self.scheduler.add_schedule(
-                    period=period,
-                    start_time=start_time,
-                    end_time=end_time,
-                    callback=capture_callback
-                )
-                logger.info(f"{period}교시 스케줄 등록 완료: {start_time}~{end_time}")
-            except Exception as e:
-                logger.error(f"{period}교시 스케줄 등록 실패: {e}", exc_info=True)
+        # 1~8교시 + 퇴실 스케줄 일괄 등록
+        # 캡처 콜백: Scheduler가 callback(period)로 호출하므로 바운드 메서드를 그대로 등록
+        specs = [
+            (period, start_time, end_time, self._on_capture_trigger)
+            for period, start_time, end_time in PERIOD_SCHEDULE
+        ]
+        try:
+            self.scheduler.add_schedules(specs)
+            for period, start_time, end_time, _ in specs:
+                logger.info("%s 스케줄 등록 완료: %s~%s", _PERIOD_NAMES[period], start_time, end_time)
+        except Exception as e:
+            logger.error("스케줄 등록 실패: %s", e, exc_info=True)
 
         # 스케줄러 시작
         try:
             self.scheduler.start(self.root)
             logger.info("Scheduler 시작 완료")
         except Exception as e:
-            logger.error(f"Scheduler 시작 실패: {e}", exc_info=True)
+            logger.error("Scheduler 시작 실패: %s", e, exc_info=True)
 
     def _center_window(self) -> None:
-        """메인 윈도우를 화면 중앙에 배치합니다."""
-        # 윈도우 크기 (1920x1080 해상도 대응)
-        window_width = 750
-        window_height = 800
+        """
+        메인 윈도우를 화면 중앙에 배치합니다.
 
-        # HiDPI/Retina 디스플레이 처리
-        if platform.system() == "Windows":
-            try:
-                import ctypes
-                # 실제 물리적 화면 크기 가져오기
-                user32 = ctypes.windll.user32
-                screen_width = user32.GetSystemMetrics(0)
-                screen_height = user32.GetSystemMetrics(1)
-            except Exception as e:
-                logger.warning(f"실제 화면 크기 가져오기 실패, 기본값 사용: {e}")
-                self.root.update_idletasks()
-                screen_width = self.root.winfo_screenwidth()
-                screen_height = self.root.winfo_screenheight()
-        else:
-            # macOS, Linux는 winfo 사용
-            self.root.update_idletasks()
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
+        윈도우 크기는 고정값(WINDOW_W x WINDOW_H)을 사용하므로
+        update_idletasks()로 레이아웃을 계산할 필요가 없습니다.
+        """
+        # 최초 조회 후 캐시 (InitDialog와 같은 기준)
+        screen_width, screen_height = get_screen_size(self.root)
 
         # 중앙 좌표 계산
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
+        x = (screen_width - self.WINDOW_W) // 2
+        y = (screen_height - self.WINDOW_H) // 2
 
         # 크기와 위치를 함께 설정
-        self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        self.root.geometry(f"{self.WINDOW_W}x{self.WINDOW_H}+{x}+{y}")
 
     def setup_ui(self) -> None:
         """
@@ -302,6 +642,9 @@ class MainWindow:
         3. 교시별 상태 영역 (1~8교시 + 퇴실)
         4. 하단 버튼 영역 (저장 경로/폴더 열기)
         """
+        # ttk 스타일 등록
+        self._configure_styles()
+
         # 메인 프레임
         main_frame = ttk.Frame(self.root, padding="30 30 30 30")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -318,6 +661,25 @@ class MainWindow:
         # 4. 하단 버튼 영역
         self._create_bottom_buttons(main_frame)
 
+    def _configure_styles(self) -> None:
+        """
+        메인 윈도우에서 반복 사용하는 ttk 스타일을 한 번에 등록합니다.
+
+        교시 표의 레이블 9행과 정보/인원 영역 레이블이 폰트/색상을
+        위젯마다 지정하지 않고 스타일 이름으로 공유합니다.
+        """
+        style = ttk.Style(self.root)
+        style.configure("InfoLine.TLabel", font=("Segoe UI Emoji", 14))
+        style.configure("Field.TLabel", font=("", 12))
+        style.configure("Help.TLabel", font=("", 11), foreground="gray")
+        style.configure("Threshold.TLabel", font=("", 12), foreground="blue")
+        style.configure("PeriodInfo.TLabel", font=("", 11, "bold"))
+        style.configure("PeriodWindow.TLabel", font=("", 10), foreground="gray")
+        style.configure("PeriodStatus.TLabel", font=("Segoe UI Emoji", 10))
+        style.configure("ToastInfo.TLabel", font=("", 11))
+        style.configure("ToastWarning.TLabel", font=("", 11), foreground="darkorange")
+        style.configure("ToastError.TLabel", font=("", 11), foreground="red")
+
     def run(self) -> None:
         """
         메인 윈도우를 실행합니다.
@@ -352,40 +714,53 @@ class MainWindow:
         """
         프로그램 종료 시 리소스 정리.
 
-        - Scheduler 중지
+        - 변경된 설정 저장
+        - Scheduler 중지 및 캡처 작업 풀 종료 (진행 중인 캡처 → 저장 순으로 마무리)
+        - ScreenCapture(mss) 해제 (캡처 작업 스레드에서)
         - FaceDetector 메모리 해제
         - 기타 리소스 정리
+        - 대기 중인 CSV 로그 기록
         """
         logger.info("=" * 60)
         logger.info("리소스 정리 시작")
         logger.info("=" * 60)
 
-        # 1. Scheduler 중지
+        # 새 캡처 요청과 대기 중인 캡처 작업은 여기서부터 무시
+        self._shutting_down = True
+
+        # 1. 변경된 설정 저장 (반영 대기 중이거나 Enter 없이 입력한 학생 수 포함)
+        self._on_student_count_entered()
+        self._flush_config()
+
+        # 2. Scheduler 중지
         if self.scheduler is not None:
             try:
                 logger.info("Scheduler 중지 중...")
                 self.scheduler.stop()
                 logger.info("Scheduler 중지 완료")
             except Exception as e:
-                logger.error(f"Scheduler 중지 실패: {e}", exc_info=True)
-
-        # 2. FaceDetector 메모리 해제
-        if self.detector is not None:
+                logger.error("Scheduler 중지 실패: %s", e, exc_info=True)
+
+        # 캡처 작업 풀 종료: 대기 중인 캡처는 바로 끝나고, 진행 중인 캡처는 최대
+        # _CAPTURE_SHUTDOWN_TIMEOUT초 기다린 뒤 같은 스레드에서 mss 핸들 해제
+        # (캡처 스레드는 하나이므로 해제 작업이 끝나면 앞선 캡처도 모두 끝난 상태)
+        close_future = self._capture_pool.submit(self._close_capture)
+        self._capture_pool.shutdown(wait=False)
+        _, not_done = wait([close_future], timeout=self._CAPTURE_SHUTDOWN_TIMEOUT)
+        capture_finished = not not_done
+        if not capture_finished:
+            logger.warning("진행 중인 캡처가 %s초 안에 끝나지 않아 기다리지 않습니다.", self._CAPTURE_SHUTDOWN_TIMEOUT)
+        # 캡처가 넘긴 이미지 저장까지 마무리 (CSV 로그 종료 전에)
+        self._save_pool.shutdown(wait=True)
+
+        # 3. FaceDetector 메모리 해제 (캡처가 아직 감지 모델을 쓰고 있으면 프로세스 종료에 맡김)
+        if self.detector is not None and capture_finished:
             try:
                 logger.info("FaceDetector 메모리 해제 중...")
                 self.detector.cleanup()
                 logger.info("FaceDetector 메모리 해제 완료")
             except Exception as e:
-                logger.error(f"FaceDetector cleanup 실패: {e}", exc_info=True)
-
-        # 3. ScreenCapture 정리 (필요 시)
-        if self.capture is not None:
-            try:
-                logger.info("ScreenCapture 리소스 해제")
-                # ScreenCapture는 별도 cleanup 메서드가 없으므로 None 처리
-                self.capture = None
-            except Exception as e:
-                logger.error(f"ScreenCapture 정리 실패: {e}", exc_info=True)
+                logger.error("FaceDetector cleanup 실패: %s", e, exc_info=True)
 
         # 4. FileManager 정리 (필요 시)
         if self.file_manager is not None:
@@ -394,12 +769,59 @@ class MainWindow:
                 # FileManager는 별도 cleanup 메서드가 없으므로 None 처리
                 self.file_manager = None
             except Exception as e:
-                logger.error(f"FileManager 정리 실패: {e}", exc_info=True)
+                logger.error("FileManager 정리 실패: %s", e, exc_info=True)
+
+        # 5. 대기 중인 CSV 로그 기록 (캡처/저장 작업이 모두 끝난 뒤 종료 신호)
+        self._log_closed = True
+        self._log_queue.put(None)
+        self._log_writer.join(timeout=5)
 
         logger.info("=" * 60)
         logger.info("리소스 정리 완료")
         logger.info("=" * 60)
 
+    # ==================== Config Persistence ====================
+
+    def _config_set_lazy(self, key: str, value: Any) -> None:
+        """
+        설정 값을 메모리에 반영하고 파일 저장은 1초 뒤로 미룹니다.
+
+        Config.set()은 호출할 때마다 config.json을 다시 쓰므로,
+        연속된 UI 변경은 마지막 변경 1초 후 한 번만 저장합니다.
+        종료 시에는 cleanup()에서 즉시 저장합니다.
+
+        Args:
+            key: 설정 키
+            value: 설정 값
+        """
+        self.config_manager.data[key] = value
+        self._config_dirty.add(key)
+        logger.info("설정 값 변경 (저장 대기): %s = %s", key, value)
+
+        if self._config_flush_id is not None:
+            self.root.after_cancel(self._config_flush_id)
+        self._config_flush_id = self.root.after(1000, self._flush_config)
+
+    def _flush_config(self) -> None:
+        """
+        저장 대기 중인 설정 변경을 config.json에 한 번에 저장합니다.
+        """
+        if self._config_flush_id is not None:
+            self.root.after_cancel(self._config_flush_id)
+            self._config_flush_id = None
+
+        if not self._config_dirty:
+            return
+
+        try:
+            self.config_manager.save(self.config_manager.data)
+            logger.info("설정 저장 완료: %s", sorted(self._config_dirty))
+        except Exception as e:
+            logger.error("설정 저장 실패: %s", e, exc_info=True)
+            # 저장 실패 시 메모리에는 남아있음
+        finally:
+            self._config_dirty.clear()
+
     # ==================== Info Section ====================
 
     def _create_info_section(self, parent: ttk.Frame) -> None:
@@ -424,7 +846,7 @@ class MainWindow:
         date_label = ttk.Label(
             section_frame,
             textvariable=self.date_var,
-            font=("Segoe UI Emoji", 14)
+            style="InfoLine.TLabel"
         )
         date_label.pack(anchor=tk.W, pady=(0, 10))
 
@@ -433,10 +855,22 @@ class MainWindow:
         time_label = ttk.Label(
             section_frame,
             textvariable=self.time_var,
-            font=("Segoe UI Emoji", 14)
+            style="InfoLine.TLabel"
         )
         time_label.pack(anchor=tk.W, pady=(0, 10))
 
+        self._date_var_name = str(self.date_var)
+        self._time_var_name = str(self.time_var)
+
+        # 상태 표시 (Features 초기화 진행 상황)
+        self.init_status_var = tk.StringVar(value="⏳ 상태: 초기화 중...")
+        status_label = ttk.Label(
+            section_frame,
+            textvariable=self.init_status_var,
+            style="InfoLine.TLabel"
+        )
+        status_label.pack(anchor=tk.W, pady=(0, 10))
+
         # 캡처 모니터 표시
         self._create_monitor_display(section_frame)
 
@@ -455,7 +889,7 @@ class MainWindow:
         monitor_label = ttk.Label(
             monitor_frame,
             text="🖥️ 캡처 모니터:",
-            font=("Segoe UI Emoji", 14)
+            style="InfoLine.TLabel"
         )
         monitor_label.pack(side=tk.LEFT, padx=(0, 5))
 
@@ -464,40 +898,83 @@ class MainWindow:
         monitor_combo = ttk.Combobox(
             monitor_frame,
             textvariable=self.monitor_var,
-            values=get_monitor_names(),
+            values=self._monitor_names,
             state="readonly",
             width=15,
-            font=("", 14)
+            font=("", 14),
+            postcommand=self._refresh_monitor_names
         )
         monitor_combo.pack(side=tk.LEFT)
         monitor_combo.bind("<<ComboboxSelected>>", self._on_monitor_change)
+        self._monitor_combo = monitor_combo
+
+    def _refresh_monitor_names(self) -> None:
+        """
+        모니터 콤보박스를 펼칠 때 모니터 목록을 다시 조회합니다 (UI 스레드).
+
+        새로 연결/분리한 모니터가 캐시 유효 시간(60초) 동안 보이지 않는 것을 막기 위해
+        캐시를 비우고 조회합니다. 조회에 실패하면(빈 목록) 기존 목록을 유지합니다.
+        """
+        invalidate_monitor_cache()
+        names = get_monitor_names()
+        if not names or names == self._monitor_names:
+            return
+
+        logger.info("모니터 목록 변경: %s → %s", self._monitor_names, names)
+        self._monitor_names = names
+        if self._monitor_combo is not None:
+            self._monitor_combo.configure(values=names)
 
     def update_time(self) -> None:
         """
         현재 날짜와 시간을 업데이트합니다.
 
-        1초마다 자동으로 호출되어 실시간으로 갱신됩니다.
-        캡처 시간대가 지난 교시는 자동으로 "⏰ 시간 초과"로 변경합니다.
+        매 초 경계에 맞춰 자동으로 호출되어 실시간으로 갱신됩니다.
+        날짜는 바뀐 경우에만, 시간은 초가 바뀐 경우에만 다시 설정합니다.
+        (타이머 해상도 때문에 같은 초 안에 다시 호출되어도 레이블을 다시 그리지 않음)
+        시간 초과 확인은 _on_timeout_due()가 초과 시각에 맞춰 따로 수행합니다.
         """
         try:
-            now = datetime.now()
-            self.date_var.set(f"📅 날짜: {now.strftime('%Y-%m-%d')}")
-            self.time_var.set(f"🕐 시간: {now.strftime('%H:%M:%S')}")
-
-            # 시간 초과된 교시 체크
-            self._check_timeout_periods(now)
+            # 매 초 경로는 datetime 객체 없이 C 구조체(struct_time)만 사용
+            epoch = time.time()
+            second = int(epoch)
+            if second == self._last_second:
+                return
+            self._last_second = second
+            lt = time.localtime(second)
+            # 고정 ASCII 형식이므로 strftime 대신 정수 포맷 사용
+            # 매 초 실행되므로 StringVar.set() 대신 Tcl 변수를 직접 설정
+            setvar = self.root.tk.globalsetvar
+            if lt.tm_mday != self._last_day:
+                self._last_day = lt.tm_mday
+                setvar(
+                    self._date_var_name,
+                    f"{self._DATE_PREFIX}{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d}"
+                )
+            setvar(
+                self._time_var_name,
+                f"{self._TIME_PREFIX}{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+            )
 
         except Exception as e:
-            logger.error(f"시간 업데이트 실패: {e}")
+            logger.error("시간 업데이트 실패: %s", e)
+        finally:
+            self._schedule_next_tick()
 
-        # 1초 후 재호출
-        self.root.after(1000, self.update_time)
+    def _schedule_next_tick(self) -> None:
+        """
+        다음 초 경계에 update_time()을 예약합니다.
+        """
+        # 다음 초 경계에 재호출 (고정 1000ms 재예약 시 누적되는 지연 방지)
+        delay = max(1, 1000 - int(time.time() % 1 * 1000))
+        self.root.after(delay, self.update_time)
 
     def _on_monitor_change(self, event=None) -> None:
         """
         모니터 변경 콤보박스 이벤트 핸들러.
 
-        선택된 모니터로 ScreenCapture를 재생성하고 설정을 저장합니다.
+        선택된 모니터를 검증하고 설정을 저장합니다.
+        ScreenCapture는 다음 캡처 때 캡처 작업 스레드에서 재생성됩니다.
         실패 시 기존 모니터로 롤백합니다.
 
         Args:
@@ -513,14 +990,18 @@ class MainWindow:
                 logger.info("동일한 모니터 선택됨")
                 return
 
-            logger.info(f"모니터 변경 시도: 모니터 {self.monitor_id} → 모니터 {new_monitor_id}")
+            logger.info("모니터 변경 시도: 모니터 %s → 모니터 %s", self.monitor_id, new_monitor_id)
 
-            # 3. ScreenCapture 재생성 (임시 인스턴스로 검증)
+            # 3. 임시 인스턴스로 모니터 검증 (UI 스레드에서 만든 mss 핸들은 여기서 바로 해제)
             try:
                 temp_capture = ScreenCapture(monitor_id=new_monitor_id)
-                logger.info(f"ScreenCapture 재생성 완료: 모니터 {new_monitor_id}")
+                try:
+                    temp_capture.get_monitor_info()
+                finally:
+                    temp_capture.close()
+                logger.info("모니터 검증 완료: 모니터 %s", new_monitor_id)
             except Exception as e:
-                logger.error(f"ScreenCapture 재생성 실패: {e}", exc_info=True)
+                logger.error("ScreenCapture 재생성 실패: %s", e, exc_info=True)
                 # 롤백: 콤보박스를 기존 모니터로 복구
                 self.monitor_var.set(f"모니터 {self.monitor_id}")
                 messagebox.showerror(
@@ -529,27 +1010,46 @@ class MainWindow:
                 )
                 return
 
-            # 4. 검증 통과 후 실제 적용
+            # 4. 검증 통과 후 실제 적용 (ScreenCapture는 다음 캡처 때 캡처 작업 스레드에서 재생성)
             old_monitor_id = self.monitor_id
             self.monitor_id = new_monitor_id
-            self.capture = temp_capture
 
             # 5. Config 저장
-            self.config_manager.set('monitor_id', new_monitor_id)
+            self._config_set_lazy('monitor_id', new_monitor_id)
 
             # 6. 성공 메시지
             messagebox.showinfo(
                 "변경 완료",
                 f"캡처 모니터가 모니터 {new_monitor_id}로 변경되었습니다."
             )
-            logger.info(f"모니터 변경 완료: 모니터 {old_monitor_id} → 모니터 {new_monitor_id}")
+            logger.info("모니터 변경 완료: 모니터 %s → 모니터 %s", old_monitor_id, new_monitor_id)
 
         except Exception as e:
-            logger.error(f"모니터 변경 처리 실패: {e}", exc_info=True)
+            logger.error("모니터 변경 처리 실패: %s", e, exc_info=True)
             # 롤백: 콤보박스를 기존 모니터로 복구
             self.monitor_var.set(f"모니터 {self.monitor_id}")
             messagebox.showerror("오류", f"모니터 변경 중 오류가 발생했습니다.\n\n{e}")
 
+    def _on_timeout_due(self) -> None:
+        """
+        시간 초과된 교시를 처리하고 다음 초과 시각에 다시 예약합니다.
+
+        매 초/매 분 확인하지 않고, 대기열 맨 앞의 초과 시각(모두 지났으면
+        다음 날 0시, 대기열 재생성용)에 한 번만 실행됩니다.
+        타이머가 일찍 실행되면 아무것도 꺼내지 않고 남은 시간만큼 다시 예약합니다.
+        """
+        now = datetime.now()
+        self._check_timeout_periods(now)
+
+        if self._timeout_queue:
+            due = self._timeout_queue[0][0]
+        else:
+            tomorrow = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+            due = tomorrow.timestamp()
+
+        delay_ms = max(1, int((due - time.time()) * 1000))
+        self.root.after(delay_ms, self._on_timeout_due)
+
     def _check_timeout_periods(self, now: datetime) -> None:
         """
         캡처 시간대가 지난 교시를 확인하고 "⏰ 시간 초과"로 변경합니다.
@@ -558,29 +1058,20 @@ class MainWindow:
             now: 현재 시간
         """
         try:
-            current_hour = now.hour
-            current_minute = now.minute
-
-            for period, (end_hour, end_minute) in self.period_end_times.items():
-                # 현재 상태 확인
-                current_status = self.period_status_vars.get(period)
-                if not current_status:
-                    continue
-
-                status_text = current_status.get()
-
-                # 이미 완료, 건너뛰기, 시간 초과 상태면 변경하지 않음
-                if "완료" in status_text or "건너뛰기" in status_text or "시간 초과" in status_text:
-                    continue
-
-                # 현재 시간이 캡처 종료 시간을 지났는지 확인
-                if (current_hour > end_hour or
-                    (current_hour == end_hour and current_minute > end_minute)):
-                    # 대기중 상태만 시간 초과로 변경 (감지중은 그대로 유지)
-                    if "대기중" in status_text:
-                        self.update_period_status(period, "시간 초과")
+            # 날짜가 바뀌면 대기열 재생성
+            if now.date() != self._timeout_date:
+                self._build_timeout_queue(now)
+
+            # 초과 시각이 지난 교시만 앞에서부터 꺼냄 (모두 꺼낸 뒤에는 즉시 반환)
+            pending = self._timeout_queue
+            now_epoch = now.timestamp()
+            while pending and pending[0][0] <= now_epoch:
+                _, period = pending.pop(0)
+                # 대기중 상태만 시간 초과로 변경 (완료/건너뛰기/감지중은 그대로 유지)
+                if self._period_status_code.get(period) == STATUS_WAITING:
+                    self.update_period_status(period, self._ST_TIMEOUT)
         except Exception as e:
-            logger.error(f"시간 초과 교시 체크 실패: {e}")
+            logger.error("시간 초과 교시 체크 실패: %s", e)
 
     # ==================== Personnel Section ====================
 
@@ -630,7 +1121,7 @@ class MainWindow:
         mode_label = ttk.Label(
             mode_frame,
             text="캡처 모드:",
-            font=("", 12)
+            style="Field.TLabel"
         )
         mode_label.pack(side=tk.LEFT, padx=(0, 10))
 
@@ -672,17 +1163,20 @@ class MainWindow:
         label = ttk.Label(
             input_frame,
             text="출석 학생 수:",
-            font=("", 12)
+            style="Field.TLabel"
         )
         label.pack(side=tk.LEFT, padx=(0, 10))
 
         # 학생 수 변수 초기화
         self.student_count_var = tk.IntVar(value=self.student_count)
 
-        # 입력 필드
+        # 입력 필드 (숫자 1~100 이외의 키 입력은 Tk에서 바로 거부)
+        validate_command = (self.root.register(self._validate_student_count), "%P")
         count_entry = ttk.Entry(
             input_frame,
             textvariable=self.student_count_var,
+            validate="key",
+            validatecommand=validate_command,
             width=8,
             justify=tk.CENTER,
             font=("", 12)
@@ -700,8 +1194,7 @@ class MainWindow:
         help_label = ttk.Label(
             input_frame,
             text="명 (1~100)",
-            font=("", 11),
-            foreground="gray"
+            style="Help.TLabel"
         )
         help_label.pack(side=tk.LEFT, padx=(5, 0))
 
@@ -737,20 +1230,16 @@ class MainWindow:
         Args:
             parent: 부모 프레임
         """
-        # 기준 인원 계산
-        threshold = self.student_count + 1
-
         # 기준 인원 레이블
         self.threshold_label = ttk.Label(
             parent,
-            text=f"기준 인원: {threshold}명 (학생 {self.student_count}명 + 강사 1명)",
-            font=("", 12),
-            foreground="blue"
+            text=f"기준 인원: {self._threshold}명 (학생 {self.student_count}명 + 강사 1명)",
+            style="Threshold.TLabel"
         )
         self.threshold_label.pack(anchor=tk.W)
 
-        # 학생 수 변경 시 자동 업데이트
-        self.student_count_var.trace_add("write", self._on_student_count_change)
+        # 학생 수 변경은 ▲▼ 버튼과 Enter/포커스 아웃에서 명시적으로 반영
+        # (키 입력마다 호출되는 trace는 사용하지 않음)
 
     def _on_mode_change(self, event=None) -> None:
         """
@@ -768,14 +1257,15 @@ class MainWindow:
             self.mode = "flexible"
         else:
             self.mode = "exact"
+        self._refresh_thresholds()
 
         # Config에 저장
-        self.config_manager.set('mode', self.mode)
+        self._config_set_lazy('mode', self.mode)
 
         # Helper 메서드 호출 (중복 로직 제거)
         self._update_threshold_display()
 
-        logger.info(f"캡처 모드 변경: {mode_text} ({self.mode})")
+        logger.info("캡처 모드 변경: %s (%s)", mode_text, self.mode)
 
     def _on_student_count_entered(self, event=None) -> None:
         """
@@ -784,8 +1274,18 @@ class MainWindow:
         Args:
             event: tkinter 이벤트 객체 (사용하지 않음)
         """
-        student_count = self.student_count_var.get()
-        logger.info(f"학생 수 직접 입력: {student_count}명")
+        # 반영 대기 중인 ▲▼ 변경이 있으면 취소하고 입력값을 바로 반영
+        if self._count_after_id is not None:
+            self.root.after_cancel(self._count_after_id)
+        else:
+            try:
+                if self.student_count_var.get() == self.student_count:
+                    return  # 값 변화 없음 (포커스 이동 등)
+            except tk.TclError:
+                pass  # 빈 입력은 _apply_student_count_change()에서 복원
+
+        self._apply_student_count_change()
+        logger.info("학생 수 직접 입력: %s명", self.student_count)
 
     def _increment_student_count(self) -> None:
         """
@@ -796,7 +1296,8 @@ class MainWindow:
         current_value = self.student_count_var.get()
         if current_value < 100:
             self.student_count_var.set(current_value + 1)
-            logger.info(f"학생 수 증가: {current_value} → {current_value + 1}")
+            self._on_student_count_change()
+            logger.info("학생 수 증가: %s → %s", current_value, current_value + 1)
 
     def _decrement_student_count(self) -> None:
         """
@@ -807,52 +1308,64 @@ class MainWindow:
         current_value = self.student_count_var.get()
         if current_value > 1:
             self.student_count_var.set(current_value - 1)
-            logger.info(f"학생 수 감소: {current_value} → {current_value - 1}")
+            self._on_student_count_change()
+            logger.info("학생 수 감소: %s → %s", current_value, current_value - 1)
 
     def _on_student_count_change(self, *args) -> None:
         """
-        학생 수 변경 시 호출되는 콜백 함수.
+        ▲▼ 버튼으로 학생 수가 바뀌었을 때 호출됩니다.
 
-        trace_add 콜백으로 사용되며,
-        기준 인원을 모드별로 자동 재계산합니다.
+        ▲▼ 연속 클릭으로 값이 연달아 바뀌면 마지막 변경 후 150ms 뒤에
+        한 번만 _apply_student_count_change()를 실행합니다.
 
         Args:
-            *args: trace_add 콜백에서 전달되는 인자 (사용하지 않음)
+            *args: 사용하지 않음
+        """
+        if self._count_after_id is not None:
+            self.root.after_cancel(self._count_after_id)
+        self._count_after_id = self.root.after(150, self._apply_student_count_change)
+
+    def _apply_student_count_change(self) -> None:
         """
+        변경된 학생 수를 반영합니다.
+
+        입력값은 Entry의 키 입력 검증과 ▲▼ 버튼에서 이미 1~100으로 제한되므로
+        설정에 저장한 뒤 기준 인원을 모드별로 재계산합니다.
+        """
+        self._count_after_id = None
         try:
-            # 현재 입력값 가져오기
             new_count = self.student_count_var.get()
+        except tk.TclError:
+            # 입력칸이 비어 있으면 (키 입력 검증으로 그 외 값은 들어올 수 없음) 기존 값으로 복원
+            self.student_count_var.set(self.student_count)
+            return
 
-            # 범위 검증
-            if new_count < 1:
-                new_count = 1
-                self.student_count_var.set(1)
-            elif new_count > 100:
-                new_count = 100
-                self.student_count_var.set(100)
+        # 인스턴스 변수 업데이트
+        self.student_count = new_count
+        self._refresh_thresholds()
 
-            # 인스턴스 변수 업데이트
-            self.student_count = new_count
+        # Config에 저장
+        self._config_set_lazy('student_count', new_count)
 
-            # Config에 저장
-            self.config_manager.set('student_count', new_count)
+        # Helper 메서드 호출 (중복 로직 제거)
+        self._update_threshold_display()
 
-            # Helper 메서드 호출 (중복 로직 제거)
-            self._update_threshold_display()
+        logger.info("학생 수 변경: %s명 (기준: %s명, 모드: %s)", new_count, self._threshold, self.mode)
 
-            logger.info(f"학생 수 변경: {new_count}명 (기준: {new_count + 1}명, 모드: {self.mode})")
+    @staticmethod
+    def _validate_student_count(proposed: str) -> bool:
+        """
+        학생 수 입력칸의 키 입력을 검증합니다 (Entry validatecommand).
 
-        except Exception as e:
-            logger.error(f"학생 수 변경 처리 실패: {e}")
-            # 기본값으로 복구
-            try:
-                self.student_count_var.set(1)
-                self.student_count = 1
-                self.threshold_label.config(
-                    text="기준 인원: 2명 (학생 1명 + 강사 1명)"
-                )
-            except:
-                pass
+        Args:
+            proposed: 키 입력이 반영된 후의 입력칸 문자열 (%P)
+
+        Returns:
+            bool: 허용 여부 (빈 문자열 또는 1~100 사이 숫자)
+        """
+        return proposed == "" or (
+            proposed.isascii() and proposed.isdigit() and 1 <= int(proposed) <= 100
+        )
 
     def _update_threshold_display(self) -> None:
         """
@@ -861,14 +1374,13 @@ class MainWindow:
         Private Helper 메서드로, 학생 수 변경 또는 모드 변경 시 호출됩니다.
         _on_student_count_change()와 _on_mode_change()에서 공통으로 사용합니다.
         """
-        student_count = self.student_count_var.get()
-        threshold = student_count + 1
+        student_count = self.student_count
+        threshold = self._threshold
 
         if self.mode == "flexible":
-            effective_threshold = int(threshold * 0.9)
             self.threshold_label.config(
                 text=f"기준 인원: {threshold}명 (학생 {student_count}명 + 강사 1명)\n"
-                     f"유연 모드: {effective_threshold}명 이상"
+                     f"유연 모드: {self._min_required}명 이상"
             )
         else:
             self.threshold_label.config(
@@ -876,13 +1388,32 @@ class MainWindow:
                      f"정확 모드: 정확히 {threshold}명"
             )
 
+    def _refresh_thresholds(self) -> None:
+        """
+        현재 학생 수와 모드로 기준 인원, 최소 감지 인원, 모드 설명을 다시 계산합니다.
+
+        모드 문자열 비교도 여기서 한 번만 수행하여 _exact_match에 저장합니다.
+        (flexible 이외의 값은 정확 모드로 처리)
+
+        - 정확 모드: 최소 감지 인원 = 기준 인원
+        - 유연 모드: 최소 감지 인원 = int(기준 인원 × 0.9)
+        """
+        self._threshold = self.student_count + 1
+        self._exact_match = self.mode != "flexible"
+        if self._exact_match:
+            self._min_required = self._threshold
+            self._mode_note = "정확 모드"
+        else:
+            self._min_required = int(self._threshold * 0.9)
+            self._mode_note = f"유연 모드 (최소 {self._min_required}명)"
+
     # ==================== Period Section ====================
 
     def _create_period_section(self, parent: ttk.Frame) -> None:
         """
         교시별 상태 영역을 생성합니다.
 
-        1~8교시 + 퇴실 (총 9개 항목)의 상태를 표시합니다.
+        1~8교시 + 퇴실 (총 9개 항목)의 상태를 하나의 grid 표로 표시합니다.
 
         Args:
             parent: 부모 프레임
@@ -896,27 +1427,31 @@ class MainWindow:
         section_frame.pack(fill=tk.X, expand=False, pady=(0, 15))
 
         # 교시 정보 (교시 번호, 시작 시간, 종료 시간, 캡처 시간대)
-        periods = [
-            (1, "09:30", "10:20", "09:30~09:45"),
-            (2, "10:30", "11:20", "10:30~10:45"),
-            (3, "11:30", "12:20", "11:30~11:45"),
-            (4, "12:30", "13:20", "12:30~12:45"),
-            (5, "14:30", "15:20", "14:30~14:45"),
-            (6, "15:30", "16:20", "15:30~15:45"),
-            (7, "16:30", "17:20", "16:30~16:45"),
-            (8, "17:30", "18:20", "17:30~17:45"),
-            (0, "18:30", "-", "18:30~18:32")  # 퇴실 (period=0)
-        ]
+        periods = []
+        for period, start, capture_end in PERIOD_SCHEDULE:
+            if period == 0:
+                end = "-"  # 퇴실은 종료 시간 없음
+            else:
+                start_hour, start_minute = _parse_hhmm(start)
+                end_total = start_hour * 60 + start_minute + CLASS_DURATION_MINUTES
+                end = f"{end_total // 60:02d}:{end_total % 60:02d}"
+            periods.append((period, start, end, f"{start}~{capture_end}"))
+
+        # 교시 표 (열: 교시 정보 | 캡처 시간대 | 상태 | 건너뛰기 | 재시도)
+        table = ttk.Frame(section_frame)
+        table.pack(fill=tk.X)
+        table.columnconfigure(2, weight=1)  # 남는 폭은 상태 열에 배정
 
         # 각 교시별 행 생성
-        for period, start, end, capture_window in periods:
+        for row, (period, start, end, capture_window) in enumerate(periods):
             self._create_period_row(
-                section_frame, period, start, end, capture_window
+                table, row, period, start, end, capture_window
             )
 
     def _create_period_row(
         self,
-        parent: ttk.LabelFrame,
+        parent: ttk.Frame,
+        row: int,
         period: int,
         start_time: str,
         end_time: str,
@@ -926,91 +1461,87 @@ class MainWindow:
         개별 교시의 상태 표시 행을 생성합니다.
 
         Args:
-            parent: 부모 프레임
+            parent: 교시 표 프레임
+            row: 표의 행 번호
             period: 교시 번호 (0=퇴실, 1~8=교시)
             start_time: 시작 시간
             end_time: 종료 시간
             capture_window: 캡처 시간대
         """
-        # 교시 행 프레임
-        row_frame = ttk.Frame(parent)
-        row_frame.pack(fill=tk.X, pady=(0, 8))
-
         # 교시 정보 및 캡처 시간대 표시
-        self._create_period_info_labels(row_frame, period, start_time, end_time, capture_window)
+        self._create_period_info_labels(parent, row, period, start_time, end_time, capture_window)
 
         # 상태 표시 레이블
-        self._create_period_status_label(row_frame, period)
+        self._create_period_status_label(parent, row, period)
 
         # 건너뛰기/재시도 버튼
-        self._create_period_buttons(row_frame, period)
+        self._create_period_buttons(parent, row, period)
 
     def _create_period_info_labels(
         self,
         parent: ttk.Frame,
+        row: int,
         period: int,
         start_time: str,
         end_time: str,
         capture_window: str
     ) -> None:
         """
-        교시 정보 및 캡처 시간대 레이블을 생성합니다.
+        교시 정보 및 캡처 시간대 레이블을 생성합니다 (0~1열).
 
         Args:
-            parent: 부모 프레임
+            parent: 교시 표 프레임
+            row: 표의 행 번호
             period: 교시 번호
             start_time: 시작 시간
             end_time: 종료 시간
             capture_window: 캡처 시간대
         """
         # 교시 이름
-        period_name = "퇴실" if period == 0 else f"{period}교시"
+        period_name = _PERIOD_NAMES[period]
 
         # 교시 정보 레이블
         info_text = f"{period_name} ({start_time}~{end_time})"
-        info_label = ttk.Label(
-            parent,
-            text=info_text,
-            font=("", 11, "bold"),
-            width=25
-        )
-        info_label.pack(side=tk.LEFT, padx=(0, 10))
+        info_label = ttk.Label(parent, text=info_text, style="PeriodInfo.TLabel")
+        info_label.grid(row=row, column=0, sticky="w", padx=(0, 10), pady=(0, 8))
 
         # 캡처 시간대 레이블
         window_label = ttk.Label(
             parent,
             text=f"[{capture_window}]",
-            font=("", 10),
-            foreground="gray",
-            width=18
+            style="PeriodWindow.TLabel"
         )
-        window_label.pack(side=tk.LEFT, padx=(0, 15))
+        window_label.grid(row=row, column=1, sticky="w", padx=(0, 15), pady=(0, 8))
 
-    def _create_period_status_label(self, parent: ttk.Frame, period: int) -> None:
+    def _create_period_status_label(self, parent: ttk.Frame, row: int, period: int) -> None:
         """
-        교시 상태 표시 레이블을 생성합니다.
+        교시 상태 표시 레이블을 생성합니다 (2열).
 
         Args:
-            parent: 부모 프레임
+            parent: 교시 표 프레임
+            row: 표의 행 번호
             period: 교시 번호
         """
         # 상태 표시 레이블 (Segoe UI Emoji 폰트로 컬러 이모지 표시)
-        status_var = tk.StringVar(value="🕒 대기중")
+        status_var = tk.StringVar(value=self._ST_WAITING)
         self.period_status_vars[period] = status_var
+        self._period_status_code[period] = STATUS_WAITING
+        self._period_status_cache[period] = self._ST_WAITING
         status_label = ttk.Label(
             parent,
             textvariable=status_var,
-            font=("Segoe UI Emoji", 10),
-            width=15
+            style="PeriodStatus.TLabel",
+            width=15  # 상태 문자열 길이가 바뀌어도 열 폭 유지
         )
-        status_label.pack(side=tk.LEFT, padx=(0, 10))
+        status_label.grid(row=row, column=2, sticky="w", padx=(0, 10), pady=(0, 8))
 
-    def _create_period_buttons(self, parent: ttk.Frame, period: int) -> None:
+    def _create_period_buttons(self, parent: ttk.Frame, row: int, period: int) -> None:
         """
-        교시별 건너뛰기/재시도 버튼을 생성합니다.
+        교시별 건너뛰기/재시도 버튼을 생성합니다 (3~4열).
 
         Args:
-            parent: 부모 프레임
+            parent: 교시 표 프레임
+            row: 표의 행 번호
             period: 교시 번호
         """
         # [건너뛰기] 버튼
@@ -1018,18 +1549,51 @@ class MainWindow:
             parent,
             text="건너뛰기",
             width=10,
-            command=lambda p=period: self.on_skip_button(p)
+            command=partial(self._on_skip_clicked, period)
         )
-        skip_button.pack(side=tk.LEFT, padx=(0, 5))
+        skip_button.grid(row=row, column=3, padx=(0, 5), pady=(0, 8))
 
         # [재시도] 버튼
         retry_button = ttk.Button(
             parent,
             text="재시도",
             width=10,
-            command=lambda p=period: self.on_retry_button(p)
+            command=partial(self.on_retry_button, period)
         )
-        retry_button.pack(side=tk.LEFT)
+        retry_button.grid(row=row, column=4, pady=(0, 8))
+
+        self._period_buttons[period] = (skip_button, retry_button)
+
+    def _on_skip_clicked(self, period: int) -> None:
+        """
+        건너뛰기 버튼 클릭 시 연속 클릭을 막고 on_skip_button()을 호출합니다.
+
+        처리 후 500ms 동안 버튼을 비활성화하여 더블 클릭으로
+        CSV 로그가 중복 기록되지 않도록 합니다.
+
+        Args:
+            period: 교시 번호
+        """
+        skip_button = self._period_buttons[period][0]
+        skip_button.state(["disabled"])
+        try:
+            self.on_skip_button(period)
+        finally:
+            self.root.after(500, skip_button.state, ["!disabled"])
+
+    def _set_retry_enabled(self, period: int, enabled: bool) -> None:
+        """
+        재시도 버튼을 활성화/비활성화합니다.
+
+        캡처가 진행 중인 동안에는 재시도 버튼을 비활성화합니다.
+
+        Args:
+            period: 교시 번호
+            enabled: 활성화 여부
+        """
+        buttons = self._period_buttons.get(period)
+        if buttons is not None:
+            buttons[1].state(["!disabled"] if enabled else ["disabled"])
 
     def update_period_status(self, period: int, status: str) -> None:
         """
@@ -1044,6 +1608,7 @@ class MainWindow:
                    - "실패 (18/22명)" → "❌ 실패 (18/22명)"
                    - "건너뛰기" → "⏭️ 건너뛰기"
                    - "시간 초과" → "⏰ 시간 초과"
+                   고정 상태는 _ST_* 상수(이모지 포함)를 그대로 전달합니다.
 
         Example:
             >>> window.update_period_status(1, "완료 (09:32)")
@@ -1051,15 +1616,26 @@ class MainWindow:
         """
         try:
             if period in self.period_status_vars:
-                # 이모지 자동 추가
-                formatted_status = self._format_status_with_emoji(status)
+                # 같은 상태면 StringVar 갱신(Tcl trace, 다시 그리기) 생략
+                if self._period_status_cache.get(period) == status:
+                    return
+                self._period_status_cache[period] = status
+
+                # 고정 상태(_ST_*)와 이전에 표시한 상태는 캐시에서 바로 조회
+                rendered = self._status_render_cache.get(status)
+                if rendered is None:
+                    # 이모지 자동 추가
+                    rendered = (self._format_status_with_emoji(status), self._get_status_code(status))
+                    if len(self._status_render_cache) < self._STATUS_RENDER_CACHE_MAX:
+                        self._status_render_cache[status] = rendered
+                formatted_status, status_code = rendered
                 self.period_status_vars[period].set(formatted_status)
-                period_name = "퇴실" if period == 0 else f"{period}교시"
-                logger.info(f"{period_name} 상태 변경: {formatted_status}")
+                self._period_status_code[period] = status_code
+                logger.debug("%s 상태 변경: %s", _PERIOD_NAMES[period], formatted_status)
             else:
-                logger.warning(f"존재하지 않는 교시 번호: {period}")
+                logger.warning("존재하지 않는 교시 번호: %s", period)
         except Exception as e:
-            logger.error(f"교시 상태 업데이트 실패 (교시 {period}): {e}")
+            logger.error("교시 상태 업데이트 실패 (교시 %s): %s", period, e)
 
     def on_skip_button(self, period: int) -> None:
         """
@@ -1071,30 +1647,34 @@ class MainWindow:
         Args:
             period: 교시 번호 (1-8: 교시, 0: 퇴실)
         """
-        period_name = "퇴실" if period == 0 else f"{period}교시"
-        logger.info(f"건너뛰기 버튼 클릭: {period_name}")
+        period_name = _PERIOD_NAMES[period]
+        logger.info("건너뛰기 버튼 클릭: %s", period_name)
+
+        if not self._check_features_ready(period_name):
+            return
 
         try:
-            # 1. Scheduler에서 해당 교시 건너뛰기
+            # 1. Scheduler에서 해당 교시 건너뛰기 (진행 중인 캡처 결과는 반영하지 않음)
             self.scheduler.skip_period(period)
+            self._bump_period_generation(period)
 
             # 2. 상태 업데이트
-            self.update_period_status(period, "건너뛰기")
+            self.update_period_status(period, self._ST_SKIPPED)
 
             # 3. CSV 로그 기록
-            self.csv_logger.log_event(
+            self._enqueue_log(
                 period=period_name,
                 status="건너뛰기",
                 detected_count=0,
-                threshold_count=self.student_count + 1,
+                threshold_count=self._threshold,
                 filename="",
                 note="사용자가 수동으로 건너뛰기"
             )
 
-            logger.info(f"{period_name} 건너뛰기 완료")
+            logger.info("%s 건너뛰기 완료", period_name)
 
         except Exception as e:
-            logger.error(f"{period_name} 건너뛰기 처리 실패: {e}")
+            logger.error("%s 건너뛰기 처리 실패: %s", period_name, e)
             self.show_alert(
                 title="건너뛰기 실패",
                 message=f"{period_name} 건너뛰기 처리 중 오류가 발생했습니다.\n\n오류: {e}",
@@ -1112,40 +1692,54 @@ class MainWindow:
         Args:
             period: 교시 번호 (1-8: 교시, 0: 퇴실)
         """
-        period_name = "퇴실" if period == 0 else f"{period}교시"
-        logger.info(f"재시도 버튼 클릭: {period_name}")
+        period_name = _PERIOD_NAMES[period]
+        logger.info("재시도 버튼 클릭: %s", period_name)
+
+        if not self._check_features_ready(period_name):
+            return
+
+        # 캡처 진행 중이면 무시 (연속 클릭 방지)
+        if period in self._captures_inflight:
+            logger.info("%s 캡처가 진행 중이어서 재시도를 무시합니다.", period_name)
+            return
+
+        # 저장할 수 없으면 상태/로그를 바꾸기 전에 중단 ("감지중"으로 남지 않도록)
+        if not self._save_target_ok():
+            self._save_blocked_periods.add(period)
+            self._report_save_target_error(period_name)
+            return
 
         try:
             # 1. 캡처 시간대 확인
             is_within = self.scheduler.is_in_capture_window(period)
             time_status = "시간대 내" if is_within else "시간대 종료 후"
-            logger.info(f"{period_name} 재시도: {time_status}")
+            logger.info("%s 재시도: %s", period_name, time_status)
 
             # 2. Scheduler 상태 초기화 (is_completed, is_skipped 플래그 제거)
             self.scheduler.reset_period(period)
+            self._bump_period_generation(period)
 
             # 3. UI 상태 업데이트
-            self.update_period_status(period, "감지중")
+            self.update_period_status(period, self._ST_DETECTING)
 
             # 4. CSV 로그 기록
-            self.csv_logger.log_event(
+            self._enqueue_log(
                 period=period_name,
                 status="재시도 시작",
                 detected_count=0,
-                threshold_count=self.student_count + 1,
+                threshold_count=self._threshold,
                 filename="",
                 note=f"{time_status} 수동 재시도"
             )
 
-            # 5. 캡처 프로세스 즉시 실행
-            # _on_capture_trigger()가 내부에서 is_in_capture_window()를 다시 호출하여
-            # FileManager.save_image()에 is_within_window 전달
-            self._on_capture_trigger(period)
+            # 5. 캡처 프로세스 즉시 시작 (작업 스레드에서 실행)
+            # 1에서 확인한 시간대를 그대로 FileManager.save_image()까지 전달
+            self._on_capture_trigger(period, is_within_window=is_within)
 
-            logger.info(f"{period_name} 재시도 완료")
+            logger.info("%s 재시도 시작", period_name)
 
         except Exception as e:
-            logger.error(f"{period_name} 재시도 처리 실패: {e}")
+            logger.error("%s 재시도 처리 실패: %s", period_name, e)
             self.show_alert(
                 title="재시도 실패",
                 message=f"{period_name} 재시도 처리 중 오류가 발생했습니다.\n\n오류: {e}",
@@ -1192,11 +1786,14 @@ class MainWindow:
         폴더 선택 다이얼로그를 표시하고 저장 경로를 변경합니다.
         """
         try:
-            # 현재 경로를 Path 객체로 변환
-            initial_dir = str(Path(self.save_path))
+            initial_dir = str(self._save_path_obj)
 
-            # 폴더 선택 다이얼로그
+            # 대기 중인 화면 갱신(상태 레이블 등)을 먼저 반영한 뒤 다이얼로그 표시
+            self.root.update_idletasks()
+
+            # 폴더 선택 다이얼로그 (모달 동안에도 Tk 이벤트 루프가 after 콜백을 처리)
             selected_path = filedialog.askdirectory(
+                parent=self.root,
                 title="저장 경로 선택",
                 initialdir=initial_dir
             )
@@ -1204,51 +1801,64 @@ class MainWindow:
             # 경로가 선택되면 업데이트
             if selected_path:
                 # Path 객체로 정규화 후 문자열로 저장
-                normalized_path = str(Path(selected_path))
+                selected_path_obj = Path(selected_path)
+                normalized_path = str(selected_path_obj)
 
-                # FileManager 재생성 (먼저 검증)
+                # FileManager 경로 변경 (새 경로 검증 후 적용, 실패 시 기존 경로 유지)
                 try:
-                    temp_file_manager = FileManager(base_path=normalized_path)
-                    temp_file_manager.ensure_folder_exists()
-                    logger.info("FileManager 재생성 완료")
+                    self._reconfigure_file_manager(normalized_path)
                 except Exception as e:
-                    logger.error(f"FileManager 재생성 실패: {e}", exc_info=True)
+                    logger.error("FileManager 경로 변경 실패: %s", e, exc_info=True)
                     messagebox.showerror(
                         "오류",
-                        f"파일 관리 모듈 재생성 중 오류가 발생했습니다.\n\n{e}"
+                        f"파일 관리 모듈 경로 변경 중 오류가 발생했습니다.\n\n{e}"
                     )
                     return
 
-                # CSVLogger 재생성
-                try:
-                    temp_csv_logger = CSVLogger(base_path=normalized_path)
-                    logger.info("CSVLogger 재생성 완료")
-                except Exception as e:
-                    logger.error(f"CSVLogger 재생성 실패: {e}", exc_info=True)
-                    messagebox.showerror(
-                        "오류",
-                        f"로그 모듈 재생성 중 오류가 발생했습니다.\n\n{e}"
-                    )
-                    return
+                # CSVLogger 경로 변경
+                if self.csv_logger is not None:
+                    self.csv_logger.reconfigure(normalized_path)
+                else:
+                    self.csv_logger = CSVLogger(base_path=normalized_path)
 
-                # 모든 검증 통과 후 실제 적용
                 self.save_path = normalized_path
-                self.file_manager = temp_file_manager
-                self.csv_logger = temp_csv_logger
+                self._save_path_obj = selected_path_obj
+                # 폴더 존재/쓰기 가능 확인 캐시 무효화
+                self._save_path_checked_at = 0.0
+                self._save_writable_checked_at = 0.0
+                self._save_blocked_periods.clear()
 
                 # Config에 저장
-                self.config_manager.set('save_path', normalized_path)
+                self._config_set_lazy('save_path', normalized_path)
 
                 messagebox.showinfo(
                     "경로 변경 완료",
                     f"저장 경로가 변경되었습니다.\n\n{normalized_path}"
                 )
-                logger.info(f"저장 경로 변경 완료: {normalized_path}")
+                logger.info("저장 경로 변경 완료: %s", normalized_path)
 
         except Exception as e:
-            logger.error(f"저장 경로 설정 실패: {e}")
+            logger.error("저장 경로 설정 실패: %s", e)
             messagebox.showerror("오류", f"저장 경로 설정 중 오류가 발생했습니다.\n{e}")
 
+    def _reconfigure_file_manager(self, base_path: str) -> None:
+        """
+        FileManager의 저장 경로를 변경합니다 (없으면 새로 생성).
+
+        Args:
+            base_path: 새 기본 저장 경로
+
+        Raises:
+            FileSaveError: 새 경로에 폴더를 만들 수 없을 때 (권한/공간 부족 예외 포함)
+        """
+        if self.file_manager is not None:
+            self.file_manager.reconfigure(base_path)
+            return
+
+        file_manager = FileManager(base_path=base_path)
+        file_manager.ensure_folder_exists()
+        self.file_manager = file_manager
+
     def _on_open_save_folder(self) -> None:
         """
         저장 폴더 열기 버튼 클릭 핸들러.
@@ -1256,28 +1866,63 @@ class MainWindow:
         탐색기로 저장 폴더를 엽니다.
         """
         try:
-            # Path 객체로 변환
-            save_path_obj = Path(self.save_path)
-
-            # 폴더 존재 확인
-            if not save_path_obj.exists():
+            # 폴더 존재 확인 (연속 클릭 시 캐시된 결과 사용)
+            if not self._save_path_ok():
                 messagebox.showerror(
                     "오류",
                     f"저장 폴더가 존재하지 않습니다.\n\n{self.save_path}"
                 )
-                logger.warning(f"저장 폴더가 존재하지 않음: {self.save_path}")
+                logger.warning("저장 폴더가 존재하지 않음: %s", self.save_path)
                 return
 
-            # Windows 탐색기로 폴더 열기 (os.startfile은 Windows 전용)
-            os.startfile(str(save_path_obj))
-            logger.info(f"저장 폴더 열기: {self.save_path}")
+            # 파일 탐색기로 폴더 열기 (완료를 기다리지 않고 바로 반환)
+            subprocess.Popen([_OPEN_FOLDER_COMMAND, str(self._save_path_obj)])
+            logger.info("저장 폴더 열기: %s", self.save_path)
 
         except Exception as e:
-            logger.error(f"저장 폴더 열기 실패: {e}")
+            logger.error("저장 폴더 열기 실패: %s", e)
             messagebox.showerror("오류", f"저장 폴더 열기 중 오류가 발생했습니다.\n{e}")
 
     # ==================== Private 메서드 (유틸리티) ====================
 
+    def _save_target_ok(self) -> bool:
+        """
+        캡처 이미지를 저장할 수 있는 상태인지 확인합니다 (UI 스레드).
+
+        FileManager가 없거나, 저장 폴더가 있지만 쓰기 권한이 없으면 False입니다.
+        (폴더가 없으면 저장 시 FileManager가 만들므로 True)
+        결과를 _SAVE_PATH_CHECK_TTL초 동안 유지하며, 저장 경로 변경 시 캐시가 무효화됩니다.
+
+        Returns:
+            bool: 저장 가능 여부
+        """
+        if self.file_manager is None:
+            return False
+
+        now = time.monotonic()
+        if now - self._save_writable_checked_at >= self._SAVE_PATH_CHECK_TTL:
+            path = self.save_path
+            self._save_writable = not os.path.isdir(path) or os.access(path, os.W_OK)
+            self._save_writable_checked_at = now
+        return self._save_writable
+
+    def _save_path_ok(self) -> bool:
+        """
+        저장 폴더가 존재하는지 확인합니다.
+
+        결과를 _SAVE_PATH_CHECK_TTL초 동안 유지하여 연속 클릭 시
+        파일 시스템 조회를 반복하지 않습니다. 저장 경로 변경 시 캐시가 무효화됩니다.
+
+        Returns:
+            bool: 저장 폴더 존재 여부
+        """
+        now = time.monotonic()
+        if now - self._save_path_checked_at >= self._SAVE_PATH_CHECK_TTL:
+            # 문자열 경로로 바로 stat (Path 메서드 호출 경유 없이)
+            self._save_path_exists = os.path.isdir(self.save_path)
+            self._save_path_checked_at = now
+        return self._save_path_exists
+
     def _format_status_with_emoji(self, status: str) -> str:
         """
         상태 문자열에 이모지를 자동으로 추가합니다.
@@ -1315,86 +1960,573 @@ class MainWindow:
         else:
             return status
 
+    def _get_status_code(self, status: str) -> int:
+        """
+        상태 문자열에 해당하는 상태 코드를 반환합니다.
+
+        Args:
+            status: 상태 문자열 (이모지 포함 여부 무관)
+
+        Returns:
+            int: 상태 코드 (STATUS_*), 알 수 없는 문자열이면 STATUS_UNKNOWN
+
+        Example:
+            >>> self._get_status_code("완료 (09:32)")
+            2
+        """
+        for keyword, code in _STATUS_KEYWORDS:
+            if keyword in status:
+                return code
+        return STATUS_UNKNOWN
+
     # ==================== Private 메서드 (캡처 프로세스) ====================
 
-    def _on_capture_trigger(self, period: int) -> None:
+    def _check_features_ready(self, period_name: str) -> bool:
+        """
+        Features 초기화(모델 로딩)가 끝났는지 확인합니다.
+
+        끝나지 않았으면 상태 표시줄에 안내하고 False를 반환합니다.
+
+        Args:
+            period_name: 교시명 (로그용)
+
+        Returns:
+            bool: 초기화 완료 여부
+        """
+        if self._features_ready:
+            return True
+
+        logger.info("%s 요청 무시: 모델 로딩 중", period_name)
+        self.init_status_var.set("⏳ 상태: 모델 로딩 중... (완료 후 다시 시도해주세요)")
+        return False
+
+    def _on_capture_trigger(self, period: int, is_within_window: Optional[bool] = None) -> None:
         """
-        교시별 캡처 프로세스 실행 (Scheduler 콜백).
+        교시별 캡처 프로세스 시작 (Scheduler 콜백, UI 스레드).
+
+        화면 캡처와 얼굴 감지(CPU 모드 2-3초)가 GUI를 멈추지 않도록
+        작업 스레드에서 실행합니다. 같은 교시의 캡처가 진행 중이면
+        새로 시작하지 않습니다.
 
         Args:
             period: 교시 번호 (1~8: 교시, 0: 퇴실)
+            is_within_window: 캡처 시간대 내 여부 (None이면 여기서 한 번 확인)
 
         Flow:
             1. 화면 캡처 (ScreenCapture)
             2. 얼굴 감지 (FaceDetector)
             3. 조건 비교 (모드별: 정확/유연)
             4. 성공 시: 파일 저장 → 로그 기록 → UI 업데이트 → 알림
-            5. 실패 시: 메모리 해제 → 실패 로그 기록
+            5. 실패 시: 실패 로그 기록 (프레임 버퍼는 다음 캡처에서 재사용)
         """
         # 교시명 생성
-        period_name = f"{period}교시" if period > 0 else "퇴실"
-        logger.info(f"===== {period_name} 캡처 프로세스 시작 =====")
+        period_name = _PERIOD_NAMES[period]
+
+        if self._shutting_down:
+            return
+
+        if period in self._captures_inflight:
+            logger.debug("%s 캡처가 이미 진행 중이어서 건너뜁니다.", period_name)
+            return
+
+        # 저장할 수 없는 상태면 캡처/얼굴 감지를 하지 않음 (Scheduler가 10초 후 다시 호출)
+        # 로그/알림은 교시마다 한 번만 (저장 경로를 바꾸거나 다시 쓸 수 있게 되면 초기화)
+        if not self._save_target_ok():
+            if period not in self._save_blocked_periods:
+                self._save_blocked_periods.add(period)
+                self._report_save_target_error(period_name)
+            return
+        self._save_blocked_periods.discard(period)
+
+        logger.info("===== %s 캡처 프로세스 시작 =====", period_name)
+
+        # 시간대 확인 (Scheduler는 UI 스레드에서만 조회, 결과를 작업 스레드로 전달)
+        if is_within_window is None:
+            is_within_window = self.scheduler.is_in_capture_window(period)
 
         # UI 상태: "감지중"으로 변경
-        self.update_period_status(period, "감지중")
-        self.root.update_idletasks()  # UI 강제 업데이트 (CPU 작업 전 반영)
+        self.update_period_status(period, self._ST_DETECTING)
+
+        # 작업 스레드 풀에 제출 (결과는 UI 큐로 전달, 종료 시까지 재시도 버튼 비활성화)
+        self._captures_inflight.add(period)
+        self._set_retry_enabled(period, False)
+        with self._period_generation_lock:
+            generation = self._period_generation.get(period, 0)
+        self._capture_pool.submit(self._capture_worker, period, period_name, is_within_window, generation)
+        self._start_ui_queue_polling()
+
+    def _report_save_target_error(self, period_name: str) -> None:
+        """
+        저장 경로를 사용할 수 없어 캡처하지 않았음을 기록하고 알립니다 (UI 스레드).
+
+        Args:
+            period_name: 교시명
+        """
+        logger.warning("%s 저장 경로를 사용할 수 없어 캡처를 건너뜁니다: %s", period_name, self.save_path)
+        self._enqueue_log(period_name, "저장 실패", 0, self._threshold, "", "저장 경로 사용 불가")
+        self.show_alert(
+            "저장 경로 오류",
+            f"{period_name} 저장 경로를 사용할 수 없어 캡처하지 않았습니다.\n\n"
+            "저장 경로를 확인하거나 변경해주세요.",
+            "error"
+        )
+
+    def _capture_worker(
+        self,
+        period: int,
+        period_name: str,
+        is_within_window: bool,
+        generation: int = 0
+    ) -> None:
+        """
+        화면 캡처 → 얼굴 감지 → 결과 처리를 수행합니다 (캡처 작업 스레드).
 
-        # 화면 캡처
-        logger.info(f"{period_name} 화면 캡처 시작...")
+        Tk 위젯 변경(상태 표시, 알림창)은 모두 _call_in_ui()로
+        UI 스레드에 넘깁니다. 캡처 성공 시 파일 저장은 저장 작업 스레드
+        (_save_worker)로 넘겨, 저장하는 동안 다음 캡처/감지가 진행될 수 있게 합니다.
+
+        Args:
+            period: 교시 번호
+            period_name: 교시명
+            is_within_window: 캡처 시간대 내 여부 (파일명 결정용)
+            generation: 제출 시점의 교시 세대 번호 (결과 반영 여부 판단용)
+        """
+        handed_off = False
         try:
-            image = self.capture.capture()
-            logger.info(f"{period_name} 화면 캡처 완료 (크기: {image.shape})")
+            # 종료 중이면 대기열에 남아 있던 캡처는 시작하지 않음
+            if self._shutting_down:
+                logger.info("%s 종료 중이어서 캡처를 시작하지 않습니다.", period_name)
+                return
+
+            # mss 인스턴스, 감지 모델, 프레임 크기는 단일 캡처 작업 스레드만 사용 (잠금 불필요)
+            image = self._capture_image(period_name)
+            if image is None:
+                return
+
+            detected_count = self._detect_faces(period_name, image)
+            if detected_count is None:
+                self._release_buffer(image)
+                return
+
+            # 기준 인원 (학생 수/모드 변경 시 미리 계산된 값)
+            threshold = self._threshold
+
+            # 조건 확인
+            is_success, mode_note = self._check_capture_condition(detected_count, threshold)
+
+            # 성공 시 이미지 버퍼는 저장 단계가 사용 후 반납
+            if is_success:
+                try:
+                    self._save_pool.submit(
+                        self._save_worker,
+                        period, period_name, image, detected_count, threshold, mode_note, is_within_window,
+                        generation
+                    )
+                    handed_off = True
+                except RuntimeError:
+                    # 종료 대기 시간을 넘겨 저장 작업 풀이 이미 닫힌 경우
+                    logger.warning("%s 저장 작업 풀이 종료되어 저장하지 않습니다.", period_name)
+                    self._release_buffer(image)
+            else:
+                self._release_buffer(image)
+                self._process_capture_failure(
+                    period, period_name, detected_count, threshold, mode_note, generation
+                )
+        except Exception as e:
+            logger.error("%s 캡처 프로세스 오류: %s", period_name, e, exc_info=True)
+        finally:
+            # 저장 단계로 넘긴 경우 _save_worker()가 종료 처리
+            if not handed_off:
+                self._call_in_ui(self._finish_capture, period)
+
+    def _save_worker(
+        self,
+        period: int,
+        period_name: str,
+        image,
+        detected_count: int,
+        threshold: int,
+        mode_note: str,
+        is_within_window: bool,
+        generation: int = 0
+    ) -> None:
+        """
+        캡처 성공 이미지를 저장하고 종료 처리합니다 (저장 작업 스레드).
+
+        Args:
+            period: 교시 번호
+            period_name: 교시명
+            image: 캡처된 이미지 (저장 후 버퍼 풀에 반납)
+            detected_count: 감지된 인원
+            threshold: 기준 인원
+            mode_note: 모드 설명
+            is_within_window: 캡처 시간대 내 여부
+            generation: 제출 시점의 교시 세대 번호
+        """
+        try:
+            # 제출 후 건너뛰기/초기화된 교시는 파일 저장과 성공 로그를 남기지 않음
+            if self._is_stale_capture(period, generation):
+                logger.info("%s 이전 캡처 결과 저장 생략 (제출 후 건너뛰기/초기화됨)", period_name)
+                return
+
+            self._process_capture_success(
+                period, period_name, image, detected_count, threshold, mode_note, is_within_window,
+                generation
+            )
+        finally:
+            self._release_buffer(image)
+            self._call_in_ui(self._finish_capture, period)
+
+    def _capture_image(self, period_name: str):
+        """
+        화면을 캡처합니다 (작업 스레드).
+
+        Args:
+            period_name: 교시명
+
+        Returns:
+            Optional[np.ndarray]: 캡처 이미지, 실패 시 None (로그/알림 처리 완료)
+        """
+        logger.info("%s 화면 캡처 시작...", period_name)
+        # 풀에서 꺼낸 버퍼에 바로 기록 (첫 캡처 또는 크기가 바뀐 경우 새 배열을 받음)
+        buf = self._acquire_buffer(self._frame_shape)
+        try:
+            image = self._get_capture().capture(out=buf)
+            self._frame_shape = image.shape
+            logger.info("%s 화면 캡처 완료 (크기: %s)", period_name, image.shape)
+            return image
         except InvalidMonitorError as e:
-            logger.error(f"{period_name} 유효하지 않은 모니터 ID: {e}", exc_info=True)
-            self.csv_logger.log_event(
-                period_name, "캡처 실패", 0, self.student_count + 1, "", "유효하지 않은 모니터"
+            logger.error("%s 유효하지 않은 모니터 ID: %s", period_name, e, exc_info=True)
+            self._enqueue_log(
+                period_name, "캡처 실패", 0, self._threshold, "", "유효하지 않은 모니터"
             )
-            self.show_alert(
+            self._call_in_ui(
+                self.show_alert,
                 "모니터 오류",
                 f"{period_name} 선택한 모니터를 찾을 수 없습니다.\n\n"
                 "모니터 연결을 확인하거나 상단에서 모니터를 다시 선택해주세요.",
                 "error"
             )
-            return
         except RuntimeError as e:
-            logger.error(f"{period_name} 화면 캡처 실패: {e}")
-            self.csv_logger.log_event(period_name, "캡처 실패", 0, self.student_count + 1, "", str(e))
-            self.show_alert("캡처 실패", f"{period_name} 화면 캡처 중 오류 발생", "error")
+            logger.error("%s 화면 캡처 실패: %s", period_name, e)
+            self._enqueue_log(period_name, "캡처 실패", 0, self._threshold, "", str(e))
+            self._call_in_ui(self.show_alert, "캡처 실패", f"{period_name} 화면 캡처 중 오류 발생", "error")
+        except Exception as e:
+            logger.error("%s 예상치 못한 오류: %s", period_name, e)
+            self._enqueue_log(period_name, "캡처 실패", 0, self._threshold, "", str(e))
+            self._call_in_ui(self.show_alert, "오류", f"{period_name} 캡처 중 예상치 못한 오류", "error")
+
+        if buf is not None:
+            self._release_buffer(buf)
+        return None
+
+    def _get_capture(self) -> ScreenCapture:
+        """
+        현재 모니터의 ScreenCapture를 반환합니다 (캡처 작업 스레드 전용).
+
+        mss 핸들은 만든 스레드에서만 사용할 수 있으므로 생성, 사용, 해제를
+        모두 캡처 작업 스레드에서 합니다. 모니터가 바뀌었거나 아직 없으면
+        기존 인스턴스를 해제하고 새로 만듭니다.
+
+        Returns:
+            ScreenCapture: 화면 캡처 인스턴스
+
+        Raises:
+            ScreenCaptureError: mss 인스턴스 생성 실패 시
+        """
+        capture = self.capture
+        if capture is not None and capture.monitor_id == self.monitor_id:
+            return capture
+
+        if capture is not None:
+            self.capture = None
+            capture.close()
+            logger.info("ScreenCapture 재생성: 모니터 %s → 모니터 %s", capture.monitor_id, self.monitor_id)
+
+        capture = ScreenCapture(monitor_id=self.monitor_id)
+        self.capture = capture
+        return capture
+
+    def _close_capture(self) -> None:
+        """
+        ScreenCapture(mss 핸들)를 해제합니다 (캡처 작업 스레드 전용, 종료 시).
+        """
+        capture = self.capture
+        if capture is None:
             return
+
+        logger.info("ScreenCapture 리소스 해제")
+        self.capture = None
+        try:
+            capture.close()
         except Exception as e:
-            logger.error(f"{period_name} 예상치 못한 오류: {e}")
-            self.csv_logger.log_event(period_name, "캡처 실패", 0, self.student_count + 1, "", str(e))
-            self.show_alert("오류", f"{period_name} 캡처 중 예상치 못한 오류", "error")
+            logger.error("ScreenCapture 정리 실패: %s", e, exc_info=True)
+
+    def _acquire_buffer(self, shape: Optional[Tuple[int, ...]]) -> Optional[np.ndarray]:
+        """
+        버퍼 풀에서 캡처 이미지 버퍼를 꺼냅니다 (모든 작업 스레드에서 호출 가능).
+
+        Args:
+            shape: 필요한 버퍼 크기 (None이면 아직 캡처 크기를 모름)
+
+        Returns:
+            Optional[np.ndarray]: 재사용 버퍼 (풀이 비었으면 새로 생성), shape가 None이면 None
+        """
+        if shape is None:
+            return None
+
+        with self._image_pool_lock:
+            buffers = self._image_pool.get(shape)
+            if buffers:
+                return buffers.pop()
+        return np.empty(shape, dtype=np.uint8)
+
+    def _release_buffer(self, buf: np.ndarray) -> None:
+        """
+        다 쓴 캡처 이미지 버퍼를 풀에 반납합니다 (모든 작업 스레드에서 호출 가능).
+
+        연속 배열이 아니거나 덮어쓸 수 없는 배열(외부 버퍼의 view 등)은 보관하지 않으며,
+        모니터 변경 등으로 크기가 바뀌면 이전 크기의 버퍼는 버립니다.
+
+        Args:
+            buf: 반납할 이미지 버퍼
+        """
+        if not (buf.flags.c_contiguous and buf.flags.writeable):
             return
 
-        # 얼굴 감지
-        logger.info(f"{period_name} 얼굴 감지 시작... (CPU 모드는 2-3초 소요 가능)")
+        with self._image_pool_lock:
+            if buf.shape not in self._image_pool:
+                self._image_pool.clear()
+            buffers = self._image_pool.setdefault(buf.shape, [])
+            if len(buffers) < self._IMAGE_POOL_MAX and not any(b is buf for b in buffers):
+                buffers.append(buf)
+
+    def _detect_faces(self, period_name: str, image) -> Optional[int]:
+        """
+        캡처 이미지에서 얼굴을 감지합니다 (작업 스레드).
+
+        Args:
+            period_name: 교시명
+            image: 캡처 이미지
+
+        Returns:
+            Optional[int]: 감지된 인원, 실패 시 None (로그/알림 처리 완료)
+        """
+        logger.info("%s 얼굴 감지 시작... (CPU 모드는 2-3초 소요 가능)", period_name)
         try:
             detected_count = self.detector.detect(image)
-            logger.info(f"{period_name} 얼굴 감지 완료: {detected_count}명")
+            logger.info("%s 얼굴 감지 완료: %s명", period_name, detected_count)
+            return detected_count
         except ValueError as e:
-            logger.error(f"{period_name} 얼굴 감지 실패: {e}")
-            self.csv_logger.log_event(period_name, "감지 실패", 0, self.student_count + 1, "", str(e))
-            self.show_alert("감지 실패", f"{period_name} 얼굴 감지 중 오류 발생", "error")
-            del image
-            return
+            logger.error("%s 얼굴 감지 실패: %s", period_name, e)
+            self._enqueue_log(period_name, "감지 실패", 0, self._threshold, "", str(e))
+            self._call_in_ui(self.show_alert, "감지 실패", f"{period_name} 얼굴 감지 중 오류 발생", "error")
         except Exception as e:
-            logger.error(f"{period_name} 예상치 못한 오류: {e}")
-            self.csv_logger.log_event(period_name, "감지 실패", 0, self.student_count + 1, "", str(e))
-            self.show_alert("오류", f"{period_name} 감지 중 예상치 못한 오류", "error")
-            del image
+            logger.error("%s 예상치 못한 오류: %s", period_name, e)
+            self._enqueue_log(period_name, "감지 실패", 0, self._threshold, "", str(e))
+            self._call_in_ui(self.show_alert, "오류", f"{period_name} 감지 중 예상치 못한 오류", "error")
+        return None
+
+    def _finish_capture(self, period: int) -> None:
+        """
+        캡처 작업 종료를 기록하고 재시도 버튼을 다시 활성화합니다 (UI 스레드).
+
+        Args:
+            period: 교시 번호
+        """
+        self._captures_inflight.discard(period)
+        self._set_retry_enabled(period, True)
+
+    # ==================== Private 메서드 (CSV 로그 기록) ====================
+
+    def _enqueue_log(
+        self,
+        period: str,
+        status: str,
+        detected_count: int,
+        threshold_count: int,
+        filename: str = "",
+        note: str = ""
+    ) -> None:
+        """
+        CSV 로그 이벤트를 기록 대기열에 넣습니다 (모든 스레드에서 호출 가능).
+
+        이벤트 시각은 호출 시점으로 고정되며, 실제 파일 기록은
+        _log_writer_loop()가 여러 이벤트를 모아 한 번에 처리합니다.
+
+        Args:
+            period: 교시명
+            status: 상태
+            detected_count: 감지된 인원
+            threshold_count: 기준 인원
+            filename: 저장된 파일명 (선택사항)
+            note: 비고 (선택사항)
+        """
+        csv_logger = self.csv_logger
+        if csv_logger is None:
+            logger.warning("CSVLogger가 없어 로그를 기록하지 않습니다: %s - %s", period, status)
+            return
+        if self._log_closed:
+            logger.warning("CSV 로그 기록이 종료되어 기록하지 않습니다: %s - %s", period, status)
             return
 
-        # 기준 인원 계산
-        threshold = self.student_count + 1
+        event = (period, status, detected_count, threshold_count, filename, note, datetime.now())
+        self._log_queue.put((csv_logger, event))
 
-        # 조건 확인 및 처리
-        is_success, mode_note = self._check_capture_condition(detected_count, threshold)
+    def _log_writer_loop(self) -> None:
+        """
+        대기열의 로그 이벤트를 모아 일괄 기록합니다 (로그 작업 스레드).
 
-        if is_success:
-            self._process_capture_success(period, period_name, image, detected_count, threshold, mode_note)
-        else:
-            self._process_capture_failure(period, period_name, image, detected_count, threshold, mode_note)
+        첫 이벤트 이후 _LOG_FLUSH_INTERVAL 동안 또는 _LOG_BATCH_SIZE개까지 모아 기록하고,
+        종료 신호(None)를 받으면 남은 이벤트를 기록한 뒤 끝납니다.
+        """
+        stopping = False
+        while not stopping:
+            item = self._log_queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self._LOG_FLUSH_INTERVAL
+            while len(batch) < self._LOG_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._log_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._write_log_batch(batch)
+
+    def _write_log_batch(self, batch: List[Tuple[CSVLogger, tuple]]) -> None:
+        """
+        모은 이벤트를 CSVLogger별로 묶어 기록합니다 (로그 작업 스레드).
+
+        CSVLogger가 새로 생성된 경우(초기화 실패 후 경로 변경 등)에도
+        이벤트 발생 당시의 로거에 기록합니다.
+
+        Args:
+            batch: (CSVLogger, 이벤트) 목록
+        """
+        groups: Dict[int, Tuple[CSVLogger, List[tuple]]] = {}
+        for csv_logger, event in batch:
+            groups.setdefault(id(csv_logger), (csv_logger, []))[1].append(event)
+
+        for csv_logger, events in groups.values():
+            try:
+                csv_logger.log_events(events)
+            except Exception as e:
+                logger.error("CSV 로그 일괄 기록 실패 (%s건): %s", len(events), e, exc_info=True)
+
+    # ==================== Private 메서드 (UI 스레드 전달) ====================
+
+    def _call_in_ui(self, func: Callable, *args) -> None:
+        """
+        작업 스레드에서 UI 스레드로 함수 호출을 넘깁니다.
+
+        Tk 위젯은 UI 스레드에서만 다룰 수 있으므로, 큐에 넣어 두면
+        _poll_ui_queue()가 UI 스레드에서 순서대로 실행합니다.
+
+        Args:
+            func: UI 스레드에서 실행할 함수
+            *args: 함수 인자
+        """
+        self._ui_queue.put((func, args))
+
+    def _start_ui_queue_polling(self) -> None:
+        """
+        UI 큐 확인을 시작합니다 (이미 진행 중이면 무시, UI 스레드).
+        """
+        if self._ui_poll_id is None:
+            self._ui_poll_id = self.root.after(50, self._poll_ui_queue)
+
+    def _poll_ui_queue(self) -> None:
+        """
+        작업 스레드가 넘긴 UI 호출을 실행합니다 (UI 스레드).
+
+        진행 중인 캡처가 있는 동안에만 50ms 간격으로 반복합니다.
+        한 번에 꺼낸 호출 중 같은 교시의 캡처 결과(_apply_capture_result)는
+        마지막 값만 반영하여 중간 상태를 다시 그리지 않습니다.
+        """
+        self._ui_poll_id = None
+        results: Dict[int, tuple] = {}
+        while True:
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if func == self._apply_capture_result:
+                results[args[0]] = args
+                continue
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error("UI 작업 실행 실패: %s", e, exc_info=True)
+
+        for args in results.values():
+            try:
+                self._apply_capture_result(*args)
+            except Exception as e:
+                logger.error("UI 작업 실행 실패: %s", e, exc_info=True)
+
+        if self._captures_inflight or not self._ui_queue.empty():
+            self._start_ui_queue_polling()
+
+    def _bump_period_generation(self, period: int) -> None:
+        """
+        교시 세대 번호를 올려 진행 중인 캡처 결과를 무효화합니다 (UI 스레드).
+
+        Args:
+            period: 교시 번호
+        """
+        with self._period_generation_lock:
+            self._period_generation[period] = self._period_generation.get(period, 0) + 1
+
+    def _is_stale_capture(self, period: int, generation: int) -> bool:
+        """
+        제출 후 건너뛰기/재시도로 교시 세대 번호가 바뀌었는지 확인합니다 (모든 스레드에서 호출 가능).
+
+        Args:
+            period: 교시 번호
+            generation: 캡처 제출 시점의 세대 번호
+
+        Returns:
+            bool: 세대 번호가 바뀌어 결과를 버려야 하면 True
+        """
+        with self._period_generation_lock:
+            return self._period_generation.get(period, 0) != generation
+
+    def _apply_capture_result(
+        self,
+        period: int,
+        generation: int,
+        status: str,
+        completed: bool = False
+    ) -> None:
+        """
+        작업 스레드의 캡처 결과를 교시 상태에 반영합니다 (UI 스레드).
+
+        제출 후 건너뛰기/재시도로 세대 번호가 바뀐 교시의 결과는 버려
+        "건너뛰기" 상태를 덮어쓰거나 완료 처리하지 않습니다.
+
+        Args:
+            period: 교시 번호
+            generation: 캡처 제출 시점의 세대 번호
+            status: 표시할 상태 문자열
+            completed: True면 Scheduler 완료 처리
+        """
+        if self._is_stale_capture(period, generation):
+            logger.info("%s 이전 캡처 결과 무시 (제출 후 건너뛰기/초기화됨)", _PERIOD_NAMES[period])
+            return
+
+        if completed:
+            self.scheduler.mark_completed(period)
+        self.update_period_status(period, status)
 
     def _check_capture_condition(self, detected_count: int, threshold: int) -> tuple[bool, str]:
         """
@@ -1407,20 +2539,13 @@ class MainWindow:
         Returns:
             tuple[bool, str]: (조건 만족 여부, 모드 설명)
         """
-        if self.mode == "exact":
+        # 모드 판별, 최소 감지 인원, 모드 설명은 _refresh_thresholds()에서 미리 계산
+        if self._exact_match:
             # 정확 모드: 감지 인원 == 기준 인원
-            is_success = (detected_count == threshold)
-            mode_note = "정확 모드"
-        elif self.mode == "flexible":
-            # 유연 모드: 감지 인원 >= 기준 인원 × 0.9
-            min_required = int(threshold * 0.9)
-            is_success = (detected_count >= min_required)
-            mode_note = f"유연 모드 (최소 {min_required}명)"
-        else:
-            logger.error(f"알 수 없는 캡처 모드: {self.mode}")
-            return False, "알 수 없는 모드"
+            return detected_count == threshold, self._mode_note
 
-        return is_success, mode_note
+        # 유연 모드: 감지 인원 >= 기준 인원 × 0.9
+        return detected_count >= self._min_required, self._mode_note
 
     def _process_capture_success(
         self,
@@ -1429,29 +2554,33 @@ class MainWindow:
         image,
         detected_count: int,
         threshold: int,
-        mode_note: str
+        mode_note: str,
+        is_within_window: bool,
+        generation: int = 0
     ) -> None:
         """
-        캡처 성공 시 처리 로직.
+        캡처 성공 시 처리 로직 (저장 작업 스레드).
+
+        파일 저장과 CSV 로그는 이 스레드에서, Scheduler 완료 처리와
+        UI 변경은 UI 스레드에서 수행합니다.
 
         Args:
             period: 교시 번호
             period_name: 교시명
-            image: 캡처된 이미지
+            image: 캡처된 이미지 (저장 단계 전용, 다음 캡처가 덮어쓰지 않음)
             detected_count: 감지된 인원
             threshold: 기준 인원
             mode_note: 모드 설명
+            is_within_window: 캡처 시간대 내 여부 (False면 _수정.png로 저장)
+            generation: 제출 시점의 교시 세대 번호
         """
         try:
-            # 1. 시간대 확인
-            is_within_window = self.scheduler.is_in_capture_window(period)
-
-            # 2. 파일 저장
+            # 1. 파일 저장 (시간대는 캡처 시작 시 확인한 값 사용)
             file_path = self.file_manager.save_image(image, period, is_within_window)
             file_name = Path(file_path).name
 
-            # 3. CSV 로그 기록
-            self.csv_logger.log_event(
+            # 2. CSV 로그 기록
+            self._enqueue_log(
                 period_name,
                 "캡처 성공",
                 detected_count,
@@ -1460,71 +2589,72 @@ class MainWindow:
                 mode_note
             )
 
-            # 4. Scheduler 완료 처리
-            self.scheduler.mark_completed(period)
-
-            # 5. UI 업데이트 (완료 시각 표시)
-            from datetime import datetime
+            # 3. Scheduler 완료 처리 + UI 업데이트 (완료 시각 표시, UI 스레드에서 반영)
             current_time = datetime.now().strftime("%H:%M")
-            self.update_period_status(period, f"완료 ({current_time})")
+            self._call_in_ui(
+                self._apply_capture_result, period, generation, f"완료 ({current_time})", True
+            )
 
-            logger.info(f"{period_name} 캡처 성공: {file_path}")
+            logger.info("%s 캡처 성공: %s", period_name, file_path)
 
         except InsufficientStorageError as e:
-            logger.error(f"{period_name} 디스크 공간 부족: {e}", exc_info=True)
-            self.csv_logger.log_event(
+            logger.error("%s 디스크 공간 부족: %s", period_name, e, exc_info=True)
+            self._enqueue_log(
                 period_name, "저장 실패", detected_count, threshold, "", "디스크 공간 부족"
             )
-            self.show_alert(
+            self._call_in_ui(
+                self.show_alert,
                 "디스크 공간 부족",
                 f"{period_name} 파일을 저장할 디스크 공간이 부족합니다.\n\n"
                 "불필요한 파일을 삭제한 후 재시도 버튼을 눌러주세요.",
                 "error"
             )
         except FilePermissionError as e:
-            logger.error(f"{period_name} 파일 저장 권한 없음: {e}", exc_info=True)
-            self.csv_logger.log_event(
+            logger.error("%s 파일 저장 권한 없음: %s", period_name, e, exc_info=True)
+            self._enqueue_log(
                 period_name, "저장 실패", detected_count, threshold, "", "권한 없음"
             )
-            self.show_alert(
+            self._call_in_ui(
+                self.show_alert,
                 "권한 오류",
                 f"{period_name} 파일 저장 권한이 없습니다.\n\n"
                 "저장 경로를 변경해주세요.",
                 "error"
             )
         except Exception as e:
-            logger.error(f"{period_name} 파일 저장 실패: {e}", exc_info=True)
-            self.csv_logger.log_event(period_name, "저장 실패", detected_count, threshold, "", str(e))
-            self.show_alert("저장 실패", f"{period_name} 파일 저장 중 오류가 발생했습니다.", "error")
-        finally:
-            # 메모리 해제
-            del image
+            logger.error("%s 파일 저장 실패: %s", period_name, e, exc_info=True)
+            self._enqueue_log(period_name, "저장 실패", detected_count, threshold, "", str(e))
+            self._call_in_ui(
+                self.show_alert, "저장 실패", f"{period_name} 파일 저장 중 오류가 발생했습니다.", "error"
+            )
 
     def _process_capture_failure(
         self,
         period: int,
         period_name: str,
-        image,
         detected_count: int,
         threshold: int,
-        mode_note: str
+        mode_note: str,
+        generation: int = 0
     ) -> None:
         """
-        캡처 실패 시 처리 로직.
+        캡처 실패 시 처리 로직 (작업 스레드).
 
         Args:
             period: 교시 번호
             period_name: 교시명
-            image: 캡처된 이미지
             detected_count: 감지된 인원
             threshold: 기준 인원
             mode_note: 모드 설명
+            generation: 제출 시점의 교시 세대 번호
         """
-        # 1. 메모리 해제
-        del image
+        # 제출 후 건너뛰기/초기화된 교시는 실패 로그/상태를 남기지 않음
+        if self._is_stale_capture(period, generation):
+            logger.info("%s 이전 캡처 결과 무시 (제출 후 건너뛰기/초기화됨)", period_name)
+            return
 
-        # 2. 실패 로그 기록
-        self.csv_logger.log_event(
+        # 1. 실패 로그 기록
+        self._enqueue_log(
             period_name,
             "감지 실패",
             detected_count,
@@ -1533,13 +2663,17 @@ class MainWindow:
             f"{mode_note} - 기준 미달"
         )
 
-        # 3. 로그만 기록 (UI는 "감지중" 유지, Scheduler가 10초 후 자동 재시도)
-        logger.info(f"{period_name} 감지 실패: {detected_count}/{threshold}명")
+        # 2. 로그만 기록 (UI는 "감지중" 유지)
+        # 자동 재시도는 Scheduler가 UI 스레드의 root.after() 루프에서 10초 간격으로 호출하므로
+        # 여기서 별도로 예약하지 않음 (건너뛰기 시 Scheduler.skip_period()로 함께 중단)
+        logger.info("%s 감지 실패: %s/%s명", period_name, detected_count, threshold)
 
-        # 4. 상태 메시지 업데이트
+        # 3. 상태 메시지 업데이트
         # 실패 정보를 상태에 표시: "❌ 실패 (N명/M명)"
-        self.update_period_status(period, f"실패 ({detected_count}/{threshold}명)")
-        logger.info(f"{period_name} 상태 업데이트: 실패 ({detected_count}/{threshold}명)")
+        self._call_in_ui(
+            self._apply_capture_result, period, generation, f"실패 ({detected_count}/{threshold}명)"
+        )
+        logger.debug("%s 상태 업데이트: 실패 (%d/%d명)", period_name, detected_count, threshold)
 
     # ==================== Alert ====================
 
@@ -1550,6 +2684,10 @@ class MainWindow:
         사용자 개입이 필요한 에러 상황에서만 알림창을 표시합니다.
         캡처 성공/실패는 교시별 상태 영역에 표시됩니다.
 
+        알림창은 이벤트 루프를 막지 않는 비모달 창으로 표시합니다.
+        알림창이 이미 열려 있으면 대기열에 넣었다가 닫힌 뒤 차례로 표시하고,
+        방금 닫힌 알림과 같은 내용은 _ALERT_DEDUP_SECONDS 동안 다시 띄우지 않습니다.
+
         Args:
             title: 알림창 제목
             message: 알림 메시지
@@ -1563,20 +2701,106 @@ class MainWindow:
             >>> # 권한 오류
             >>> window.show_alert("권한 오류", "파일 저장 권한이 없습니다.", "error")
         """
-        try:
-            # alert_type에 따라 적절한 messagebox 호출
-            if alert_type == "info":
-                messagebox.showinfo(title, message)
-            elif alert_type == "warning":
-                messagebox.showwarning(title, message)
-            elif alert_type == "error":
-                messagebox.showerror(title, message)
-            else:
-                # 잘못된 타입이면 기본값 사용
-                logger.warning(f"알 수 없는 alert_type: {alert_type}, info로 대체")
-                messagebox.showinfo(title, message)
+        # 방금 닫힌 알림과 같은 내용이면 다시 띄우지 않음
+        last = self._last_alert
+        if last is not None and last[:2] == (title, message) \
+                and time.monotonic() - last[2] < self._ALERT_DEDUP_SECONDS:
+            logger.info("중복 알림 생략: %s", title)
+            return
 
-            logger.info(f"알림 표시: [{alert_type}] {title} - {message}")
+        # 다른 알림창이 열려 있으면 닫힌 뒤 차례로 표시
+        if self._alert_open:
+            alert = (title, message, alert_type)
+            if alert not in self._pending_alerts:
+                self._pending_alerts.append(alert)
+            return
 
+        self._alert_open = True
+        try:
+            self._open_toast(title, message, alert_type)
         except Exception as e:
-            logger.error(f"알림창 표시 실패: {e}", exc_info=True)
+            logger.error("알림창 표시 실패: %s", e, exc_info=True)
+            self._on_alert_closed(title, message)
+
+    def _on_alert_closed(self, title: str, message: str) -> None:
+        """
+        알림창이 닫힌 뒤 중복 방지 정보를 기록하고 대기 중인 알림을 이어서 표시합니다.
+
+        Args:
+            title: 닫힌 알림창 제목
+            message: 닫힌 알림 메시지
+        """
+        self._alert_open = False
+        self._last_alert = (title, message, time.monotonic())
+        if self._pending_alerts:
+            self.root.after_idle(self._show_next_alert)
+
+    def _show_next_alert(self) -> None:
+        """
+        알림창이 열려 있는 동안 대기한 알림을 하나씩 표시합니다.
+
+        중복으로 생략된 알림은 건너뛰고 다음 알림을 이어서 처리합니다.
+        """
+        while self._pending_alerts and not self._alert_open:
+            self.show_alert(*self._pending_alerts.pop(0))
+
+    def _open_toast(self, title: str, message: str, alert_type: str) -> None:
+        """
+        메인 윈도우 위에 비모달 알림창을 표시하고 바로 반환합니다.
+
+        messagebox와 달리 Tk 이벤트 루프를 막지 않으므로 알림이 떠 있는 동안에도
+        스케줄러 재시도와 시계 갱신이 계속됩니다. 에러 알림은 [확인]을 누를 때까지
+        유지하고, 정보/경고 알림은 _TOAST_DURATION_MS 후 자동으로 닫습니다.
+
+        Args:
+            title: 알림창 제목
+            message: 알림 메시지
+            alert_type: 알림 타입 ("info", "warning", "error")
+        """
+        if alert_type not in self._TOAST_STYLES:
+            logger.warning("알 수 없는 alert_type: %s, info로 대체", alert_type)
+            alert_type = "info"
+
+        toast = tk.Toplevel(self.root)
+        toast.title(title)
+        toast.transient(self.root)
+        toast.resizable(False, False)
+        toast.geometry(f"+{self.root.winfo_rootx() + 40}+{self.root.winfo_rooty() + 40}")
+
+        close = partial(self._close_toast, toast, title, message)
+        toast.protocol("WM_DELETE_WINDOW", close)
+
+        frame = ttk.Frame(toast, padding="20 15 20 15")
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(
+            frame,
+            text=message,
+            style=self._TOAST_STYLES[alert_type],
+            wraplength=360,
+            justify=tk.LEFT
+        ).pack(anchor=tk.W, pady=(0, 15))
+        ttk.Button(frame, text="확인", command=close).pack(anchor=tk.E)
+
+        self._toast = toast
+        if alert_type != "error":
+            toast.after(self._TOAST_DURATION_MS, close)
+
+        logger.info("알림 표시: [%s] %s - %s", alert_type, title, message)
+
+    def _close_toast(self, toast: tk.Toplevel, title: str, message: str) -> None:
+        """
+        비모달 알림창을 닫습니다 ([확인], 창 닫기, 자동 닫힘 공통).
+
+        이미 닫힌 알림창에 대한 호출(자동 닫힘 예약 등)은 무시합니다.
+
+        Args:
+            toast: 닫을 알림창
+            title: 알림창 제목
+            message: 알림 메시지
+        """
+        if self._toast is not toast:
+            return
+
+        self._toast = None
+        toast.destroy()
+        self._on_alert_closed(title, message)
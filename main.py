@@ -65,6 +65,8 @@ def main() -> None:
         logger.info("초기 설정 다이얼로그 표시")
         dialog = InitDialog()
         config_manager = dialog.show()
+        # 메인 윈도우가 새 Tk 루트를 만들기 전에 다이얼로그 윈도우 파괴
+        dialog.close()
 
         # 사용자가 취소를 선택한 경우
         if config_manager is None:
@@ -217,6 +217,98 @@ def test_multiple_captures():
         return False
 
 
+class _FakeScreenShot:
+    """mss ScreenShot 대역 (BGRA raw 버퍼)."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        # 픽셀마다 B=10, G=20, R=30, A=255
+        self.raw = bytearray([10, 20, 30, 255] * (width * height))
+
+
+class _FakeMss:
+    """grab()이 고정 크기 BGRA 화면을 돌려주는 mss 대역."""
+
+    def __init__(self, width: int = 4, height: int = 2) -> None:
+        self.width = width
+        self.height = height
+        self.monitors = [
+            {'left': 0, 'top': 0, 'width': width, 'height': height},
+            {'left': 0, 'top': 0, 'width': width, 'height': height},
+        ]
+
+    def grab(self, monitor: dict) -> _FakeScreenShot:
+        return _FakeScreenShot(self.width, self.height)
+
+
+def _stub_capturer(width: int = 4, height: int = 2) -> ScreenCapture:
+    """실제 화면 없이 _sct만 대역으로 바꾼 ScreenCapture."""
+    capturer = ScreenCapture.__new__(ScreenCapture)
+    capturer.monitor_id = 1
+    capturer._sct = _FakeMss(width, height)
+    return capturer
+
+
+def test_capture_into_buffer_copies_into_out():
+    """크기가 맞는 out 버퍼에는 그대로 기록하고 같은 버퍼를 반환."""
+    capturer = _stub_capturer()
+    buffer = np.zeros((2, 4, 3), dtype=np.uint8)
+
+    image = capturer.capture(out=buffer)
+
+    assert image is buffer
+    assert (buffer == [30, 20, 10]).all()
+
+
+def test_capture_into_buffer_shape_mismatch():
+    """크기가 다른 out 버퍼는 건드리지 않고 새 연속 배열을 반환."""
+    capturer = _stub_capturer()
+    buffer = np.zeros((1, 1, 3), dtype=np.uint8)
+
+    image = capturer.capture(out=buffer)
+
+    assert image is not buffer
+    assert image.shape == (2, 4, 3)
+    assert image.flags['C_CONTIGUOUS']
+    assert image.flags['WRITEABLE']
+    assert (buffer == 0).all()
+
+
+def test_capture_bgra_to_rgb_channel_order():
+    """BGRA 화면이 RGB 순서로 변환되고 Alpha 채널이 제거됨."""
+    capturer = _stub_capturer()
+
+    image = capturer.capture()
+
+    assert image.shape == (2, 4, 3)
+    assert image.dtype == np.uint8
+    assert tuple(image[0, 0]) == (30, 20, 10)
+
+
+def test_capture_without_out_returns_own_buffer():
+    """out 없이 캡처해도 mss 버퍼와 분리된 연속 배열을 반환 (다음 캡처의 out으로 사용 가능)."""
+    capturer = _stub_capturer()
+
+    image = capturer.capture()
+
+    assert image.flags['C_CONTIGUOUS']
+    assert image.flags['WRITEABLE']
+    assert image.base is None
+    assert capturer.capture(out=image) is image
+
+
+def _run_assert_test(test_func) -> bool:
+    """assert 기반 테스트를 스크립트 실행용 성공/실패 값으로 변환."""
+    try:
+        test_func()
+        print(f"✅ {test_func.__doc__}")
+        return True
+    except AssertionError as e:
+        print(f"❌ {test_func.__doc__} {e}")
+        return False
+
+
 if __name__ == "__main__":
     print()
     print("=" * 60)
@@ -231,6 +323,10 @@ if __name__ == "__main__":
     results.append(test_capture())
     results.append(test_rgb_conversion())
     results.append(test_multiple_captures())
+    results.append(_run_assert_test(test_capture_into_buffer_copies_into_out))
+    results.append(_run_assert_test(test_capture_into_buffer_shape_mismatch))
+    results.append(_run_assert_test(test_capture_bgra_to_rgb_channel_order))
+    results.append(_run_assert_test(test_capture_without_out_returns_own_buffer))
 
     print("=" * 60)
     print("테스트 결과 요약")
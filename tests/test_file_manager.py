@@ -79,6 +79,36 @@ class TestFolderCreation:
             assert expected_folder.exists()
 
 
+class TestReconfigure:
+    """reconfigure() 메서드 테스트"""
+
+    def test_reconfigure_changes_base_path(self):
+        """경로 변경 후 새 경로에 날짜 폴더가 생성되는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fm = FileManager(str(Path(tmpdir) / "old"))
+            new_path = Path(tmpdir) / "new"
+
+            fm.reconfigure(str(new_path))
+
+            assert fm.base_path == new_path
+            assert (new_path / fm.current_date).is_dir()
+
+    def test_reconfigure_keeps_old_path_on_failure(self):
+        """폴더 생성 실패 시 기존 경로가 유지되는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            old_path = Path(tmpdir) / "old"
+            fm = FileManager(str(old_path))
+
+            # 파일 아래에는 폴더를 만들 수 없음
+            blocker = Path(tmpdir) / "blocker"
+            blocker.write_text("")
+
+            with pytest.raises(Exception):
+                fm.reconfigure(str(blocker / "new"))
+
+            assert fm.base_path == old_path
+
+
 class TestFilePathGeneration:
     """파일 경로 생성 테스트"""
 
@@ -205,6 +205,62 @@ class TestLogEvent:
             os.chmod(temp_logger.log_path, 0o666)
 
 
+class TestLogEvents:
+    """log_events() 메서드 테스트"""
+
+    def test_log_events_writes_all_rows(self, temp_logger):
+        """여러 이벤트를 한 번에 순서대로 기록하는지 테스트"""
+        temp_logger.log_events([
+            ("1교시", "캡처 시작", 0, 22),
+            ("1교시", "캡처 성공", 20, 22, "251020_1교시.png", "유연 모드"),
+        ])
+
+        with open(temp_logger.log_path, 'r', encoding='utf-8-sig') as f:
+            rows = list(csv.reader(f))
+            # 헤더 + 2개 행
+            assert len(rows) == 3
+            assert rows[1][3] == "캡처 시작"
+            assert rows[1][6] == ""
+            assert rows[2][6] == "251020_1교시.png"
+            assert rows[2][7] == "유연 모드"
+
+    def test_log_events_uses_given_timestamp(self, temp_logger):
+        """이벤트에 지정한 시각이 기록되는지 테스트"""
+        timestamp = datetime(2025, 10, 20, 9, 35, 7)
+        temp_logger.log_events([("1교시", "캡처 성공", 20, 22, "", "", timestamp)])
+
+        with open(temp_logger.log_path, 'r', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            next(reader)  # 헤더 스킵
+            row = next(reader)
+            assert row[0] == "2025-10-20"
+            assert row[1] == "09:35:07"
+
+    def test_log_events_empty_does_nothing(self, temp_logger):
+        """빈 목록이면 로그 파일을 만들지 않는지 테스트"""
+        temp_logger.log_events([])
+
+        assert temp_logger.log_path is None
+
+
+class TestReconfigure:
+    """reconfigure() 메서드 테스트"""
+
+    def test_reconfigure_writes_to_new_path(self, temp_logger):
+        """경로 변경 후 새 경로에 로그 파일이 생성되는지 테스트"""
+        temp_logger.log_event("1교시", "캡처 성공", 20, 22)
+        old_log_path = temp_logger.log_path
+
+        new_base = temp_logger.base_path / "new"
+        temp_logger.reconfigure(str(new_base))
+        temp_logger.log_event("2교시", "캡처 성공", 21, 22)
+
+        assert temp_logger.base_path == new_base
+        assert temp_logger.log_path != old_log_path
+        assert temp_logger.log_path.parent.parent == new_base
+        assert temp_logger.log_path.exists()
+
+
 @pytest.mark.integration
 class TestIntegration:
     """통합 테스트"""
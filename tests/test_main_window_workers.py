@@ -0,0 +1,606 @@
+"""
+MainWindow 작업 스레드/알림 처리 테스트 스크립트.
+
+화면이 없어도 실행되도록 Tk 창을 만들지 않고, 테스트에 필요한
+속성만 채운 MainWindow 인스턴스로 캡처 스레드 처리와 알림창을 테스트합니다.
+"""
+
+# 표준 라이브러리
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 외부 라이브러리
+import numpy as np
+import pytest
+
+# 내부 모듈
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import gui.main_window as main_window_module
+from gui.main_window import MainWindow
+
+
+class FakeScreenCapture:
+    """
+    mss처럼 생성한 스레드에서만 캡처할 수 있는 ScreenCapture 대역.
+
+    mss 9.x(Windows)는 장치 컨텍스트를 threading.local()에 보관하므로
+    다른 스레드에서 grab()하면 AttributeError가 발생합니다.
+    """
+
+    instances = []
+
+    def __init__(self, monitor_id: int = 1) -> None:
+        self.monitor_id = monitor_id
+        self.owner = threading.current_thread()
+        self.closed_by = None
+        FakeScreenCapture.instances.append(self)
+
+    def capture(self, out=None):
+        if threading.current_thread() is not self.owner:
+            raise AttributeError("'_thread._local' object has no attribute 'srcdc'")
+        image = np.zeros((4, 6, 3), dtype=np.uint8)
+        if out is None or out.shape != image.shape:
+            return image
+        np.copyto(out, image)
+        return out
+
+    def get_monitor_info(self) -> dict:
+        return {'id': self.monitor_id, 'width': 6, 'height': 4, 'left': 0, 'top': 0}
+
+    def close(self) -> None:
+        self.closed_by = threading.current_thread()
+
+
+class FakeScheduler:
+    """교시 상태 변경만 기록하는 CaptureScheduler 대역"""
+
+    def __init__(self) -> None:
+        self.completed = []
+        self.skipped = []
+        self.reset = []
+
+    def mark_completed(self, period: int) -> None:
+        self.completed.append(period)
+
+    def skip_period(self, period: int) -> None:
+        self.skipped.append(period)
+
+    def reset_period(self, period: int) -> None:
+        self.reset.append(period)
+
+    def is_in_capture_window(self, period: int) -> bool:
+        return True
+
+
+class FakeFileManager:
+    """저장 요청을 기록하고 저장 경로만 돌려주는 FileManager 대역"""
+
+    def __init__(self) -> None:
+        self.saved = []
+
+    def save_image(self, image, period: int, is_within_window: bool) -> str:
+        self.saved.append(period)
+        return f"C:/IBM 비대면/{period}교시.png"
+
+
+@pytest.fixture
+def window(monkeypatch):
+    """Tk 없이 캡처 작업 스레드 관련 속성만 채운 MainWindow"""
+    FakeScreenCapture.instances = []
+    monkeypatch.setattr(main_window_module, "ScreenCapture", FakeScreenCapture)
+
+    win = MainWindow.__new__(MainWindow)
+    win.monitor_id = 1
+    win.capture = None
+    win._threshold = 0
+    win._capture_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture")
+    win._image_pool = {}
+    win._image_pool_lock = threading.Lock()
+    win._frame_shape = None
+    win._ui_queue = queue.Queue()
+    win._ui_poll_id = None
+    win._shutting_down = False
+    win._captures_inflight = set()
+    win._period_generation = {}
+    win._period_generation_lock = threading.Lock()
+    win._features_ready = True
+    win.csv_logger = None
+    win.scheduler = FakeScheduler()
+    win.file_manager = FakeFileManager()
+    # 교시 상태 표시 대신 변경 내역만 기록
+    win.statuses = []
+    win.update_period_status = lambda period, status: win.statuses.append((period, status))
+    yield win
+    win._capture_pool.shutdown(wait=True)
+
+
+class TestCaptureThreadAffinity:
+    """mss 핸들을 캡처 작업 스레드에서만 생성/사용하는지 테스트"""
+
+    def test_init_capture_creates_on_capture_thread(self, window):
+        """다른 스레드에서 초기화해도 인스턴스는 캡처 작업 스레드에서 생성"""
+        capture = window._init_capture()
+
+        assert window.capture is capture
+        assert capture.owner is not threading.current_thread()
+        assert capture.owner.name.startswith("capture")
+
+    def test_capture_image_after_init_from_other_thread(self, window):
+        """초기화 스레드와 다른 스레드에서 요청해도 캡처 성공"""
+        init_thread = threading.Thread(target=window._init_capture)
+        init_thread.start()
+        init_thread.join()
+
+        image = window._capture_pool.submit(window._capture_image, "1교시").result()
+
+        assert image is not None
+        assert image.shape == (4, 6, 3)
+        assert len(FakeScreenCapture.instances) == 1
+
+    def test_monitor_change_rebuilds_on_capture_thread(self, window):
+        """모니터 변경 후 다음 캡처에서 캡처 작업 스레드가 재생성/해제"""
+        window._init_capture()
+        old_capture = window.capture
+
+        window.monitor_id = 2
+        image = window._capture_pool.submit(window._capture_image, "1교시").result()
+
+        assert image is not None
+        assert window.capture is not old_capture
+        assert window.capture.monitor_id == 2
+        assert window.capture.owner is old_capture.owner
+        assert old_capture.closed_by is old_capture.owner
+
+
+class TestStaleCaptureResults:
+    """제출 후 건너뛰기/초기화된 교시의 캡처 결과를 버리는지 테스트"""
+
+    @pytest.fixture
+    def logs(self, window):
+        """기록 대기열에 넣은 CSV 로그 (교시명, 상태)"""
+        recorded = []
+
+        def record(period, status, *args, **kwargs):
+            recorded.append((period, status))
+
+        window._enqueue_log = record
+        return recorded
+
+    @staticmethod
+    def _image():
+        return np.zeros((4, 6, 3), dtype=np.uint8)
+
+    def test_result_applied_when_period_unchanged(self, window, logs):
+        """세대 번호가 그대로면 저장/로그/완료 처리/상태 반영"""
+        generation = window._period_generation.get(1, 0)
+        window._save_worker(1, "1교시", self._image(), 5, 5, "정확", True, generation)
+        window._poll_ui_queue()
+
+        assert window.file_manager.saved == [1]
+        assert logs == [("1교시", "캡처 성공")]
+        assert window.scheduler.completed == [1]
+        assert len(window.statuses) == 1
+        assert window.statuses[0][1].startswith("완료")
+
+    def test_success_dropped_after_skip(self, window, logs):
+        """저장 전에 건너뛰기하면 파일 저장/성공 로그/완료 처리 안 함"""
+        generation = window._period_generation.get(1, 0)
+        window.on_skip_button(1)
+        image = self._image()
+        window._save_worker(1, "1교시", image, 5, 5, "정확", True, generation)
+        window._poll_ui_queue()
+
+        assert window.file_manager.saved == []
+        assert logs == [("1교시", "건너뛰기")]
+        assert window.scheduler.completed == []
+        assert window.statuses == [(1, MainWindow._ST_SKIPPED)]
+        # 저장하지 않은 버퍼도 풀에 반납
+        assert window._acquire_buffer(image.shape) is image
+
+    def test_status_dropped_when_skipped_after_save(self, window, logs):
+        """저장 후 UI 반영 전에 건너뛰기하면 건너뛰기 상태 유지"""
+        generation = window._period_generation.get(1, 0)
+        window._save_worker(1, "1교시", self._image(), 5, 5, "정확", True, generation)
+        window.on_skip_button(1)
+        window._poll_ui_queue()
+
+        assert window.scheduler.completed == []
+        assert window.statuses == [(1, MainWindow._ST_SKIPPED)]
+
+    def test_failure_dropped_after_skip(self, window, logs):
+        """건너뛰기 후 도착한 실패 결과는 로그/상태를 남기지 않음"""
+        generation = window._period_generation.get(2, 0)
+        window.on_skip_button(2)
+        window._process_capture_failure(2, "2교시", 3, 5, "정확", generation)
+        window._poll_ui_queue()
+
+        assert logs == [("2교시", "건너뛰기")]
+        assert window.statuses == [(2, MainWindow._ST_SKIPPED)]
+
+    def test_other_period_not_affected(self, window, logs):
+        """다른 교시 건너뛰기는 결과 반영에 영향 없음"""
+        generation = window._period_generation.get(1, 0)
+        window.on_skip_button(2)
+        window._process_capture_failure(1, "1교시", 3, 5, "정확", generation)
+        window._poll_ui_queue()
+
+        assert ("1교시", "감지 실패") in logs
+        assert (1, "실패 (3/5명)") in window.statuses
+
+
+@pytest.fixture
+def blocked_window(window):
+    """저장 경로를 사용할 수 없는 상태의 MainWindow (로그/알림 기록)"""
+    window.save_path = "C:/IBM 비대면"
+    window._save_blocked_periods = set()
+    window.save_ok = False
+    window._save_target_ok = lambda: window.save_ok
+    window.logs = []
+    window._enqueue_log = lambda *args, **kwargs: window.logs.append(args or kwargs)
+    window.alerts = []
+    window.show_alert = lambda title, message, alert_type="info": window.alerts.append(title)
+    window._set_retry_enabled = lambda period, enabled: None
+    window._start_ui_queue_polling = lambda: None
+    window.submitted = []
+    window._capture_worker = lambda *args: window.submitted.append(args)
+    return window
+
+
+class TestSaveTargetUnavailable:
+    """저장 경로를 사용할 수 없을 때 재시도/예약 캡처 처리 테스트"""
+
+    def test_retry_does_not_change_state(self, blocked_window):
+        """재시도는 상태/Scheduler/로그를 바꾸기 전에 중단"""
+        blocked_window.on_retry_button(1)
+
+        assert blocked_window.statuses == []
+        assert blocked_window.scheduler.reset == []
+        assert blocked_window._period_generation == {}
+        assert blocked_window.alerts == ["저장 경로 오류"]
+        assert len(blocked_window.logs) == 1
+
+    def test_scheduled_trigger_reports_once_per_period(self, blocked_window):
+        """10초마다 다시 호출되어도 교시마다 한 번만 기록/알림"""
+        for _ in range(3):
+            blocked_window._on_capture_trigger(1)
+        blocked_window._on_capture_trigger(2)
+
+        assert blocked_window.alerts == ["저장 경로 오류"] * 2
+        assert len(blocked_window.logs) == 2
+        assert blocked_window.submitted == []
+
+    def test_report_again_after_recovery(self, blocked_window):
+        """저장 가능해지면 캡처하고, 다시 막히면 다시 알림"""
+        blocked_window._on_capture_trigger(1)
+        blocked_window.save_ok = True
+        blocked_window._on_capture_trigger(1)
+        blocked_window._capture_pool.shutdown(wait=True)
+
+        assert len(blocked_window.submitted) == 1
+        assert 1 not in blocked_window._save_blocked_periods
+
+        blocked_window._captures_inflight.clear()
+        blocked_window.save_ok = False
+        blocked_window._on_capture_trigger(1)
+        assert blocked_window.alerts == ["저장 경로 오류"] * 2
+
+
+class TestImageBufferPool:
+    """캡처 이미지 버퍼 풀 재사용 테스트"""
+
+    SHAPE = (4, 6, 3)
+
+    def test_released_buffer_is_reused(self, window):
+        """반납한 버퍼를 다음 캡처에서 다시 사용"""
+        buf = window._acquire_buffer(self.SHAPE)
+        window._release_buffer(buf)
+
+        assert window._acquire_buffer(self.SHAPE) is buf
+
+    def test_unknown_shape_returns_none(self, window):
+        """첫 캡처(크기 모름)에는 버퍼를 주지 않음"""
+        assert window._acquire_buffer(None) is None
+
+    def test_first_capture_frame_is_pooled(self, window):
+        """버퍼 없이 받은 첫 캡처 이미지도 반납 후 다음 캡처에서 재사용"""
+        window._init_capture()
+        first = window._capture_pool.submit(window._capture_image, "1교시").result()
+        window._release_buffer(first)
+
+        second = window._capture_pool.submit(window._capture_image, "1교시").result()
+
+        assert second is first
+
+    def test_shape_change_drops_old_buffers(self, window):
+        """크기가 바뀌면 이전 크기의 버퍼는 버림"""
+        old = window._acquire_buffer(self.SHAPE)
+        window._release_buffer(old)
+        new = np.empty((8, 12, 3), dtype=np.uint8)
+        window._release_buffer(new)
+
+        assert list(window._image_pool) == [(8, 12, 3)]
+        assert window._acquire_buffer(self.SHAPE) is not old
+        assert window._acquire_buffer((8, 12, 3)) is new
+
+    def test_pool_size_and_readonly_view(self, window):
+        """최대 개수를 넘거나 덮어쓸 수 없는 배열은 보관하지 않음"""
+        buffers = [np.empty(self.SHAPE, dtype=np.uint8) for _ in range(MainWindow._IMAGE_POOL_MAX + 1)]
+        for buf in buffers:
+            window._release_buffer(buf)
+        window._release_buffer(buffers[0])
+
+        readonly = np.frombuffer(bytes(4 * 6 * 4), dtype=np.uint8).reshape(4, 6, 4)[:, :, 2::-1]
+        window._release_buffer(readonly)
+
+        pooled = window._image_pool[self.SHAPE]
+        assert len(pooled) == MainWindow._IMAGE_POOL_MAX
+        assert all(b is not readonly for b in pooled)
+
+    def test_buffer_held_by_save_worker_not_reused(self, window):
+        """저장 작업 스레드가 쓰는 동안에는 같은 버퍼를 다시 꺼내지 않음"""
+        image = window._acquire_buffer(self.SHAPE)
+        acquired_during_save = []
+
+        def fake_success(*args):
+            acquired_during_save.append(window._acquire_buffer(self.SHAPE))
+
+        window._process_capture_success = fake_success
+        save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture-save")
+        save_pool.submit(window._save_worker, 1, "1교시", image, 5, 5, "정확", True, 0).result()
+        save_pool.shutdown(wait=True)
+
+        assert acquired_during_save[0] is not image
+        assert window._acquire_buffer(self.SHAPE) is image
+
+
+class FakeToplevel:
+    """예약(after)과 닫힘(destroy)만 기록하는 알림창 대역"""
+
+    def __init__(self, master=None) -> None:
+        self.scheduled = []
+        self.destroyed = False
+        self.close = None
+
+    def title(self, text: str) -> None:
+        self.text = text
+
+    def transient(self, master) -> None:
+        pass
+
+    def resizable(self, width: bool, height: bool) -> None:
+        pass
+
+    def geometry(self, spec: str) -> None:
+        pass
+
+    def protocol(self, name: str, func) -> None:
+        self.close = func
+
+    def after(self, ms: int, func) -> None:
+        self.scheduled.append((ms, func))
+
+    def destroy(self) -> None:
+        self.destroyed = True
+
+
+class FakeWidget:
+    """배치(pack)만 하는 ttk 위젯 대역"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+    def pack(self, **kwargs) -> None:
+        pass
+
+
+class FakeRoot:
+    """after_idle() 예약을 직접 실행할 수 있는 Tk 루트 대역"""
+
+    def __init__(self) -> None:
+        self.idle = []
+
+    def winfo_rootx(self) -> int:
+        return 0
+
+    def winfo_rooty(self) -> int:
+        return 0
+
+    def after_idle(self, func) -> None:
+        self.idle.append(func)
+
+    def run_idle(self) -> None:
+        idle, self.idle = self.idle, []
+        for func in idle:
+            func()
+
+
+@pytest.fixture
+def alert_window(monkeypatch):
+    """Tk 창 대신 대역 알림창을 여는 MainWindow (열린 알림창 기록)"""
+    toasts = []
+
+    def make_toast(master=None):
+        toast = FakeToplevel(master)
+        toasts.append(toast)
+        return toast
+
+    monkeypatch.setattr(main_window_module.tk, "Toplevel", make_toast)
+    for name in ("Frame", "Label", "Button"):
+        monkeypatch.setattr(main_window_module.ttk, name, FakeWidget)
+
+    win = MainWindow.__new__(MainWindow)
+    win.root = FakeRoot()
+    win._last_alert = None
+    win._alert_open = False
+    win._pending_alerts = []
+    win._toast = None
+    win.toasts = toasts
+    return win
+
+
+class TestAlerts:
+    """비모달 알림창 중복 방지/대기열/자동 닫힘 테스트"""
+
+    def test_duplicate_within_dedup_window_skipped(self, alert_window):
+        """방금 닫힌 알림과 같은 내용은 _ALERT_DEDUP_SECONDS 동안 생략"""
+        alert_window.show_alert("저장 실패", "디스크 확인", "error")
+        alert_window.toasts[0].close()
+        alert_window.show_alert("저장 실패", "디스크 확인", "error")
+
+        assert len(alert_window.toasts) == 1
+        assert alert_window._alert_open is False
+
+    def test_duplicate_after_dedup_window_shown(self, alert_window):
+        """중복 방지 시간이 지나면 같은 알림을 다시 표시"""
+        alert_window.show_alert("저장 실패", "디스크 확인", "error")
+        alert_window.toasts[0].close()
+        title, message, closed_at = alert_window._last_alert
+        alert_window._last_alert = (title, message, closed_at - MainWindow._ALERT_DEDUP_SECONDS)
+        alert_window.show_alert("저장 실패", "디스크 확인", "error")
+
+        assert len(alert_window.toasts) == 2
+
+    def test_alerts_queued_while_open(self, alert_window):
+        """알림창이 열려 있으면 대기열에 넣고 닫힌 뒤 차례로 표시"""
+        alert_window.show_alert("A", "첫 번째", "error")
+        alert_window.show_alert("B", "두 번째", "error")
+        alert_window.show_alert("B", "두 번째", "error")
+
+        assert len(alert_window.toasts) == 1
+        assert alert_window._pending_alerts == [("B", "두 번째", "error")]
+
+        alert_window.toasts[0].close()
+        alert_window.root.run_idle()
+
+        assert len(alert_window.toasts) == 2
+        assert alert_window.toasts[1].text == "B"
+        assert alert_window._pending_alerts == []
+
+    def test_info_toast_auto_closes(self, alert_window):
+        """정보/경고 알림은 _TOAST_DURATION_MS 후 자동으로 닫힘"""
+        alert_window.show_alert("안내", "경로 변경", "info")
+        toast = alert_window.toasts[0]
+
+        assert [ms for ms, _ in toast.scheduled] == [MainWindow._TOAST_DURATION_MS]
+        assert MainWindow._TOAST_DURATION_MS == 3000
+
+        toast.scheduled[0][1]()
+        assert toast.destroyed
+        assert alert_window._alert_open is False
+
+    def test_error_toast_stays_until_dismissed(self, alert_window):
+        """에러 알림은 자동으로 닫히지 않고 [확인]을 누를 때까지 유지"""
+        alert_window.show_alert("권한 오류", "저장 권한 없음", "error")
+        toast = alert_window.toasts[0]
+
+        assert toast.scheduled == []
+        assert alert_window._alert_open is True
+
+        toast.close()
+        toast.close()  # 이미 닫힌 알림창에 대한 중복 호출은 무시
+        assert toast.destroyed
+        assert alert_window._alert_open is False
+
+
+class FakeCSVLogger:
+    """기록된 이벤트의 상태만 모으는 CSVLogger 대역"""
+
+    def __init__(self) -> None:
+        self.statuses = []
+
+    def log_events(self, events) -> None:
+        self.statuses.extend(event[1] for event in events)
+
+
+class TestCleanupOrder:
+    """종료 시 캡처 → 저장 → CSV 로그 순으로 마무리하는지 테스트"""
+
+    def test_running_capture_saved_and_logged(self, window):
+        """진행 중인 캡처는 끝까지 저장/기록하고, 대기 중인 캡처는 시작하지 않음"""
+        window._save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture-save")
+        window._exact_match = True
+        window._mode_note = "정확 모드"
+        window._threshold = 5
+        window.detector = None
+        window._on_student_count_entered = lambda: None
+        window._flush_config = lambda: None
+        window.scheduler.stop = lambda: None
+        window.csv_logger = FakeCSVLogger()
+        window._log_queue = queue.Queue()
+        window._log_closed = False
+        window._log_writer = threading.Thread(target=window._log_writer_loop, daemon=True)
+        window._log_writer.start()
+        window._init_capture()
+        capture = window.capture
+
+        started = threading.Event()
+        release = threading.Event()
+        captured = []
+
+        def slow_capture_image(period_name):
+            captured.append(period_name)
+            started.set()
+            release.wait(5)
+            return np.zeros((4, 6, 3), dtype=np.uint8)
+
+        window._capture_image = slow_capture_image
+        window._detect_faces = lambda period_name, image: 5
+        window._capture_pool.submit(window._capture_worker, 1, "1교시", True, 0)
+        window._capture_pool.submit(window._capture_worker, 2, "2교시", True, 0)
+        assert started.wait(5)
+
+        threading.Timer(0.2, release.set).start()
+        window.cleanup()
+
+        assert captured == ["1교시"]
+        assert window.csv_logger.statuses == ["캡처 성공"]
+        assert not window._log_writer.is_alive()
+        assert window.capture is None
+        assert capture.closed_by is capture.owner
+
+        # 종료 후의 캡처 요청과 로그는 무시
+        window._on_capture_trigger(3)
+        window._enqueue_log("3교시", "캡처 실패", 0, 5)
+        assert window._log_queue.empty()
+
+
+class TestMonitorListRefresh:
+    """모니터 콤보박스를 펼칠 때 모니터 목록 재조회 테스트"""
+
+    class FakeCombo:
+        def __init__(self) -> None:
+            self.values = None
+
+        def configure(self, values) -> None:
+            self.values = values
+
+    def test_refresh_invalidates_cache_and_updates_values(self, monkeypatch):
+        """캐시를 비우고 다시 조회하여 새 모니터를 콤보박스에 반영"""
+        calls = []
+        monkeypatch.setattr(main_window_module, "invalidate_monitor_cache", lambda: calls.append("invalidate"))
+        monkeypatch.setattr(main_window_module, "get_monitor_names", lambda: ["모니터 1", "모니터 2"])
+        win = MainWindow.__new__(MainWindow)
+        win._monitor_names = ["모니터 1"]
+        win._monitor_combo = self.FakeCombo()
+
+        win._refresh_monitor_names()
+
+        assert calls == ["invalidate"]
+        assert win._monitor_names == ["모니터 1", "모니터 2"]
+        assert win._monitor_combo.values == ["모니터 1", "모니터 2"]
+
+    def test_refresh_keeps_list_on_failure(self, monkeypatch):
+        """조회 실패(빈 목록)면 기존 목록 유지"""
+        monkeypatch.setattr(main_window_module, "invalidate_monitor_cache", lambda: None)
+        monkeypatch.setattr(main_window_module, "get_monitor_names", lambda: [])
+        win = MainWindow.__new__(MainWindow)
+        win._monitor_names = ["모니터 1"]
+        win._monitor_combo = self.FakeCombo()
+
+        win._refresh_monitor_names()
+
+        assert win._monitor_names == ["모니터 1"]
+        assert win._monitor_combo.values is None
@@ -12,8 +12,17 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# 표준 라이브러리
+from unittest.mock import patch
+
 # 내부 모듈
-from utils.monitor import get_monitors, get_monitor_count, get_monitor_names
+from utils.monitor import (
+    get_monitors,
+    get_monitor_count,
+    get_monitor_names,
+    get_screen_size,
+    invalidate_monitor_cache
+)
 
 
 def test_monitor_detection():
@@ -87,6 +96,67 @@ def test_monitor_detection():
     return True
 
 
+def test_monitor_cache():
+    """모니터 목록 캐시 테스트 (연속 조회 시 모니터를 한 번만 조회)."""
+    fake_monitors = [
+        {'id': 1, 'name': "모니터 1", 'width': 1920, 'height': 1080, 'left': 0, 'top': 0},
+        {'id': 2, 'name': "모니터 2", 'width': 1920, 'height': 1080, 'left': 1920, 'top': 0},
+    ]
+
+    invalidate_monitor_cache()
+    try:
+        with patch("utils.monitor.get_monitors", return_value=fake_monitors) as mock_get:
+            # 이름 + 개수 조회 → 실제 조회는 1회
+            assert get_monitor_names() == ["모니터 1", "모니터 2"]
+            assert get_monitor_count() == 2
+            assert mock_get.call_count == 1
+
+            # 캐시 초기화 후에는 다시 조회
+            invalidate_monitor_cache()
+            assert get_monitor_count() == 2
+            assert mock_get.call_count == 2
+
+        # 조회 실패(빈 리스트)는 캐시하지 않음
+        invalidate_monitor_cache()
+        with patch("utils.monitor.get_monitors", return_value=[]) as mock_get:
+            assert get_monitor_count() == 0
+            assert get_monitor_count() == 0
+            assert mock_get.call_count == 2
+    finally:
+        invalidate_monitor_cache()
+
+
+def test_screen_size_cache():
+    """화면 크기 캐시 테스트 (두 창이 같은 값을 쓰고, 캐시 초기화 시 재조회)."""
+
+    class FakeWidget:
+        def __init__(self, width, height):
+            self.width = width
+            self.height = height
+            self.calls = 0
+
+        def winfo_screenwidth(self):
+            self.calls += 1
+            return self.width
+
+        def winfo_screenheight(self):
+            return self.height
+
+    invalidate_monitor_cache()
+    try:
+        dialog = FakeWidget(1920, 1080)
+        root = FakeWidget(2560, 1440)
+
+        assert get_screen_size(dialog) == (1920, 1080)
+        assert get_screen_size(root) == (1920, 1080)
+        assert root.calls == 0
+
+        invalidate_monitor_cache()
+        assert get_screen_size(root) == (2560, 1440)
+    finally:
+        invalidate_monitor_cache()
+
+
 if __name__ == "__main__":
     try:
         success = test_monitor_detection()
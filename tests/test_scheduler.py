@@ -14,8 +14,12 @@ from datetime import datetime
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# 외부 라이브러리
+import pytest
+
 # 내부 모듈
 from features.scheduler import CaptureScheduler
+from features.exceptions import InvalidScheduleError
 
 
 def test_init():
@@ -116,6 +120,48 @@ def test_add_schedule():
         return False
 
 
+def _dummy_callback(period):
+    pass
+
+
+def test_add_schedules():
+    """스케줄 일괄 등록 테스트."""
+    scheduler = CaptureScheduler()
+
+    scheduler.add_schedules([
+        (1, "09:30", "09:45", _dummy_callback),
+        (2, "10:30", "10:45", _dummy_callback),
+        (0, "18:30", "18:32", _dummy_callback),
+    ])
+
+    assert [s["period"] for s in scheduler.schedules] == [1, 2, 0]
+
+
+def test_add_schedules_invalid_batch_unchanged():
+    """잘못된 스케줄이 하나라도 있으면 아무것도 등록되지 않음."""
+    scheduler = CaptureScheduler()
+    scheduler.add_schedules([(1, "09:30", "09:45", _dummy_callback)])
+    before = list(scheduler.schedules)
+
+    with pytest.raises(InvalidScheduleError):
+        scheduler.add_schedules([
+            (3, "11:30", "11:45", _dummy_callback),
+            (99, "25:00", "26:00", _dummy_callback),
+        ])
+
+    assert scheduler.schedules == before
+
+
+def _run_assert_test(test_func) -> bool:
+    """assert 기반 테스트를 스크립트 실행용 성공/실패 값으로 변환."""
+    try:
+        test_func()
+        return True
+    except AssertionError as e:
+        print(f"❌ {test_func.__doc__} {e}")
+        return False
+
+
 def test_is_in_capture_window():
     """캡처 시간대 확인 테스트."""
     print("=" * 60)
@@ -381,6 +427,8 @@ def main():
     # 테스트 실행
     results.append(("초기화", test_init()))
     results.append(("8교시+퇴실 스케줄 등록", test_add_schedule()))
+    results.append(("스케줄 일괄 등록", _run_assert_test(test_add_schedules)))
+    results.append(("잘못된 일괄 등록 시 미변경", _run_assert_test(test_add_schedules_invalid_batch_unchanged)))
     results.append(("시간대 확인", test_is_in_capture_window()))
     results.append(("건너뛰기", test_skip_period()))
     results.append(("완료 처리", test_mark_completed()))
@@ -7,14 +7,24 @@
 
 # 표준 라이브러리
 import logging
+import time
 
 # 외부 라이브러리
 import mss
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Tuple
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 모니터 목록 캐시 유효 시간 (초)
+MONITOR_CACHE_TTL = 60.0
+
+# 모니터 목록 캐시: (조회 시각(time.monotonic), 모니터 목록)
+_monitor_cache: Optional[Tuple[float, List[Dict]]] = None
+
+# 화면 크기 캐시: (너비, 높이) (창 중앙 배치용, 최초 조회 후 재사용)
+_screen_size_cache: Optional[Tuple[int, int]] = None
+
 
 def get_monitors() -> List[Dict]:
     """
@@ -70,7 +80,7 @@ def get_monitor_count() -> int:
         >>> print(f"모니터 {count}개 감지됨")
         모니터 2개 감지됨
     """
-    monitors = get_monitors()
+    monitors = _get_cached_monitors()
     return len(monitors)
 
 
@@ -88,5 +98,70 @@ def get_monitor_names() -> List[str]:
         >>> print(names)
         ['모니터 1', '모니터 2']
     """
+    monitors = _get_cached_monitors()
+    return [monitor['name'] for monitor in monitors]
+
+
+def get_screen_size(widget: Any) -> Tuple[int, int]:
+    """
+    주 화면 크기를 반환합니다 (최초 1회만 조회).
+
+    InitDialog와 MainWindow를 화면 중앙에 배치할 때 사용합니다.
+    프로세스가 DPI 인식을 선언하지 않으므로 winfo_screenwidth/height는
+    Windows HiDPI 환경에서도 GetSystemMetrics와 같은 (배율 적용된) 크기를
+    반환하며, Tk 창 좌표도 같은 단위입니다.
+
+    Args:
+        widget: winfo 조회에 사용할 Tk 위젯
+
+    Returns:
+        Tuple[int, int]: (화면 너비, 화면 높이)
+
+    Example:
+        >>> width, height = get_screen_size(root)
+        >>> print(width, height)
+        1920 1080
+    """
+    global _screen_size_cache
+    if _screen_size_cache is None:
+        _screen_size_cache = (widget.winfo_screenwidth(), widget.winfo_screenheight())
+    return _screen_size_cache
+
+
+def invalidate_monitor_cache() -> None:
+    """
+    모니터 목록과 화면 크기 캐시를 비웁니다.
+
+    모니터를 새로 연결/분리한 뒤 목록을 즉시 다시 조회해야 할 때 호출합니다.
+
+    Example:
+        >>> invalidate_monitor_cache()
+        >>> names = get_monitor_names()  # 모니터 목록 재조회
+    """
+    global _monitor_cache, _screen_size_cache
+    _monitor_cache = None
+    _screen_size_cache = None
+    logger.debug("모니터 목록 캐시 초기화")
+
+
+def _get_cached_monitors() -> List[Dict]:
+    """
+    캐시된 모니터 목록을 반환합니다 (Private).
+
+    get_monitor_count()와 get_monitor_names()가 연달아 호출되어도
+    MONITOR_CACHE_TTL 동안은 모니터를 한 번만 조회합니다.
+    조회 실패(빈 리스트)는 캐시하지 않습니다.
+
+    Returns:
+        List[Dict]: 모니터 정보 리스트 (get_monitors()와 동일한 형식)
+    """
+    global _monitor_cache
+
+    now = time.monotonic()
+    if _monitor_cache is not None and now - _monitor_cache[0] < MONITOR_CACHE_TTL:
+        return _monitor_cache[1]
+
     monitors = get_monitors()
-    return [monitor['name'] for monitor in monitors]
\ No newline at end of file
+    if monitors:
+        _monitor_cache = (now, monitors)
+    return monitors
\ No newline at end of file